@@ -0,0 +1 @@
+# pyright: reportUnusedImport=false
@@ -0,0 +1,40 @@
+from json import dump, load
+from pathlib import Path
+from typing import Dict, List
+
+Results = Dict[str, Dict[str, float]]
+
+# tail latencies and ops/s are reported but not gated: on shared machines they
+# move with background load far more than the median and allocations do.
+GATED_METRICS = ("p50_ms", "alloc_kib")
+
+
+def load_baseline(path: Path) -> Results:
+    with path.open() as file:
+        return load(file)
+
+
+def save_baseline(path: Path, results: Results) -> None:
+    with path.open("w") as file:
+        dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def find_regressions(
+    baseline: Results, results: Results, threshold: float
+) -> List[str]:
+    regressions: List[str] = []
+    for name, metrics in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric in GATED_METRICS:
+            if metric not in metrics or not expected.get(metric):
+                continue
+            change = metrics[metric] / expected[metric] - 1
+            if change > threshold:
+                regressions.append(
+                    f"{name}: {metric} {expected[metric]:.3f} -> "
+                    f"{metrics[metric]:.3f} (+{change:.0%})"
+                )
+    return regressions
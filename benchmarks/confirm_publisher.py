@@ -0,0 +1,42 @@
+import asyncio
+from time import perf_counter
+from argparse import ArgumentParser
+
+from infra.adapters import (
+    AsyncConfirmPublisher,
+    OutgoingMessage,
+    AsyncRabbitMQConnectionPool,
+)
+
+
+async def publish(max_in_flight: int, count: int) -> float:
+    connection_pool = AsyncRabbitMQConnectionPool()
+    publisher = AsyncConfirmPublisher(
+        connection_pool=connection_pool, max_in_flight=max_in_flight
+    )
+    messages = [
+        OutgoingMessage(routing_key="benchmark.confirm", body=b"{}")
+        for _ in range(count)
+    ]
+    try:
+        await publisher.publish("orders_benchmark", messages[:10])
+        start = perf_counter()
+        await publisher.publish("orders_benchmark", messages)
+        return count / (perf_counter() - start)
+    finally:
+        await connection_pool.close()
+
+
+def main():
+    parser = ArgumentParser(description="confirmed publishes per second")
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--window", type=int, default=256)
+    args = parser.parse_args()
+
+    for name, window in [("synchronous confirms", 1), ("pipelined", args.window)]:
+        rate = asyncio.run(publish(window, args.messages))
+        print(f"{name:<40} msgs_per_s={rate:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import tracemalloc
+from uuid import uuid4
+from decimal import Decimal
+from argparse import ArgumentParser
+from typing import List
+
+from domain.entities import Order, OrderItem
+from domain.enums import OrderStatus
+
+
+def build_order(items: int) -> Order:
+    order = Order.create(
+        customer_id=uuid4(),
+        shipping_address="Rua Teste, 123",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name=f"Produto {index}",
+                quantity=index + 1,
+                unit_price=Decimal("10.50"),
+            )
+            for index in range(items)
+        ],
+    )
+    order.change_status(OrderStatus.CANCELLED)
+    return order
+
+
+def bytes_per_order(items: int, orders: int) -> float:
+    """Bytes still allocated per order (entity, items and pending events)
+    once `orders` of them are alive at the same time."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        alive: List[Order] = [build_order(items) for _ in range(orders)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del alive
+    return (after - before) / orders
+
+
+def main():
+    parser = ArgumentParser(description="Memory held by Order entities")
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--items", type=int, nargs="+", default=[3, 500])
+    args = parser.parse_args()
+
+    for items in args.items:
+        orders = max(1, args.orders * 3 // max(items, 3))
+        print(f"{items:>4} items: {bytes_per_order(items, orders):>10.0f} bytes/order")
+
+
+if __name__ == "__main__":
+    main()
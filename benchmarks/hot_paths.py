@@ -0,0 +1,177 @@
+import sys
+from uuid import uuid4
+from decimal import Decimal
+from pathlib import Path
+from argparse import ArgumentParser
+from typing import Callable, Dict, Iterator
+from bson import CodecOptions, decode, encode
+from fastapi.testclient import TestClient
+
+from api.app import create_app
+from api.controllers import OrdersController
+from api.dependencies import get_orders_controller
+from domain.entities import Order, OrderItem
+from domain.enums import OrderStatus
+from infra.repositories import OrdersRepository
+from tests.fixtures.repositories.fake_order_repository import FakeOrderRepository
+from tests.fixtures.adapters.fake_publisher_adapter import FakePublisherAdapter
+from tests.fixtures.adapters.fake_transaction_adapter import fake_transaction_adapter
+
+from .baseline import Results, find_regressions, load_baseline, save_baseline
+from .stats import measure, print_report
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "hot_paths.json"
+
+ORDER_REQUEST = {
+    "customerId": str(uuid4()),
+    "shippingAddress": "Rua Teste, 123",
+    "items": [
+        {
+            "productId": str(uuid4()),
+            "productName": f"Produto {index}",
+            "quantity": index + 1,
+            "unityPrice": 10.5,
+        }
+        for index in range(3)
+    ],
+}
+
+
+def build_order() -> Order:
+    return Order.create(
+        customer_id=uuid4(),
+        shipping_address="Rua Teste, 123",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name=f"Produto {index}",
+                quantity=index + 1,
+                unit_price=Decimal("10.50"),
+            )
+            for index in range(3)
+        ],
+    )
+
+
+def build_client(repository: FakeOrderRepository) -> TestClient:
+    app = create_app()
+    app.dependency_overrides[get_orders_controller] = lambda: OrdersController(
+        order_repository=repository,
+        publisher=FakePublisherAdapter(),
+        transaction=fake_transaction_adapter,
+    )
+    return TestClient(app)
+
+
+def seeded_repository(size: int) -> FakeOrderRepository:
+    repository = FakeOrderRepository()
+    for _ in range(size):
+        repository.save(build_order())
+    return repository
+
+
+# domain calls take microseconds, so their samples average this many calls.
+DOMAIN_CALLS_PER_SAMPLE = 100
+
+
+def domain_benchmarks() -> Dict[str, Callable[[], object]]:
+    order = build_order()
+    # decode the document the way the client hands it back, with Binary UUIDs,
+    # Decimal128 prices and aware datetimes, not the legacy string layout.
+    document = decode(
+        encode(OrdersRepository.to_document(order)), CodecOptions(tz_aware=True)
+    )
+    event = order.pending_events[0]
+    batch = [build_order() for _ in range(100)]
+    return {
+        "Order.create": build_order,
+        "Order.to_dict": order.to_dict,
+        "OrdersRepository.from_dict": lambda: OrdersRepository.from_dict(document),
+        "DomainEvent.to_dict": event.to_dict,
+        "Order.validate_transition_to": lambda: order.validate_transition_to(
+            OrderStatus.PROCESSING
+        ),
+        "Order.validate_transitions[100]": lambda: Order.validate_transitions(
+            batch, OrderStatus.PROCESSING
+        ),
+    }
+
+
+def http_benchmarks(size: int) -> Dict[str, Callable[[], object]]:
+    read_repository = seeded_repository(1)
+    read_client = build_client(read_repository)
+    read_url = f"/orders/{read_repository.data[0].id}"
+
+    create_client = build_client(FakeOrderRepository())
+
+    # every PATCH needs an order still in CREATED, so each call consumes one.
+    update_repository = seeded_repository(size)
+    update_client = build_client(update_repository)
+    pending: Iterator[Order] = iter(list(update_repository.data))
+    update_body = {"newStatus": OrderStatus.PROCESSING.value}
+
+    return {
+        "GET /orders/{orderId}": lambda: read_client.get(read_url),
+        "POST /orders": lambda: create_client.post("/orders", json=ORDER_REQUEST),
+        "PATCH /orders/{orderId}": lambda: update_client.patch(
+            f"/orders/{next(pending).id}", json=update_body
+        ),
+    }
+
+
+def run(iterations: int, warmup: int, allocation_iterations: int) -> Results:
+    benchmarks = [
+        (name, func, DOMAIN_CALLS_PER_SAMPLE)
+        for name, func in domain_benchmarks().items()
+    ] + [
+        (name, func, 1)
+        for name, func in http_benchmarks(
+            warmup + iterations + allocation_iterations
+        ).items()
+    ]
+    results: Results = {}
+    for name, func, number in benchmarks:
+        results[name] = measure(
+            func,
+            iterations=iterations,
+            warmup=warmup,
+            allocation_iterations=allocation_iterations,
+            number=number,
+        )
+        print_report(name, results[name])
+    return results
+
+
+def main():
+    parser = ArgumentParser(description="Order API and domain hot paths")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--allocation-iterations", type=int, default=100)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args.iterations, args.warmup, args.allocation_iterations)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, run with --save-baseline")
+        return
+
+    regressions = find_regressions(
+        load_baseline(args.baseline), results, args.threshold
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"no regression above {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+from uuid import uuid4
+from argparse import ArgumentParser
+from pymongo import MongoClient
+
+from config import MONGO_HOST, MONGO_PORT, MONGO_USERNAME, MONGO_PASSWORD
+from infra.adapters import NoSqlAdapter, mongo_client_registry
+from infra.repositories import OrdersRepository
+
+from .stats import measure, print_report
+
+
+def find_with_new_client():
+    client = MongoClient(
+        host=MONGO_HOST,
+        port=int(MONGO_PORT),
+        username=MONGO_USERNAME,
+        password=MONGO_PASSWORD,
+        authSource="admin",
+    )
+    try:
+        OrdersRepository(adapter=NoSqlAdapter(client=client)).find_by_id(uuid4())
+    finally:
+        client.close()
+
+
+def find_with_pooled_client():
+    OrdersRepository(
+        adapter=NoSqlAdapter(client=mongo_client_registry.client)
+    ).find_by_id(uuid4())
+
+
+def main():
+    parser = ArgumentParser(description="GET /orders/{orderId} repository latency")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    print_report(
+        "before: MongoClient per request",
+        measure(find_with_new_client, iterations=args.iterations),
+    )
+    print_report(
+        "after: pooled MongoClient",
+        measure(find_with_pooled_client, iterations=args.iterations),
+    )
+    mongo_client_registry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict
+from bson import CodecOptions, decode, encode
+
+from infra.repositories import OrdersRepository
+
+from .serializers import build_order
+from .stats import measure, print_report
+
+# what the Mongo clients are configured with.
+CODEC_OPTIONS: CodecOptions[Dict[str, Any]] = CodecOptions(tz_aware=True)
+CALLS_PER_SAMPLE = 100
+
+
+def document_benchmarks(items: int) -> Dict[str, Callable[[], object]]:
+    order = build_order(items)
+    legacy = encode(order.to_dict())
+    native = encode(OrdersRepository.to_document(order))
+    # what the server returns for ORDERS_READ_PROJECTION.
+    document = OrdersRepository.to_document(order)
+    for item in document["items"]:
+        del item["subtotal"]
+    projected = encode(document)
+    summary = encode({key: value for key, value in document.items() if key != "items"})
+    print(
+        f"document size: legacy={len(legacy)} B  native={len(native)} B"
+        f"  summary={len(summary)} B"
+    )
+    return {
+        "decode legacy document": lambda: OrdersRepository.from_dict(
+            decode(legacy, CODEC_OPTIONS)
+        ),
+        "decode native document": lambda: OrdersRepository.from_dict(
+            decode(native, CODEC_OPTIONS)
+        ),
+        "decode native document, projected": lambda: OrdersRepository.from_dict(
+            decode(projected, CODEC_OPTIONS)
+        ),
+        "decode order summary": lambda: OrdersRepository.to_summary(
+            decode(summary, CODEC_OPTIONS)
+        ),
+    }
+
+
+def main():
+    parser = ArgumentParser(description="Legacy vs native BSON order documents")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--allocation-iterations", type=int, default=100)
+    parser.add_argument("--items", type=int, default=10)
+    args = parser.parse_args()
+
+    for name, func in document_benchmarks(args.items).items():
+        print_report(
+            name,
+            measure(
+                func,
+                iterations=args.iterations,
+                warmup=args.warmup,
+                allocation_iterations=args.allocation_iterations,
+                number=CALLS_PER_SAMPLE,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from json import dumps
+from uuid import uuid4
+from decimal import Decimal
+from argparse import ArgumentParser
+from typing import Callable, Dict
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from api.controllers.orders_mapper import to_order_response
+from api.responses import FastJSONResponse
+from api.schemas import OrderResponse
+from domain.entities import Order, OrderItem
+from infra.serializers import JsonSerializer, MsgpackSerializer, OrjsonSerializer
+
+from .stats import measure, print_report
+
+# each sample averages this many encodings, a single one takes microseconds.
+CALLS_PER_SAMPLE = 100
+
+
+ORDER_RESPONSE_ADAPTER = TypeAdapter(OrderResponse)
+
+
+def render_with_json_response(content: OrderResponse) -> bytes:
+    # what a route with response_model=OrderResponse does with its return value:
+    # pydantic serialization, jsonable_encoder, then JSONResponse.
+    return dumps(
+        jsonable_encoder(ORDER_RESPONSE_ADAPTER.dump_python(content, mode="json")),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def build_order(items: int) -> Order:
+    return Order.create(
+        customer_id=uuid4(),
+        shipping_address="Rua Teste, 123",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name=f"Produto {index}",
+                quantity=index + 1,
+                unit_price=Decimal("10.50"),
+            )
+            for index in range(items)
+        ],
+    )
+
+
+def serializer_benchmarks(items: int) -> Dict[str, Callable[[], object]]:
+    order = build_order(items)
+    event = order.pending_events[0].to_dict()
+    response = to_order_response(order)
+    json_serializer = JsonSerializer()
+    orjson_serializer = OrjsonSerializer()
+    msgpack_serializer = MsgpackSerializer()
+    json_event = orjson_serializer.dumps(event)
+    msgpack_event = msgpack_serializer.dumps(event)
+    print(f"event size: json={len(json_event)} B  msgpack={len(msgpack_event)} B")
+    return {
+        "event json": lambda: json_serializer.dumps(event),
+        "event orjson": lambda: orjson_serializer.dumps(event),
+        "event msgpack": lambda: msgpack_serializer.dumps(event),
+        "event decode orjson": lambda: orjson_serializer.loads(json_event),
+        "event decode msgpack": lambda: msgpack_serializer.loads(msgpack_event),
+        "response JSONResponse": lambda: render_with_json_response(response),
+        "response FastJSONResponse": lambda: FastJSONResponse.serializer.dumps(
+            response
+        ),
+    }
+
+
+def main():
+    parser = ArgumentParser(description="Event and response serialization")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--allocation-iterations", type=int, default=100)
+    parser.add_argument("--items", type=int, default=30)
+    args = parser.parse_args()
+
+    for name, func in serializer_benchmarks(args.items).items():
+        print_report(
+            name,
+            measure(
+                func,
+                iterations=args.iterations,
+                warmup=args.warmup,
+                allocation_iterations=args.allocation_iterations,
+                number=CALLS_PER_SAMPLE,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
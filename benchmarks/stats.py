@@ -0,0 +1,61 @@
+from time import perf_counter
+from typing import Callable, Dict, List
+import tracemalloc
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure_allocations(func: Callable[[], object], iterations: int) -> float:
+    """Average peak KiB allocated by a single call, traced apart from timing."""
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - before
+    finally:
+        tracemalloc.stop()
+    return total / iterations / 1024
+
+
+def measure(
+    func: Callable[[], object],
+    iterations: int,
+    warmup: int = 10,
+    allocation_iterations: int = 0,
+    number: int = 1,
+) -> Dict[str, float]:
+    """Time ``iterations`` samples; each sample is the mean of ``number`` calls,
+    which keeps timer overhead out of sub-microsecond operations."""
+    for _ in range(warmup):
+        func()
+
+    calls = range(number)
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = perf_counter()
+        for _ in calls:
+            func()
+        samples.append((perf_counter() - start) * 1000 / number)
+
+    result = {
+        "ops_per_s": 1000 * len(samples) / sum(samples),
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+        "p99_ms": percentile(samples, 99),
+    }
+    if allocation_iterations:
+        result["alloc_kib"] = measure_allocations(func, allocation_iterations)
+    return result
+
+
+def print_report(name: str, result: Dict[str, float]) -> None:
+    metrics = "  ".join(f"{key}={value:.3f}" for key, value in result.items())
+    print(f"{name:<40} {metrics}")
@@ -1,4 +1,9 @@
 
 db = db.getSiblingDB('orders');
 db.createCollection('orders');
-db.orders.createIndex({ "id": 1 }, { unique: true });
\ No newline at end of file
+db.orders.createIndex({ "id": 1 }, { unique: true });
+
+db.createCollection('outbox');
+db.outbox.createIndex({ "publishedAt": 1, "deadLetteredAt": 1, "_id": 1 });
+db.outbox.createIndex({ "leaseId": 1 }, { sparse: true });
+db.outbox.createIndex({ "publishedAt": 1 }, { expireAfterSeconds: 604800 });
\ No newline at end of file
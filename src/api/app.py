@@ -1,13 +1,26 @@
 # pylint: disable=W0613
 from typing import Dict
 from http import HTTPStatus
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from domain.enums import ErrorCategory
 
+from config import API_IO_MODE, OUTBOX_ENABLED, MONGO_TRANSACTIONS_ENABLED
 from domain.exceptions import DomainException
+from infra.adapters import (
+    mongo_client_registry,
+    confirm_publisher,
+    async_mongo_client_registry,
+    async_rabbitmq_connection_pool,
+    redis_client_registry,
+    async_redis_client_registry,
+    NoSqlAdapter,
+    AsyncNoSqlAdapter,
+)
+from infra.repositories import OrdersRepository, AsyncOrdersRepository
 
 from .routes import create_routes
 
@@ -26,6 +39,42 @@ STATUS_CODE_MAP: Dict[ErrorCategory, int] = {
 }
 
 
+async def ensure_indexes() -> None:
+    if API_IO_MODE == "async":
+        await AsyncOrdersRepository(
+            adapter=AsyncNoSqlAdapter(client=async_mongo_client_registry.client)
+        ).ensure_indexes()
+    else:
+        OrdersRepository(
+            adapter=NoSqlAdapter(client=mongo_client_registry.client)
+        ).ensure_indexes()
+
+
+def ensure_atomic_outbox(
+    outbox_enabled: bool = OUTBOX_ENABLED,
+    transactions_enabled: bool = MONGO_TRANSACTIONS_ENABLED,
+) -> None:
+    # without a transaction the order and its outbox entries are separate writes:
+    # a failure between them saves an order whose events are never published.
+    if outbox_enabled and not transactions_enabled:
+        raise RuntimeError(
+            "OUTBOX_ENABLED requires MONGO_TRANSACTIONS_ENABLED (MongoDB replica set)"
+        )
+
+
+@asynccontextmanager
+async def lifespan(api: FastAPI):
+    ensure_atomic_outbox()
+    await ensure_indexes()
+    yield
+    mongo_client_registry.close()
+    confirm_publisher.close()
+    await async_mongo_client_registry.close()
+    await async_rabbitmq_connection_pool.close()
+    redis_client_registry.close()
+    await async_redis_client_registry.close()
+
+
 def create_app():
     api = FastAPI(
         title="Pedidos Service",
@@ -34,6 +83,7 @@ def create_app():
         redoc_url=API_DOC_REDOC,
         docs_url=API_DOC,
         version=API_VERSION,
+        lifespan=lifespan,
     )
 
     api.add_middleware(
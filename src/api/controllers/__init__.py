@@ -1,2 +1,4 @@
 # pyright: reportUnusedImport=false
 from .orders_controller import OrdersController
+from .async_orders_controller import AsyncOrdersController
+from .controller_runner import run_controller
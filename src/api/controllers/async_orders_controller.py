@@ -0,0 +1,152 @@
+from uuid import UUID
+from typing import Any, AsyncIterator, Dict, cast
+
+from domain.entities import Order
+
+from application.use_cases import (
+    AsyncCreateOrderUseCase,
+    AsyncCreateOrdersBatchUseCase,
+    AsyncExportOrdersUseCase,
+    AsyncFindOrderByIdUseCase,
+    AsyncFindOrdersByIdsUseCase,
+    AsyncListOrdersUseCase,
+    AsyncUpdateOrderStatusUseCase,
+    AsyncUpdateOrdersStatusBatchUseCase,
+)
+
+from application.repositories import AsyncOrderRepositoryInterface
+from application.adapters import (
+    AsyncPublisherAdapterInterface,
+    AsyncTransactionAdapterInterface,
+)
+
+from infra.exports import OrdersColumnarExporter, OrdersTable
+
+from api.schemas import (
+    ColumnarExportOrdersQuery,
+    CreateOrderRequest,
+    CreateOrderResponse,
+    CreateOrdersBatchRequest,
+    CreateOrdersBatchResponse,
+    ExportOrdersQuery,
+    ListOrdersQuery,
+    LookupOrdersRequest,
+    OrderResponse,
+    OrdersLookupResponse,
+    OrdersPageResponse,
+    UpdateOrderStatusRequest,
+    UpdateOrdersStatusRequest,
+    UpdateOrdersStatusResponse,
+)
+from .orders_mapper import (
+    to_create_order_dto,
+    to_create_orders_batch_response,
+    to_export_orders_filter_dto,
+    to_list_orders_filter_dto,
+    to_order_response,
+    to_orders_lookup_response,
+    to_orders_page_response,
+    to_update_orders_status_response,
+)
+
+
+class AsyncOrdersController:
+    def __init__(
+        self,
+        order_repository: AsyncOrderRepositoryInterface,
+        publisher: AsyncPublisherAdapterInterface,
+        transaction: AsyncTransactionAdapterInterface,
+    ) -> None:
+        self.order_repository = order_repository
+        self.publisher = publisher
+        self.transaction = transaction
+
+    async def create(self, data: CreateOrderRequest) -> CreateOrderResponse:
+        use_case = AsyncCreateOrderUseCase(
+            repository=self.order_repository,
+            publisher=self.publisher,
+        )
+
+        dto = to_create_order_dto(data)
+        order = await self.transaction.execute(lambda: use_case.execute(data=dto))
+
+        return CreateOrderResponse(orderId=order.id)
+
+    async def create_batch(
+        self, data: CreateOrdersBatchRequest
+    ) -> CreateOrdersBatchResponse:
+        use_case = AsyncCreateOrdersBatchUseCase(
+            repository=self.order_repository,
+            publisher=self.publisher,
+        )
+
+        dtos = [to_create_order_dto(order) for order in data.orders]
+        results = await self.transaction.execute(lambda: use_case.execute(data=dtos))
+
+        return to_create_orders_batch_response(results)
+
+    async def find_order_by_id(self, order_id: UUID) -> OrderResponse:
+        use_case = AsyncFindOrderByIdUseCase(repository=self.order_repository)
+
+        order = cast(
+            Order, await use_case.execute(order_id=order_id, raise_if_is_none=True)
+        )
+        return to_order_response(order)
+
+    async def lookup_orders(self, data: LookupOrdersRequest) -> OrdersLookupResponse:
+        use_case = AsyncFindOrdersByIdsUseCase(repository=self.order_repository)
+
+        lookup = await use_case.execute(order_ids=data.orderIds)
+        return to_orders_lookup_response(lookup)
+
+    async def list_orders(self, query: ListOrdersQuery) -> OrdersPageResponse:
+        use_case = AsyncListOrdersUseCase(repository=self.order_repository)
+
+        page = await use_case.execute(
+            filters=to_list_orders_filter_dto(query),
+            limit=query.limit,
+            cursor=query.cursor,
+        )
+        return to_orders_page_response(page)
+
+    async def export_orders(
+        self, query: ExportOrdersQuery
+    ) -> AsyncIterator[Dict[str, Any]]:
+        use_case = AsyncExportOrdersUseCase(repository=self.order_repository)
+
+        return use_case.execute(filters=to_export_orders_filter_dto(query))
+
+    async def export_orders_columnar(
+        self, table: OrdersTable, query: ColumnarExportOrdersQuery
+    ) -> AsyncIterator[bytes]:
+        use_case = AsyncExportOrdersUseCase(repository=self.order_repository)
+
+        rows = use_case.execute(filters=to_export_orders_filter_dto(query))
+        exporter = OrdersColumnarExporter(file_format=query.format)
+        return exporter.stream_async(rows, table)
+
+    async def update_order_status(
+        self, order_id: UUID, data: UpdateOrderStatusRequest
+    ) -> None:
+        use_case = AsyncUpdateOrderStatusUseCase(
+            repository=self.order_repository,
+            publisher=self.publisher,
+        )
+
+        await self.transaction.execute(
+            lambda: use_case.execute(order_id=order_id, new_status=data.newStatus)
+        )
+
+    async def update_orders_status(
+        self, data: UpdateOrdersStatusRequest
+    ) -> UpdateOrdersStatusResponse:
+        use_case = AsyncUpdateOrdersStatusBatchUseCase(
+            repository=self.order_repository,
+            publisher=self.publisher,
+        )
+
+        results = await self.transaction.execute(
+            lambda: use_case.execute(order_ids=data.orderIds, new_status=data.newStatus)
+        )
+
+        return to_update_orders_status_response(results)
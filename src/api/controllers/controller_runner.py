@@ -0,0 +1,9 @@
+from typing import Any, Callable
+from inspect import iscoroutinefunction
+from fastapi.concurrency import run_in_threadpool
+
+
+async def run_controller(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    if iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await run_in_threadpool(method, *args, **kwargs)
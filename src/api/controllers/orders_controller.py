@@ -1,84 +1,146 @@
 from uuid import UUID
-from typing import cast
+from typing import Any, Iterator, Dict, cast
 
 from domain.entities import Order
 
 from application.use_cases import (
     CreateOrderUseCase,
+    CreateOrdersBatchUseCase,
+    ExportOrdersUseCase,
     FindOrderByIdUseCase,
+    FindOrdersByIdsUseCase,
+    ListOrdersUseCase,
     UpdateOrderStatusUseCase,
+    UpdateOrdersStatusBatchUseCase,
 )
 
-from application.dtos import CreateOrderDTO, OrderItemDTO
+from application.repositories import OrderRepositoryInterface
+from application.adapters import (
+    PublisherAdapterInterface,
+    TransactionAdapterInterface,
+)
 
-from infra.repositories import OrdersRepository
-from infra.adapters import NoSqlAdapter, PublisherAdapter
+from infra.exports import OrdersColumnarExporter, OrdersTable
 
 from api.schemas import (
+    ColumnarExportOrdersQuery,
     CreateOrderRequest,
     CreateOrderResponse,
-    OrderItemResponse,
+    CreateOrdersBatchRequest,
+    CreateOrdersBatchResponse,
+    ExportOrdersQuery,
+    ListOrdersQuery,
+    LookupOrdersRequest,
     OrderResponse,
+    OrdersLookupResponse,
+    OrdersPageResponse,
     UpdateOrderStatusRequest,
+    UpdateOrdersStatusRequest,
+    UpdateOrdersStatusResponse,
+)
+from .orders_mapper import (
+    to_create_order_dto,
+    to_create_orders_batch_response,
+    to_export_orders_filter_dto,
+    to_list_orders_filter_dto,
+    to_order_response,
+    to_orders_lookup_response,
+    to_orders_page_response,
+    to_update_orders_status_response,
 )
 
 
 class OrdersController:
-    def __init__(self) -> None:
-        self.order_reposieoty = OrdersRepository(adapter=NoSqlAdapter())
+    def __init__(
+        self,
+        order_repository: OrderRepositoryInterface,
+        publisher: PublisherAdapterInterface,
+        transaction: TransactionAdapterInterface,
+    ) -> None:
+        self.order_repository = order_repository
+        self.publisher = publisher
+        self.transaction = transaction
 
     def create(self, data: CreateOrderRequest) -> CreateOrderResponse:
         use_case = CreateOrderUseCase(
-            repository=self.order_reposieoty,
-            publisher=PublisherAdapter(),
+            repository=self.order_repository,
+            publisher=self.publisher,
         )
 
-        dto = CreateOrderDTO(
-            customer_id=data.customerId,
-            shipping_address=data.shippingAddress,
-            items=[
-                OrderItemDTO(
-                    product_id=item.productId,
-                    product_name=item.productName,
-                    quantity=item.quantity,
-                    unit_price=item.unityPrice,
-                )
-                for item in data.items
-            ],
+        dto = to_create_order_dto(data)
+        order = self.transaction.execute(lambda: use_case.execute(data=dto))
+
+        return CreateOrderResponse(orderId=order.id)
+
+    def create_batch(self, data: CreateOrdersBatchRequest) -> CreateOrdersBatchResponse:
+        use_case = CreateOrdersBatchUseCase(
+            repository=self.order_repository,
+            publisher=self.publisher,
         )
 
-        order = use_case.execute(data=dto)
+        dtos = [to_create_order_dto(order) for order in data.orders]
+        results = self.transaction.execute(lambda: use_case.execute(data=dtos))
 
-        return CreateOrderResponse(orderId=order.id)
+        return to_create_orders_batch_response(results)
 
     def find_order_by_id(self, order_id: UUID) -> OrderResponse:
-        user_case = FindOrderByIdUseCase(repository=self.order_reposieoty)
+        user_case = FindOrderByIdUseCase(repository=self.order_repository)
 
         order = cast(Order, user_case.execute(order_id=order_id, raise_if_is_none=True))
-        return OrderResponse(
-            id=order.id,
-            customerId=order.customer_id,
-            shippingAddress=order.shipping_address,
-            status=order.status,
-            createdAt=order.created_at,
-            updatedAt=order.updated_at,
-            items=[
-                OrderItemResponse(
-                    productId=item.product_id,
-                    productName=item.product_name,
-                    quantity=item.quantity,
-                    unityPrice=item.unit_price,
-                )
-                for item in order.items
-            ],
+        return to_order_response(order)
+
+    def lookup_orders(self, data: LookupOrdersRequest) -> OrdersLookupResponse:
+        use_case = FindOrdersByIdsUseCase(repository=self.order_repository)
+
+        lookup = use_case.execute(order_ids=data.orderIds)
+        return to_orders_lookup_response(lookup)
+
+    def list_orders(self, query: ListOrdersQuery) -> OrdersPageResponse:
+        use_case = ListOrdersUseCase(repository=self.order_repository)
+
+        page = use_case.execute(
+            filters=to_list_orders_filter_dto(query),
+            limit=query.limit,
+            cursor=query.cursor,
         )
+        return to_orders_page_response(page)
+
+    def export_orders(self, query: ExportOrdersQuery) -> Iterator[Dict[str, Any]]:
+        use_case = ExportOrdersUseCase(repository=self.order_repository)
+
+        return use_case.execute(filters=to_export_orders_filter_dto(query))
+
+    def export_orders_columnar(
+        self, table: OrdersTable, query: ColumnarExportOrdersQuery
+    ) -> Iterator[bytes]:
+        use_case = ExportOrdersUseCase(repository=self.order_repository)
+
+        rows = use_case.execute(filters=to_export_orders_filter_dto(query))
+        exporter = OrdersColumnarExporter(file_format=query.format)
+        return exporter.stream(rows, table)
 
     def update_order_status(
         self, order_id: UUID, data: UpdateOrderStatusRequest
     ) -> None:
         use_case = UpdateOrderStatusUseCase(
-            repository=self.order_reposieoty,
-            publisher=PublisherAdapter(),
+            repository=self.order_repository,
+            publisher=self.publisher,
+        )
+
+        self.transaction.execute(
+            lambda: use_case.execute(order_id=order_id, new_status=data.newStatus)
+        )
+
+    def update_orders_status(
+        self, data: UpdateOrdersStatusRequest
+    ) -> UpdateOrdersStatusResponse:
+        use_case = UpdateOrdersStatusBatchUseCase(
+            repository=self.order_repository,
+            publisher=self.publisher,
+        )
+
+        results = self.transaction.execute(
+            lambda: use_case.execute(order_ids=data.orderIds, new_status=data.newStatus)
         )
 
-        use_case.execute(order_id=order_id, new_status=data.newStatus)
+        return to_update_orders_status_response(results)
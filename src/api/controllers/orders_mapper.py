@@ -0,0 +1,123 @@
+from typing import List
+
+from domain.entities import Order
+from application.dtos import (
+    CreateOrderDTO,
+    CreateOrderResultDTO,
+    ListOrdersFilterDTO,
+    OrderItemDTO,
+    OrdersLookupDTO,
+    OrdersPageDTO,
+    UpdateOrderStatusResultDTO,
+)
+
+from api.schemas import (
+    CreateOrderRequest,
+    CreateOrderBatchResultResponse,
+    ExportOrdersQuery,
+    CreateOrdersBatchResponse,
+    ListOrdersQuery,
+    OrderItemResponse,
+    OrderResponse,
+    OrdersLookupResponse,
+    OrdersPageResponse,
+    UpdateOrderStatusResultResponse,
+    UpdateOrdersStatusResponse,
+)
+
+
+def to_create_order_dto(data: CreateOrderRequest) -> CreateOrderDTO:
+    return CreateOrderDTO(
+        customer_id=data.customerId,
+        shipping_address=data.shippingAddress,
+        items=[
+            OrderItemDTO(
+                product_id=item.productId,
+                product_name=item.productName,
+                quantity=item.quantity,
+                unit_price=item.unityPrice,
+            )
+            for item in data.items
+        ],
+    )
+
+
+def to_order_response(order: Order) -> OrderResponse:
+    return OrderResponse(
+        id=order.id,
+        customerId=order.customer_id,
+        shippingAddress=order.shipping_address,
+        status=order.status,
+        createdAt=order.created_at,
+        updatedAt=order.updated_at,
+        items=[
+            OrderItemResponse(
+                productId=item.product_id,
+                productName=item.product_name,
+                quantity=item.quantity,
+                unityPrice=item.unit_price,
+            )
+            for item in order.items
+        ],
+    )
+
+
+def to_create_orders_batch_response(
+    results: List[CreateOrderResultDTO],
+) -> CreateOrdersBatchResponse:
+    return CreateOrdersBatchResponse(
+        results=[
+            CreateOrderBatchResultResponse(
+                orderId=result.order.id,
+                created=result.created,
+                error=result.error,
+            )
+            for result in results
+        ]
+    )
+
+
+def to_update_orders_status_response(
+    results: List[UpdateOrderStatusResultDTO],
+) -> UpdateOrdersStatusResponse:
+    return UpdateOrdersStatusResponse(
+        results=[
+            UpdateOrderStatusResultResponse(
+                orderId=result.order_id,
+                updated=result.updated,
+                error=result.error,
+            )
+            for result in results
+        ]
+    )
+
+
+def to_list_orders_filter_dto(query: ListOrdersQuery) -> ListOrdersFilterDTO:
+    return ListOrdersFilterDTO(
+        customer_id=query.customerId,
+        status=query.status,
+        created_from=query.createdFrom,
+        created_to=query.createdTo,
+    )
+
+
+def to_orders_page_response(page: OrdersPageDTO) -> OrdersPageResponse:
+    return OrdersPageResponse(
+        items=[to_order_response(order) for order in page.items],
+        nextCursor=page.next_cursor,
+    )
+
+
+def to_orders_lookup_response(lookup: OrdersLookupDTO) -> OrdersLookupResponse:
+    return OrdersLookupResponse(
+        items=[to_order_response(order) for order in lookup.items],
+        missingIds=lookup.missing_ids,
+    )
+
+
+def to_export_orders_filter_dto(query: ExportOrdersQuery) -> ListOrdersFilterDTO:
+    return ListOrdersFilterDTO(
+        status=query.status,
+        created_from=query.createdFrom,
+        created_to=query.createdTo,
+    )
@@ -0,0 +1,15 @@
+# pyright: reportUnusedImport=false
+from .orders_dependencies import (
+    OrdersControllerType,
+    get_no_sql_adapter,
+    get_orders_repository,
+    get_publisher_adapter,
+    get_transaction_adapter,
+    get_sync_orders_controller,
+    get_async_no_sql_adapter,
+    get_async_orders_repository,
+    get_async_publisher_adapter,
+    get_async_transaction_adapter,
+    get_async_orders_controller,
+    get_orders_controller,
+)
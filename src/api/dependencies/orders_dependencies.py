@@ -0,0 +1,144 @@
+from typing import Union
+from fastapi import Depends
+
+from config import (
+    API_IO_MODE,
+    OUTBOX_ENABLED,
+    ORDERS_CACHE_ENABLED,
+    REDIS_CACHE_ENABLED,
+)
+from application.adapters import (
+    PublisherAdapterInterface,
+    AsyncPublisherAdapterInterface,
+)
+from application.repositories import (
+    OrderRepositoryInterface,
+    AsyncOrderRepositoryInterface,
+)
+from infra.adapters import (
+    NoSqlAdapter,
+    PublisherAdapter,
+    MongoTransactionAdapter,
+    OutboxPublisherAdapter,
+    AsyncNoSqlAdapter,
+    AsyncPublisherAdapter,
+    AsyncMongoTransactionAdapter,
+    AsyncOutboxPublisherAdapter,
+    mongo_client_registry,
+    async_mongo_client_registry,
+    orders_cache,
+    redis_client_registry,
+    async_redis_client_registry,
+)
+from infra.repositories import (
+    OrdersRepository,
+    AsyncOrdersRepository,
+    CachedOrdersRepository,
+    AsyncCachedOrdersRepository,
+    RedisCachedOrdersRepository,
+    AsyncRedisCachedOrdersRepository,
+)
+from api.controllers import OrdersController, AsyncOrdersController
+
+OrdersControllerType = Union[OrdersController, AsyncOrdersController]
+
+
+async def get_no_sql_adapter() -> NoSqlAdapter:
+    return NoSqlAdapter(client=mongo_client_registry.client)
+
+
+async def get_transaction_adapter(
+    adapter: NoSqlAdapter = Depends(get_no_sql_adapter),
+) -> MongoTransactionAdapter:
+    return MongoTransactionAdapter(adapter=adapter)
+
+
+async def get_orders_repository(
+    adapter: NoSqlAdapter = Depends(get_no_sql_adapter),
+    transaction: MongoTransactionAdapter = Depends(get_transaction_adapter),
+) -> OrderRepositoryInterface:
+    repository: OrderRepositoryInterface = OrdersRepository(adapter=adapter)
+    if REDIS_CACHE_ENABLED:
+        repository = RedisCachedOrdersRepository(
+            repository=repository,
+            client=redis_client_registry.client,
+            transaction=transaction,
+        )
+    if ORDERS_CACHE_ENABLED:
+        return CachedOrdersRepository(
+            repository=repository, cache=orders_cache, transaction=transaction
+        )
+    return repository
+
+
+async def get_publisher_adapter(
+    adapter: NoSqlAdapter = Depends(get_no_sql_adapter),
+    transaction: MongoTransactionAdapter = Depends(get_transaction_adapter),
+) -> PublisherAdapterInterface:
+    if OUTBOX_ENABLED:
+        return OutboxPublisherAdapter(adapter=adapter)
+    return PublisherAdapter(transaction=transaction)
+
+
+async def get_sync_orders_controller(
+    repository: OrderRepositoryInterface = Depends(get_orders_repository),
+    publisher: PublisherAdapterInterface = Depends(get_publisher_adapter),
+    transaction: MongoTransactionAdapter = Depends(get_transaction_adapter),
+) -> OrdersController:
+    return OrdersController(
+        order_repository=repository, publisher=publisher, transaction=transaction
+    )
+
+
+async def get_async_no_sql_adapter() -> AsyncNoSqlAdapter:
+    return AsyncNoSqlAdapter(client=async_mongo_client_registry.client)
+
+
+async def get_async_transaction_adapter(
+    adapter: AsyncNoSqlAdapter = Depends(get_async_no_sql_adapter),
+) -> AsyncMongoTransactionAdapter:
+    return AsyncMongoTransactionAdapter(adapter=adapter)
+
+
+async def get_async_orders_repository(
+    adapter: AsyncNoSqlAdapter = Depends(get_async_no_sql_adapter),
+    transaction: AsyncMongoTransactionAdapter = Depends(get_async_transaction_adapter),
+) -> AsyncOrderRepositoryInterface:
+    repository: AsyncOrderRepositoryInterface = AsyncOrdersRepository(adapter=adapter)
+    if REDIS_CACHE_ENABLED:
+        repository = AsyncRedisCachedOrdersRepository(
+            repository=repository,
+            client=async_redis_client_registry.client,
+            transaction=transaction,
+        )
+    if ORDERS_CACHE_ENABLED:
+        return AsyncCachedOrdersRepository(
+            repository=repository, cache=orders_cache, transaction=transaction
+        )
+    return repository
+
+
+async def get_async_publisher_adapter(
+    adapter: AsyncNoSqlAdapter = Depends(get_async_no_sql_adapter),
+    transaction: AsyncMongoTransactionAdapter = Depends(get_async_transaction_adapter),
+) -> AsyncPublisherAdapterInterface:
+    if OUTBOX_ENABLED:
+        return AsyncOutboxPublisherAdapter(adapter=adapter)
+    return AsyncPublisherAdapter(transaction=transaction)
+
+
+async def get_async_orders_controller(
+    repository: AsyncOrderRepositoryInterface = Depends(get_async_orders_repository),
+    publisher: AsyncPublisherAdapterInterface = Depends(get_async_publisher_adapter),
+    transaction: AsyncMongoTransactionAdapter = Depends(get_async_transaction_adapter),
+) -> AsyncOrdersController:
+    return AsyncOrdersController(
+        order_repository=repository, publisher=publisher, transaction=transaction
+    )
+
+
+get_orders_controller = (
+    get_async_orders_controller
+    if API_IO_MODE == "async"
+    else get_sync_orders_controller
+)
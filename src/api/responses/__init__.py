@@ -0,0 +1,5 @@
+# pyright: reportUnusedImport=false
+from .fast_json_response import FastJSONResponse, encode_decimal
+from .closing_streaming_response import ClosingStreamingResponse
+from .ndjson_response import NDJSONResponse
+from .columnar_response import ColumnarResponse
@@ -0,0 +1,36 @@
+from typing import Any, AsyncIterator, Iterator, Union
+
+from anyio import CancelScope
+from fastapi.concurrency import run_in_threadpool
+from starlette.responses import StreamingResponse
+from starlette.types import Send
+
+Source = Union[Iterator[Any], AsyncIterator[Any]]
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """StreamingResponse that closes its source as soon as the stream ends,
+    including when the client disconnects half-way."""
+
+    def __init__(self, source: Source, content: Any, **kwargs: Any):
+        self.source = source
+        super().__init__(content, **kwargs)
+
+    async def stream_response(self, send: Send) -> None:
+        try:
+            await super().stream_response(send)
+        finally:
+            # a client that disconnects cancels the stream mid-way; closing the
+            # source right away releases its database cursor.
+            with CancelScope(shield=True):
+                await self.close_source()
+
+    async def close_source(self) -> None:
+        if isinstance(self.source, AsyncIterator):
+            close = getattr(self.source, "aclose", None)
+            if close is not None:
+                await close()
+        else:
+            close = getattr(self.source, "close", None)
+            if close is not None:
+                await run_in_threadpool(close)
@@ -0,0 +1,31 @@
+from typing import Any, Dict
+
+from infra.exports import ColumnarFormat, OrdersTable
+
+from .closing_streaming_response import ClosingStreamingResponse, Source
+
+COLUMNAR_MEDIA_TYPES: Dict[str, str] = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+
+class ColumnarResponse(ClosingStreamingResponse):
+    """Streams a Parquet or Arrow file one row group at a time."""
+
+    def __init__(
+        self,
+        chunks: Source,
+        table: OrdersTable,
+        file_format: ColumnarFormat,
+        **kwargs: Any,
+    ):
+        super().__init__(
+            chunks,
+            chunks,
+            media_type=COLUMNAR_MEDIA_TYPES[file_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{table}.{file_format}"'
+            },
+            **kwargs,
+        )
@@ -0,0 +1,53 @@
+from typing import Any, AsyncIterator, Iterator
+
+from .closing_streaming_response import ClosingStreamingResponse, Source
+from .fast_json_response import FastJSONResponse
+
+# lines are sent in chunks of about this size, so a sync source crosses the
+# threadpool once per chunk instead of once per row.
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+
+class NDJSONResponse(ClosingStreamingResponse):
+    """Streams rows as newline-delimited JSON, encoded with the same orjson
+    serializer as FastJSONResponse, without holding more than a chunk. Money
+    is written as exact decimal strings ("100.50"), never as binary floats."""
+
+    media_type = "application/x-ndjson"
+    serializer = FastJSONResponse.serializer
+
+    def __init__(
+        self, rows: Source, chunk_size: int = NDJSON_CHUNK_SIZE, **kwargs: Any
+    ):
+        self.chunk_size = chunk_size
+        super().__init__(
+            rows,
+            (
+                self.encode_async(rows)
+                if isinstance(rows, AsyncIterator)
+                else self.encode(rows)
+            ),
+            **kwargs,
+        )
+
+    def encode(self, rows: Iterator[Any]) -> Iterator[bytes]:
+        chunk = bytearray()
+        for row in rows:
+            chunk += self.serializer.dumps(row)
+            chunk += b"\n"
+            if len(chunk) >= self.chunk_size:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+
+    async def encode_async(self, rows: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+        chunk = bytearray()
+        async for row in rows:
+            chunk += self.serializer.dumps(row)
+            chunk += b"\n"
+            if len(chunk) >= self.chunk_size:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
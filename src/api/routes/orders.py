@@ -1,29 +1,147 @@
 from uuid import UUID
 from http import HTTPStatus
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from infra.exports import OrdersTable
 
 from api.schemas import (
+    ColumnarExportOrdersQuery,
     OrderResponse,
     CreateOrderResponse,
     CreateOrderRequest,
+    CreateOrdersBatchRequest,
+    CreateOrdersBatchResponse,
+    ExportOrdersQuery,
+    ListOrdersQuery,
+    LookupOrdersRequest,
+    OrdersLookupResponse,
+    OrdersPageResponse,
     UpdateOrderStatusRequest,
+    UpdateOrdersStatusRequest,
+    UpdateOrdersStatusResponse,
 )
-from api.controllers import OrdersController
+from api.controllers import run_controller
+from api.responses import ColumnarResponse, FastJSONResponse, NDJSONResponse
+from api.dependencies import OrdersControllerType, get_orders_controller
 
 router = APIRouter()
 
 
-@router.get("/{orderId}", status_code=HTTPStatus.OK, response_model=OrderResponse)
-async def list_order_by_id(orderId: UUID):
-    return OrdersController().find_order_by_id(orderId)
+@router.get(
+    "",
+    status_code=HTTPStatus.OK,
+    response_model=OrdersPageResponse,
+    response_class=FastJSONResponse,
+)
+async def list_orders(
+    query: ListOrdersQuery = Depends(),
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    result = await run_controller(controller.list_orders, query=query)
+    return FastJSONResponse(result, status_code=HTTPStatus.OK)
+
+
+# declared before "/{orderId}" so "export" is not taken for an order id.
+@router.get("/export", status_code=HTTPStatus.OK, response_class=NDJSONResponse)
+async def export_orders(
+    query: ExportOrdersQuery = Depends(),
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    rows = await run_controller(controller.export_orders, query=query)
+    return NDJSONResponse(rows, status_code=HTTPStatus.OK)
+
+
+@router.get(
+    "/export/{table}", status_code=HTTPStatus.OK, response_class=ColumnarResponse
+)
+async def export_orders_columnar(
+    table: OrdersTable,
+    query: ColumnarExportOrdersQuery = Depends(),
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    chunks = await run_controller(
+        controller.export_orders_columnar, table=table, query=query
+    )
+    return ColumnarResponse(
+        chunks, table=table, file_format=query.format, status_code=HTTPStatus.OK
+    )
+
+
+@router.get(
+    "/{orderId}",
+    status_code=HTTPStatus.OK,
+    response_model=OrderResponse,
+    response_class=FastJSONResponse,
+)
+async def list_order_by_id(
+    orderId: UUID, controller: OrdersControllerType = Depends(get_orders_controller)
+):
+    result = await run_controller(controller.find_order_by_id, orderId)
+    return FastJSONResponse(result, status_code=HTTPStatus.OK)
+
+
+@router.post(
+    "",
+    status_code=HTTPStatus.CREATED,
+    response_model=CreateOrderResponse,
+    response_class=FastJSONResponse,
+)
+async def create_order(
+    data: CreateOrderRequest,
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    result = await run_controller(controller.create, data=data)
+    return FastJSONResponse(result, status_code=HTTPStatus.CREATED)
+
+
+@router.post(
+    "/batch",
+    status_code=HTTPStatus.MULTI_STATUS,
+    response_model=CreateOrdersBatchResponse,
+    response_class=FastJSONResponse,
+)
+async def create_orders_batch(
+    data: CreateOrdersBatchRequest,
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    result = await run_controller(controller.create_batch, data=data)
+    return FastJSONResponse(result, status_code=HTTPStatus.MULTI_STATUS)
+
 
+@router.post(
+    "/lookup",
+    status_code=HTTPStatus.OK,
+    response_model=OrdersLookupResponse,
+    response_class=FastJSONResponse,
+)
+async def lookup_orders(
+    data: LookupOrdersRequest,
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    result = await run_controller(controller.lookup_orders, data=data)
+    return FastJSONResponse(result, status_code=HTTPStatus.OK)
 
-@router.post("", status_code=HTTPStatus.CREATED, response_model=CreateOrderResponse)
-async def create_order(data: CreateOrderRequest):
-    return OrdersController().create(data=data)
+
+# declared before "/{orderId}" so "status" is not taken for an order id.
+@router.patch(
+    "/status",
+    status_code=HTTPStatus.MULTI_STATUS,
+    response_model=UpdateOrdersStatusResponse,
+    response_class=FastJSONResponse,
+)
+async def update_orders_status(
+    data: UpdateOrdersStatusRequest,
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    result = await run_controller(controller.update_orders_status, data=data)
+    return FastJSONResponse(result, status_code=HTTPStatus.MULTI_STATUS)
 
 
 @router.patch("/{orderId}", status_code=HTTPStatus.NO_CONTENT)
-async def update_order_status(orderId: UUID, data: UpdateOrderStatusRequest):
-    OrdersController().update_order_status(order_id=orderId, data=data)
+async def update_order_status(
+    orderId: UUID,
+    data: UpdateOrderStatusRequest,
+    controller: OrdersControllerType = Depends(get_orders_controller),
+):
+    await run_controller(controller.update_order_status, order_id=orderId, data=data)
@@ -5,3 +5,15 @@ from .create_order_response import CreateOrderResponse
 from .order_response import OrderResponse
 from .order_item_response import OrderItemResponse
 from .update_order_status_request import UpdateOrderStatusRequest
+from .create_orders_batch_request import CreateOrdersBatchRequest
+from .create_order_batch_result_response import CreateOrderBatchResultResponse
+from .create_orders_batch_response import CreateOrdersBatchResponse
+from .orders_page_response import OrdersPageResponse
+from .list_orders_query import ListOrdersQuery
+from .update_orders_status_request import UpdateOrdersStatusRequest
+from .update_order_status_result_response import UpdateOrderStatusResultResponse
+from .update_orders_status_response import UpdateOrdersStatusResponse
+from .lookup_orders_request import LookupOrdersRequest
+from .orders_lookup_response import OrdersLookupResponse
+from .export_orders_query import ExportOrdersQuery
+from .columnar_export_orders_query import ColumnarExportOrdersQuery
@@ -0,0 +1,7 @@
+from infra.exports import ColumnarFormat
+
+from .export_orders_query import ExportOrdersQuery
+
+
+class ColumnarExportOrdersQuery(ExportOrdersQuery):
+    format: ColumnarFormat = "parquet"
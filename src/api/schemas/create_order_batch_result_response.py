@@ -0,0 +1,10 @@
+from uuid import UUID
+from typing import Optional
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CreateOrderBatchResultResponse:
+    orderId: UUID
+    created: bool
+    error: Optional[str] = None
@@ -0,0 +1,11 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+from config import ORDERS_BATCH_MAX_SIZE
+from .create_order_request import CreateOrderRequest
+
+
+class CreateOrdersBatchRequest(BaseModel):
+    orders: List[CreateOrderRequest] = Field(
+        min_length=1, max_length=ORDERS_BATCH_MAX_SIZE
+    )
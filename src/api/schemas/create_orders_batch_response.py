@@ -0,0 +1,9 @@
+from typing import List
+from dataclasses import dataclass
+
+from .create_order_batch_result_response import CreateOrderBatchResultResponse
+
+
+@dataclass(frozen=True)
+class CreateOrdersBatchResponse:
+    results: List[CreateOrderBatchResultResponse]
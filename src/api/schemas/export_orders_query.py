@@ -0,0 +1,11 @@
+from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel
+
+from domain.enums import OrderStatus
+
+
+class ExportOrdersQuery(BaseModel):
+    status: Optional[OrderStatus] = None
+    createdFrom: Optional[datetime] = None
+    createdTo: Optional[datetime] = None
@@ -0,0 +1,16 @@
+from uuid import UUID
+from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+from config import ORDERS_PAGE_DEFAULT_SIZE, ORDERS_PAGE_MAX_SIZE
+from domain.enums import OrderStatus
+
+
+class ListOrdersQuery(BaseModel):
+    customerId: Optional[UUID] = None
+    status: Optional[OrderStatus] = None
+    createdFrom: Optional[datetime] = None
+    createdTo: Optional[datetime] = None
+    cursor: Optional[str] = None
+    limit: int = Field(default=ORDERS_PAGE_DEFAULT_SIZE, ge=1, le=ORDERS_PAGE_MAX_SIZE)
@@ -0,0 +1,9 @@
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from config import ORDERS_LOOKUP_MAX_SIZE
+
+
+class LookupOrdersRequest(BaseModel):
+    orderIds: List[UUID] = Field(min_length=1, max_length=ORDERS_LOOKUP_MAX_SIZE)
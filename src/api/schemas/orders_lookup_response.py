@@ -0,0 +1,11 @@
+from uuid import UUID
+from typing import List
+from dataclasses import dataclass
+
+from .order_response import OrderResponse
+
+
+@dataclass(frozen=True)
+class OrdersLookupResponse:
+    items: List[OrderResponse]
+    missingIds: List[UUID]
@@ -0,0 +1,10 @@
+from typing import List, Optional
+from dataclasses import dataclass
+
+from .order_response import OrderResponse
+
+
+@dataclass(frozen=True)
+class OrdersPageResponse:
+    items: List[OrderResponse]
+    nextCursor: Optional[str] = None
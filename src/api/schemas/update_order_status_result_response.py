@@ -0,0 +1,10 @@
+from uuid import UUID
+from typing import Optional
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UpdateOrderStatusResultResponse:
+    orderId: UUID
+    updated: bool
+    error: Optional[str] = None
@@ -0,0 +1,11 @@
+from typing import List
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+from config import ORDERS_BATCH_MAX_SIZE
+from domain.enums import OrderStatus
+
+
+class UpdateOrdersStatusRequest(BaseModel):
+    orderIds: List[UUID] = Field(min_length=1, max_length=ORDERS_BATCH_MAX_SIZE)
+    newStatus: OrderStatus
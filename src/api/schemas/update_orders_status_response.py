@@ -0,0 +1,9 @@
+from typing import List
+from dataclasses import dataclass
+
+from .update_order_status_result_response import UpdateOrderStatusResultResponse
+
+
+@dataclass(frozen=True)
+class UpdateOrdersStatusResponse:
+    results: List[UpdateOrderStatusResultResponse]
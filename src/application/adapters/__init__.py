@@ -1,2 +1,5 @@
 # pyright: reportUnusedImport=false
 from .publisher_adapter_interface import PublisherAdapterInterface
+from .async_publisher_adapter_interface import AsyncPublisherAdapterInterface
+from .transaction_adapter_interface import TransactionAdapterInterface
+from .async_transaction_adapter_interface import AsyncTransactionAdapterInterface
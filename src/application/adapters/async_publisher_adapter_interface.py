@@ -0,0 +1,15 @@
+from typing import List
+from abc import ABC, abstractmethod
+
+from domain.events import DomainEvent
+
+
+class AsyncPublisherAdapterInterface(ABC):
+
+    @abstractmethod
+    async def publish_event(self, event: DomainEvent) -> None:
+        raise NotImplementedError("Should implement method: publish_event")
+
+    @abstractmethod
+    async def publish_events(self, events: List[DomainEvent]) -> None:
+        raise NotImplementedError("Should implement method: publish_events")
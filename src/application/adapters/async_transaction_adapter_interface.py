@@ -0,0 +1,15 @@
+from typing import Awaitable, Callable, TypeVar
+from abc import ABC, abstractmethod
+
+T = TypeVar("T")
+
+
+class AsyncTransactionAdapterInterface(ABC):
+
+    @abstractmethod
+    async def execute(self, operation: Callable[[], Awaitable[T]]) -> T:
+        raise NotImplementedError("Should implement method: execute")
+
+    @abstractmethod
+    async def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        raise NotImplementedError("Should implement method: after_commit")
@@ -0,0 +1,15 @@
+from typing import Callable, TypeVar
+from abc import ABC, abstractmethod
+
+T = TypeVar("T")
+
+
+class TransactionAdapterInterface(ABC):
+
+    @abstractmethod
+    def execute(self, operation: Callable[[], T]) -> T:
+        raise NotImplementedError("Should implement method: execute")
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        raise NotImplementedError("Should implement method: after_commit")
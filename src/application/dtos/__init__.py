@@ -1,3 +1,9 @@
 # pyright: reportUnusedImport=false
 from .create_order_dto import CreateOrderDTO
 from .order_item_dto import OrderItemDTO
+from .create_order_result_dto import CreateOrderResultDTO
+from .list_orders_filter_dto import ListOrdersFilterDTO
+from .orders_page_dto import OrdersPageDTO
+from .order_summary_dto import OrderSummaryDTO
+from .update_order_status_result_dto import UpdateOrderStatusResultDTO
+from .orders_lookup_dto import OrdersLookupDTO
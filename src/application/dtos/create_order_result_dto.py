@@ -0,0 +1,14 @@
+from typing import Optional
+from dataclasses import dataclass, field
+
+from domain.entities import Order
+
+
+@dataclass(frozen=True)
+class CreateOrderResultDTO:
+    order: Order
+    error: Optional[str] = field(default_factory=lambda: None)
+
+    @property
+    def created(self) -> bool:
+        return self.error is None
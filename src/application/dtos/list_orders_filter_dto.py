@@ -0,0 +1,14 @@
+from uuid import UUID
+from typing import Optional
+from datetime import datetime
+from dataclasses import dataclass, field
+
+from domain.enums import OrderStatus
+
+
+@dataclass(frozen=True)
+class ListOrdersFilterDTO:
+    customer_id: Optional[UUID] = field(default_factory=lambda: None)
+    status: Optional[OrderStatus] = field(default_factory=lambda: None)
+    created_from: Optional[datetime] = field(default_factory=lambda: None)
+    created_to: Optional[datetime] = field(default_factory=lambda: None)
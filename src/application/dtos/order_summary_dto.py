@@ -0,0 +1,15 @@
+from uuid import UUID
+from datetime import datetime
+from dataclasses import dataclass
+
+from domain.enums import OrderStatus
+
+
+@dataclass(frozen=True)
+class OrderSummaryDTO:
+    id: UUID
+    customer_id: UUID
+    shipping_address: str
+    status: OrderStatus
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,11 @@
+from uuid import UUID
+from typing import List
+from dataclasses import dataclass
+
+from domain.entities import Order
+
+
+@dataclass(frozen=True)
+class OrdersLookupDTO:
+    items: List[Order]
+    missing_ids: List[UUID]
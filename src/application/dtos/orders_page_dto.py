@@ -0,0 +1,10 @@
+from typing import List, Optional
+from dataclasses import dataclass, field
+
+from domain.entities import Order
+
+
+@dataclass(frozen=True)
+class OrdersPageDTO:
+    items: List[Order]
+    next_cursor: Optional[str] = field(default_factory=lambda: None)
@@ -0,0 +1,13 @@
+from uuid import UUID
+from typing import Optional
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UpdateOrderStatusResultDTO:
+    order_id: UUID
+    error: Optional[str] = None
+
+    @property
+    def updated(self) -> bool:
+        return self.error is None
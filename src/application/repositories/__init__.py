@@ -1,2 +1,3 @@
 # pyright: reportUnusedImport=false
 from .order_repository_interface import OrderRepositoryInterface
+from .async_order_repository_interface import AsyncOrderRepositoryInterface
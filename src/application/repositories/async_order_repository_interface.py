@@ -0,0 +1,71 @@
+from uuid import UUID
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set
+from abc import ABC, abstractmethod
+from domain.entities import Order
+from domain.enums import OrderStatus
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
+
+
+class AsyncOrderRepositoryInterface(ABC):
+
+    @abstractmethod
+    async def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        raise NotImplementedError("Should implement method: find_by_id")
+
+    @abstractmethod
+    async def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        raise NotImplementedError("Should implement method: find_summary_by_id")
+
+    @abstractmethod
+    async def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        raise NotImplementedError("Should implement method: find_many")
+
+    @abstractmethod
+    async def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        raise NotImplementedError("Should implement method: find_page")
+
+    @abstractmethod
+    async def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        raise NotImplementedError("Should implement method: find_for_transition")
+
+    @abstractmethod
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        raise NotImplementedError("Should implement method: export")
+
+    @abstractmethod
+    async def save(self, order: Order) -> bool:
+        raise NotImplementedError("Should implement method: save")
+
+    @abstractmethod
+    async def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        raise NotImplementedError("Should implement method: save_many")
+
+    @abstractmethod
+    async def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        raise NotImplementedError("Should implement method: update_status")
+
+    @abstractmethod
+    async def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        raise NotImplementedError("Should implement method: transition_status")
+
+    @abstractmethod
+    async def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        raise NotImplementedError("Should implement method: transition_status_many")
@@ -2,3 +2,18 @@
 from .update_order_status_use_case import UpdateOrderStatusUseCase
 from .create_order_use_case import CreateOrderUseCase
 from .find_order_by_id_use_case import FindOrderByIdUseCase
+from .async_update_order_status_use_case import AsyncUpdateOrderStatusUseCase
+from .async_create_order_use_case import AsyncCreateOrderUseCase
+from .async_find_order_by_id_use_case import AsyncFindOrderByIdUseCase
+from .create_orders_batch_use_case import CreateOrdersBatchUseCase
+from .async_create_orders_batch_use_case import AsyncCreateOrdersBatchUseCase
+from .list_orders_use_case import ListOrdersUseCase
+from .async_list_orders_use_case import AsyncListOrdersUseCase
+from .update_orders_status_batch_use_case import UpdateOrdersStatusBatchUseCase
+from .async_update_orders_status_batch_use_case import (
+    AsyncUpdateOrdersStatusBatchUseCase,
+)
+from .find_orders_by_ids_use_case import FindOrdersByIdsUseCase
+from .async_find_orders_by_ids_use_case import AsyncFindOrdersByIdsUseCase
+from .export_orders_use_case import ExportOrdersUseCase
+from .async_export_orders_use_case import AsyncExportOrdersUseCase
@@ -0,0 +1,24 @@
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import CreateOrderDTO
+from application.adapters import AsyncPublisherAdapterInterface
+
+from domain.entities import Order
+
+from .create_order_use_case import CreateOrderUseCase
+
+
+class AsyncCreateOrderUseCase:
+    def __init__(
+        self,
+        repository: AsyncOrderRepositoryInterface,
+        publisher: AsyncPublisherAdapterInterface,
+    ):
+        self.repository = repository
+        self.publisher = publisher
+
+    async def execute(self, data: CreateOrderDTO) -> Order:
+        order = CreateOrderUseCase.build_order(data)
+        await self.repository.save(order)
+        await self.publisher.publish_events(order.pending_events)
+
+        return order
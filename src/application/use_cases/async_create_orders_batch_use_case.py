@@ -0,0 +1,36 @@
+from typing import List
+
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import CreateOrderDTO, CreateOrderResultDTO
+from application.adapters import AsyncPublisherAdapterInterface
+
+from .create_order_use_case import CreateOrderUseCase
+
+
+class AsyncCreateOrdersBatchUseCase:
+    def __init__(
+        self,
+        repository: AsyncOrderRepositoryInterface,
+        publisher: AsyncPublisherAdapterInterface,
+    ):
+        self.repository = repository
+        self.publisher = publisher
+
+    async def execute(self, data: List[CreateOrderDTO]) -> List[CreateOrderResultDTO]:
+        orders = [CreateOrderUseCase.build_order(item) for item in data]
+        errors = await self.repository.save_many(orders)
+
+        results = [
+            CreateOrderResultDTO(order=order, error=errors.get(order.id))
+            for order in orders
+        ]
+        await self.publisher.publish_events(
+            [
+                event
+                for result in results
+                if result.created
+                for event in result.order.pending_events
+            ]
+        )
+
+        return results
@@ -0,0 +1,15 @@
+from typing import Any, AsyncIterator, Dict
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO
+
+from config import ORDERS_EXPORT_BATCH_SIZE
+
+
+class AsyncExportOrdersUseCase:
+    def __init__(self, repository: AsyncOrderRepositoryInterface):
+        self.repository = repository
+
+    def execute(
+        self, filters: ListOrdersFilterDTO, batch_size: int = ORDERS_EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.repository.export(filters=filters, batch_size=batch_size)
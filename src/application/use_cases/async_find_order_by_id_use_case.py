@@ -0,0 +1,14 @@
+from uuid import UUID
+from application.repositories import AsyncOrderRepositoryInterface
+from domain.exceptions import OrderNotFoundError
+
+
+class AsyncFindOrderByIdUseCase:
+    def __init__(self, repository: AsyncOrderRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, order_id: UUID, raise_if_is_none: bool = False):
+        order = await self.repository.find_by_id(order_id=order_id)
+        if raise_if_is_none is True and order is None:
+            raise OrderNotFoundError(order_id=order_id)
+        return order
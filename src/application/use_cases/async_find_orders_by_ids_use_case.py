@@ -0,0 +1,17 @@
+from uuid import UUID
+from typing import Sequence
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import OrdersLookupDTO
+
+from .find_orders_by_ids_use_case import FindOrdersByIdsUseCase
+
+
+class AsyncFindOrdersByIdsUseCase:
+    def __init__(self, repository: AsyncOrderRepositoryInterface):
+        self.repository = repository
+
+    async def execute(self, order_ids: Sequence[UUID]) -> OrdersLookupDTO:
+        order_ids = list(dict.fromkeys(order_ids))
+        return FindOrdersByIdsUseCase.to_lookup(
+            order_ids, await self.repository.find_many(order_ids)
+        )
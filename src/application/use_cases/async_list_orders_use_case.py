@@ -0,0 +1,15 @@
+from typing import Optional
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrdersPageDTO
+
+
+class AsyncListOrdersUseCase:
+    def __init__(self, repository: AsyncOrderRepositoryInterface):
+        self.repository = repository
+
+    async def execute(
+        self, filters: ListOrdersFilterDTO, limit: int, cursor: Optional[str] = None
+    ) -> OrdersPageDTO:
+        return await self.repository.find_page(
+            filters=filters, limit=limit, cursor=cursor
+        )
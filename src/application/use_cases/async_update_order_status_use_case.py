@@ -0,0 +1,39 @@
+from uuid import UUID
+from typing import NoReturn
+from application.repositories import AsyncOrderRepositoryInterface
+from application.adapters import AsyncPublisherAdapterInterface
+from domain.entities import Order
+from domain.enums import OrderStatus
+from domain.exceptions import OrderNotFoundError, OrderStatusConflictError
+
+
+class AsyncUpdateOrderStatusUseCase:
+    def __init__(
+        self,
+        repository: AsyncOrderRepositoryInterface,
+        publisher: AsyncPublisherAdapterInterface,
+    ):
+        self.repository = repository
+        self.publisher = publisher
+
+    async def execute(self, order_id: UUID, new_status: OrderStatus):
+        previous_order = await self.repository.transition_status(
+            order_id=order_id, new_status=new_status
+        )
+        if previous_order is None:
+            await self.__raise_transition_error(
+                order_id=order_id, new_status=new_status
+            )
+
+        previous_order.change_status(new_status=new_status)
+        await self.publisher.publish_events(previous_order.pending_events)
+
+    async def __raise_transition_error(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> NoReturn:
+        # only the current status is needed to tell why the transition failed.
+        summary = await self.repository.find_summary_by_id(order_id=order_id)
+        if summary is None:
+            raise OrderNotFoundError(order_id=order_id)
+        Order.validate_status_transition(order_id, summary.status, new_status)
+        raise OrderStatusConflictError(order_id=order_id, attempted_status=new_status)
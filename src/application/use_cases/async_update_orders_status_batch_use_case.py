@@ -0,0 +1,45 @@
+from uuid import UUID
+from typing import List, Sequence
+
+from application.repositories import AsyncOrderRepositoryInterface
+from application.adapters import AsyncPublisherAdapterInterface
+from application.dtos import UpdateOrderStatusResultDTO
+from domain.enums import OrderStatus
+
+from .update_orders_status_batch_use_case import UpdateOrdersStatusBatchUseCase
+
+
+class AsyncUpdateOrdersStatusBatchUseCase:
+    def __init__(
+        self,
+        repository: AsyncOrderRepositoryInterface,
+        publisher: AsyncPublisherAdapterInterface,
+    ):
+        self.repository = repository
+        self.publisher = publisher
+
+    async def execute(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[UpdateOrderStatusResultDTO]:
+        order_ids = list(dict.fromkeys(order_ids))
+        orders = await self.repository.find_for_transition(order_ids, new_status)
+        errors = UpdateOrdersStatusBatchUseCase.validate(order_ids, orders, new_status)
+
+        candidates = [order for order in orders if order.id not in errors]
+        transitioned = await self.repository.transition_status_many(
+            candidates, new_status
+        )
+
+        errors.update(
+            UpdateOrdersStatusBatchUseCase.apply(candidates, transitioned, new_status)
+        )
+        await self.publisher.publish_events(
+            [
+                event
+                for order in candidates
+                if order.id in transitioned
+                for event in order.pending_events
+            ]
+        )
+
+        return UpdateOrdersStatusBatchUseCase.to_results(order_ids, errors)
@@ -14,8 +14,9 @@ class CreateOrderUseCase:
         self.repository = repository
         self.publisher = publisher
 
-    def execute(self, data: CreateOrderDTO) -> Order:
-        order = Order.create(
+    @staticmethod
+    def build_order(data: CreateOrderDTO) -> Order:
+        return Order.create(
             customer_id=data.customer_id,
             shipping_address=data.shipping_address,
             items=[
@@ -28,6 +29,9 @@ class CreateOrderUseCase:
                 for item in data.items
             ],
         )
+
+    def execute(self, data: CreateOrderDTO) -> Order:
+        order = self.build_order(data)
         self.repository.save(order)
         self.publisher.publish_events(order.pending_events)
 
@@ -0,0 +1,36 @@
+from typing import List
+
+from application.repositories import OrderRepositoryInterface
+from application.dtos import CreateOrderDTO, CreateOrderResultDTO
+from application.adapters import PublisherAdapterInterface
+
+from .create_order_use_case import CreateOrderUseCase
+
+
+class CreateOrdersBatchUseCase:
+    def __init__(
+        self,
+        repository: OrderRepositoryInterface,
+        publisher: PublisherAdapterInterface,
+    ):
+        self.repository = repository
+        self.publisher = publisher
+
+    def execute(self, data: List[CreateOrderDTO]) -> List[CreateOrderResultDTO]:
+        orders = [CreateOrderUseCase.build_order(item) for item in data]
+        errors = self.repository.save_many(orders)
+
+        results = [
+            CreateOrderResultDTO(order=order, error=errors.get(order.id))
+            for order in orders
+        ]
+        self.publisher.publish_events(
+            [
+                event
+                for result in results
+                if result.created
+                for event in result.order.pending_events
+            ]
+        )
+
+        return results
@@ -0,0 +1,15 @@
+from typing import Any, Dict, Iterator
+from application.repositories import OrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO
+
+from config import ORDERS_EXPORT_BATCH_SIZE
+
+
+class ExportOrdersUseCase:
+    def __init__(self, repository: OrderRepositoryInterface):
+        self.repository = repository
+
+    def execute(
+        self, filters: ListOrdersFilterDTO, batch_size: int = ORDERS_EXPORT_BATCH_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        return self.repository.export(filters=filters, batch_size=batch_size)
@@ -0,0 +1,23 @@
+from uuid import UUID
+from typing import List, Sequence
+from application.repositories import OrderRepositoryInterface
+from application.dtos import OrdersLookupDTO
+from domain.entities import Order
+
+
+class FindOrdersByIdsUseCase:
+    def __init__(self, repository: OrderRepositoryInterface):
+        self.repository = repository
+
+    def execute(self, order_ids: Sequence[UUID]) -> OrdersLookupDTO:
+        order_ids = list(dict.fromkeys(order_ids))
+        return self.to_lookup(order_ids, self.repository.find_many(order_ids))
+
+    @staticmethod
+    def to_lookup(order_ids: Sequence[UUID], orders: List[Order]) -> OrdersLookupDTO:
+        # the database returns the orders in index order, not in request order.
+        found = {order.id: order for order in orders}
+        return OrdersLookupDTO(
+            items=[found[order_id] for order_id in order_ids if order_id in found],
+            missing_ids=[order_id for order_id in order_ids if order_id not in found],
+        )
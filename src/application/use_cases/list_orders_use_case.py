@@ -0,0 +1,13 @@
+from typing import Optional
+from application.repositories import OrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrdersPageDTO
+
+
+class ListOrdersUseCase:
+    def __init__(self, repository: OrderRepositoryInterface):
+        self.repository = repository
+
+    def execute(
+        self, filters: ListOrdersFilterDTO, limit: int, cursor: Optional[str] = None
+    ) -> OrdersPageDTO:
+        return self.repository.find_page(filters=filters, limit=limit, cursor=cursor)
@@ -1,8 +1,10 @@
 from uuid import UUID
+from typing import NoReturn
 from application.repositories import OrderRepositoryInterface
 from application.adapters import PublisherAdapterInterface
+from domain.entities import Order
 from domain.enums import OrderStatus
-from .find_order_by_id_use_case import FindOrderByIdUseCase
+from domain.exceptions import OrderNotFoundError, OrderStatusConflictError
 
 
 class UpdateOrderStatusUseCase:
@@ -13,15 +15,23 @@ class UpdateOrderStatusUseCase:
     ):
         self.repository = repository
         self.publisher = publisher
-        self.__find_order_by_id = FindOrderByIdUseCase(repository).execute
 
     def execute(self, order_id: UUID, new_status: OrderStatus):
-        order = self.__find_order_by_id(order_id=order_id, raise_if_is_none=True)  # type: ignore
-        if order:
-            order.change_status(new_status=new_status)
-            self.repository.update_status(
-                order_id=order_id,
-                new_status=new_status,
-            )
+        previous_order = self.repository.transition_status(
+            order_id=order_id, new_status=new_status
+        )
+        if previous_order is None:
+            self.__raise_transition_error(order_id=order_id, new_status=new_status)
 
-            self.publisher.publish_events(order.pending_events)
+        previous_order.change_status(new_status=new_status)
+        self.publisher.publish_events(previous_order.pending_events)
+
+    def __raise_transition_error(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> NoReturn:
+        # only the current status is needed to tell why the transition failed.
+        summary = self.repository.find_summary_by_id(order_id=order_id)
+        if summary is None:
+            raise OrderNotFoundError(order_id=order_id)
+        Order.validate_status_transition(order_id, summary.status, new_status)
+        raise OrderStatusConflictError(order_id=order_id, attempted_status=new_status)
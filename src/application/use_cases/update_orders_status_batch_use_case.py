@@ -0,0 +1,84 @@
+from uuid import UUID
+from typing import Dict, List, Sequence, Set
+
+from application.repositories import OrderRepositoryInterface
+from application.adapters import PublisherAdapterInterface
+from application.dtos import UpdateOrderStatusResultDTO
+from domain.entities import Order
+from domain.enums import OrderStatus
+from domain.exceptions import OrderNotFoundError, OrderStatusConflictError
+
+
+class UpdateOrdersStatusBatchUseCase:
+    def __init__(
+        self,
+        repository: OrderRepositoryInterface,
+        publisher: PublisherAdapterInterface,
+    ):
+        self.repository = repository
+        self.publisher = publisher
+
+    def execute(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[UpdateOrderStatusResultDTO]:
+        order_ids = list(dict.fromkeys(order_ids))
+        orders = self.repository.find_for_transition(order_ids, new_status)
+        errors = self.validate(order_ids, orders, new_status)
+
+        candidates = [order for order in orders if order.id not in errors]
+        transitioned = self.repository.transition_status_many(candidates, new_status)
+
+        errors.update(self.apply(candidates, transitioned, new_status))
+        self.publisher.publish_events(
+            [
+                event
+                for order in candidates
+                if order.id in transitioned
+                for event in order.pending_events
+            ]
+        )
+
+        return self.to_results(order_ids, errors)
+
+    @staticmethod
+    def validate(
+        order_ids: Sequence[UUID], orders: List[Order], new_status: OrderStatus
+    ) -> Dict[UUID, str]:
+        found = {order.id for order in orders}
+        errors = {
+            order_id: OrderNotFoundError(order_id=order_id).message
+            for order_id in order_ids
+            if order_id not in found
+        }
+        errors.update(
+            (order_id, error.message)
+            for order_id, error in Order.validate_transitions(
+                orders, new_status
+            ).items()
+        )
+        return errors
+
+    @staticmethod
+    def apply(
+        candidates: List[Order], transitioned: Set[UUID], new_status: OrderStatus
+    ) -> Dict[UUID, str]:
+        # an order missing from transitioned changed status between the read and
+        # the write.
+        errors: Dict[UUID, str] = {}
+        for order in candidates:
+            if order.id in transitioned:
+                order.change_status(new_status=new_status)
+            else:
+                errors[order.id] = OrderStatusConflictError(
+                    order_id=order.id, attempted_status=new_status
+                ).message
+        return errors
+
+    @staticmethod
+    def to_results(
+        order_ids: Sequence[UUID], errors: Dict[UUID, str]
+    ) -> List[UpdateOrderStatusResultDTO]:
+        return [
+            UpdateOrderStatusResultDTO(order_id=order_id, error=errors.get(order_id))
+            for order_id in order_ids
+        ]
@@ -10,10 +10,110 @@ dotenv = find_dotenv(f".env.{ENVIRONMENT.lower()}")
 load_dotenv(dotenv)
 
 
+API_IO_MODE: Literal["sync", "async"] = config(
+    "API_IO_MODE", default="sync"
+)  # type: ignore
+ORDERS_BATCH_MAX_SIZE: int = config(
+    "ORDERS_BATCH_MAX_SIZE", default=500, cast=int
+)  # type: ignore
+ORDERS_PAGE_DEFAULT_SIZE: int = config(
+    "ORDERS_PAGE_DEFAULT_SIZE", default=50, cast=int
+)  # type: ignore
+ORDERS_PAGE_MAX_SIZE: int = config(
+    "ORDERS_PAGE_MAX_SIZE", default=200, cast=int
+)  # type: ignore
+ORDERS_LOOKUP_MAX_SIZE: int = config(
+    "ORDERS_LOOKUP_MAX_SIZE", default=100, cast=int
+)  # type: ignore
+ORDERS_EXPORT_BATCH_SIZE: int = config(
+    "ORDERS_EXPORT_BATCH_SIZE", default=1000, cast=int
+)  # type: ignore
+ORDERS_EXPORT_ROW_GROUP_SIZE: int = config(
+    "ORDERS_EXPORT_ROW_GROUP_SIZE", default=10000, cast=int
+)  # type: ignore
+ORDERS_CACHE_ENABLED: bool = config(
+    "ORDERS_CACHE_ENABLED", default=False, cast=bool
+)  # type: ignore
+ORDERS_CACHE_MAX_SIZE: int = config(
+    "ORDERS_CACHE_MAX_SIZE", default=1024, cast=int
+)  # type: ignore
+ORDERS_CACHE_TTL_SECONDS: float = config(
+    "ORDERS_CACHE_TTL_SECONDS", default=30, cast=float
+)  # type: ignore
+
+
 MQ_HOST = config("MQ_HOST")
 MQ_USER = config("MQ_USER")
 MQ_PASSWORD = config("MQ_PASSWORD")
 MQ_PORT = config("MQ_PORT")
+MQ_HEARTBEAT: int = config("MQ_HEARTBEAT", default=60, cast=int)  # type: ignore
+MQ_CHANNEL_POOL_SIZE: int = config(
+    "MQ_CHANNEL_POOL_SIZE", default=8, cast=int
+)  # type: ignore
+MQ_PUBLISH_WINDOW: int = config(
+    "MQ_PUBLISH_WINDOW", default=256, cast=int
+)  # type: ignore
+MQ_PUBLISH_MAX_RETRIES: int = config(
+    "MQ_PUBLISH_MAX_RETRIES", default=3, cast=int
+)  # type: ignore
+MQ_CONFIRM_TIMEOUT_MS: int = config(
+    "MQ_CONFIRM_TIMEOUT_MS", default=5000, cast=int
+)  # type: ignore
+MQ_PUBLISH_TIMEOUT_MS: int = config(
+    "MQ_PUBLISH_TIMEOUT_MS", default=20000, cast=int
+)  # type: ignore
+EVENT_SERIALIZER: Literal["orjson", "json", "msgpack"] = config(
+    "EVENT_SERIALIZER", default="orjson"
+)  # type: ignore
+
+
+CONSUMER_QUEUE: str = config("CONSUMER_QUEUE", default="orders_queue")  # type: ignore
+CONSUMER_PREFETCH_COUNT: int = config(
+    "CONSUMER_PREFETCH_COUNT", default=256, cast=int
+)  # type: ignore
+CONSUMER_WORKERS: int = config("CONSUMER_WORKERS", default=16, cast=int)  # type: ignore
+CONSUMER_BATCH_SIZE: int = config(
+    "CONSUMER_BATCH_SIZE", default=100, cast=int
+)  # type: ignore
+CONSUMER_BATCH_MAX_WAIT_MS: int = config(
+    "CONSUMER_BATCH_MAX_WAIT_MS", default=50, cast=int
+)  # type: ignore
+CONSUMER_DEDUP_STORE: Literal["memory", "mongo", "none"] = config(
+    "CONSUMER_DEDUP_STORE", default="memory"
+)  # type: ignore
+CONSUMER_DEDUP_TTL_SECONDS: int = config(
+    "CONSUMER_DEDUP_TTL_SECONDS", default=86400, cast=int
+)  # type: ignore
+CONSUMER_DEDUP_MAX_SIZE: int = config(
+    "CONSUMER_DEDUP_MAX_SIZE", default=100000, cast=int
+)  # type: ignore
+CONSUMER_DEDUP_BLOOM_CAPACITY: int = config(
+    "CONSUMER_DEDUP_BLOOM_CAPACITY", default=1000000, cast=int
+)  # type: ignore
+CONSUMER_DEDUP_BLOOM_ERROR_RATE: float = config(
+    "CONSUMER_DEDUP_BLOOM_ERROR_RATE", default=0.001, cast=float
+)  # type: ignore
+CONSUMER_METRICS_INTERVAL_SECONDS: float = config(
+    "CONSUMER_METRICS_INTERVAL_SECONDS", default=10, cast=float
+)  # type: ignore
+
+
+OUTBOX_ENABLED: bool = config("OUTBOX_ENABLED", default=True, cast=bool)  # type: ignore
+OUTBOX_RELAY_BATCH_SIZE: int = config(
+    "OUTBOX_RELAY_BATCH_SIZE", default=100, cast=int
+)  # type: ignore
+OUTBOX_RELAY_POLL_INTERVAL_MS: int = config(
+    "OUTBOX_RELAY_POLL_INTERVAL_MS", default=500, cast=int
+)  # type: ignore
+OUTBOX_RELAY_MAX_BACKOFF_MS: int = config(
+    "OUTBOX_RELAY_MAX_BACKOFF_MS", default=30000, cast=int
+)  # type: ignore
+OUTBOX_RELAY_LEASE_MS: int = config(
+    "OUTBOX_RELAY_LEASE_MS", default=30000, cast=int
+)  # type: ignore
+OUTBOX_RELAY_MAX_ATTEMPTS: int = config(
+    "OUTBOX_RELAY_MAX_ATTEMPTS", default=10, cast=int
+)  # type: ignore
 
 
 MONGO_HOST = config("MONGO_HOST")
@@ -21,3 +121,42 @@ MONGO_USERNAME = config("MONGO_USERNAME")
 MONGO_PASSWORD = config("MONGO_PASSWORD")
 MONGO_PORT = config("MONGO_PORT")
 MONGO_DATABASE = config("MONGO_DATABASE")
+MONGO_MAX_POOL_SIZE: int = config(
+    "MONGO_MAX_POOL_SIZE", default=100, cast=int
+)  # type: ignore
+MONGO_MIN_POOL_SIZE: int = config(
+    "MONGO_MIN_POOL_SIZE", default=0, cast=int
+)  # type: ignore
+MONGO_MAX_IDLE_TIME_MS: int = config(
+    "MONGO_MAX_IDLE_TIME_MS", default=60000, cast=int
+)  # type: ignore
+MONGO_WAIT_QUEUE_TIMEOUT_MS: int = config(
+    "MONGO_WAIT_QUEUE_TIMEOUT_MS", default=2000, cast=int
+)  # type: ignore
+LEGACY_TIMESTAMPS_TIMEZONE: str = config(
+    "LEGACY_TIMESTAMPS_TIMEZONE", default="local"
+)  # type: ignore
+LEGACY_ORDER_IDS_ENABLED: bool = config(
+    "LEGACY_ORDER_IDS_ENABLED", default=True, cast=bool
+)  # type: ignore
+MONGO_DIRECT_CONNECTION: bool = config(
+    "MONGO_DIRECT_CONNECTION", default=False, cast=bool
+)  # type: ignore
+MONGO_TRANSACTIONS_ENABLED: bool = config(
+    "MONGO_TRANSACTIONS_ENABLED", default=True, cast=bool
+)  # type: ignore
+
+
+REDIS_CACHE_ENABLED: bool = config(
+    "REDIS_CACHE_ENABLED", default=False, cast=bool
+)  # type: ignore
+REDIS_URL: str = config("REDIS_URL", default="redis://localhost:6379/0")  # type: ignore
+REDIS_MAX_CONNECTIONS: int = config(
+    "REDIS_MAX_CONNECTIONS", default=50, cast=int
+)  # type: ignore
+REDIS_CACHE_TTL_SECONDS: int = config(
+    "REDIS_CACHE_TTL_SECONDS", default=300, cast=int
+)  # type: ignore
+REDIS_CACHE_LOCK_TIMEOUT_MS: int = config(
+    "REDIS_CACHE_LOCK_TIMEOUT_MS", default=2000, cast=int
+)  # type: ignore
@@ -1,10 +1,11 @@
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Iterable, Optional, Sequence, Tuple
 from datetime import datetime, timezone
 from decimal import Decimal
 from uuid import uuid4, UUID
 
 from domain.enums.order_status import OrderStatus
 from domain.exceptions import (
+    DomainException,
     OrderAlreadyCancelledError,
     InvalidStatusTransitionError,
     OrderAlreadyDeliveredError,
@@ -19,31 +20,50 @@ from domain.events import (
 )
 
 from .order_item import OrderItem
+from .order_status_transitions import (
+    NO_TRANSITIONS,
+    ORDER_STATUS_SOURCES,
+    ORDER_STATUS_TRANSITIONS,
+    StatusSources,
+    StatusTransitions,
+)
 
 
 class Order:
-    _valid_transitions: Dict[OrderStatus, List[OrderStatus]] = {
-        OrderStatus.CREATED: [OrderStatus.PROCESSING, OrderStatus.CANCELLED],
-        OrderStatus.PROCESSING: [OrderStatus.SHIPPED, OrderStatus.CANCELLED],
-        OrderStatus.SHIPPED: [OrderStatus.DELIVERED],
-        OrderStatus.DELIVERED: [],
-        OrderStatus.CANCELLED: [],
-    }
+    __slots__ = (
+        "id",
+        "customer_id",
+        "shipping_address",
+        "status",
+        "created_at",
+        "updated_at",
+        "__pending_events",
+        "__items",
+        "__total_amount",
+    )
+
+    _valid_transitions: StatusTransitions = ORDER_STATUS_TRANSITIONS
+    _source_statuses: StatusSources = ORDER_STATUS_SOURCES
 
     def __init__(
         self,
         customer_id: UUID,
         shipping_address: str,
-        items: List[OrderItem],
+        items: Iterable[OrderItem],
         id: Optional[UUID] = None,
         status: Optional[OrderStatus] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        total_amount: Optional[Decimal] = None,
     ):
         self.id = id if id is not None else uuid4()
         self.customer_id = customer_id
         self.shipping_address = shipping_address
-        self.items = items
+        self.__items: Tuple[OrderItem, ...] = tuple(items)
+        # a persisted total is trusted as is, since the items may have been
+        # left out of the read; otherwise it is summed on first access, so
+        # reads that never look at it do not pay for the Decimal math.
+        self.__total_amount: Optional[Decimal] = total_amount
         self.status = status if status is not None else OrderStatus.CREATED
         self.created_at = (
             created_at if created_at is not None else datetime.now(timezone.utc)
@@ -53,12 +73,42 @@ class Order:
         )
         self.__pending_events: List[DomainEvent] = []
 
+    @staticmethod
+    def sum_subtotals(items: Iterable[OrderItem]) -> Decimal:
+        return sum((item.subtotal for item in items), Decimal("0"))
+
+    @property
+    def items(self) -> Sequence[OrderItem]:
+        # a tuple, so changes go through add_item/remove_item and keep the
+        # total in step.
+        return self.__items
+
+    @items.setter
+    def items(self, items: Iterable[OrderItem]):
+        self.__items = tuple(items)
+        self.__total_amount = None
+
     @property
     def total_amount(self) -> Decimal:
-        total = Decimal("0")
-        for item in self.items:
-            total += Decimal(item.subtotal)
-        return total
+        if self.__total_amount is None:
+            self.__total_amount = self.sum_subtotals(self.__items)
+        return self.__total_amount
+
+    @property
+    def items_count(self) -> int:
+        return len(self.__items)
+
+    def add_item(self, item: OrderItem):
+        self.__items += (item,)
+        if self.__total_amount is not None:
+            self.__total_amount += item.subtotal
+
+    def remove_item(self, item: OrderItem):
+        items = list(self.__items)
+        items.remove(item)
+        self.__items = tuple(items)
+        if self.__total_amount is not None:
+            self.__total_amount -= item.subtotal
 
     @property
     def pending_events(self) -> List[DomainEvent]:
@@ -70,22 +120,50 @@ class Order:
     def clear_events(self):
         self.__pending_events.clear()
 
+    @classmethod
+    def allowed_source_statuses(
+        cls, new_status: OrderStatus
+    ) -> Tuple[OrderStatus, ...]:
+        return cls._source_statuses[new_status]
+
+    @staticmethod
+    def transition_error(
+        order_id: UUID, current_status: OrderStatus, new_status: OrderStatus
+    ) -> DomainException:
+        if current_status == OrderStatus.CANCELLED:
+            return OrderAlreadyCancelledError(order_id=order_id)
+        if current_status == OrderStatus.DELIVERED:
+            return OrderAlreadyDeliveredError(order_id=order_id)
+        return InvalidStatusTransitionError(
+            order_id=order_id,
+            current_status=current_status,
+            attempted_status=new_status,
+        )
+
+    @classmethod
+    def validate_status_transition(
+        cls, order_id: UUID, current_status: OrderStatus, new_status: OrderStatus
+    ):
+        if new_status not in cls._valid_transitions.get(current_status, NO_TRANSITIONS):
+            raise cls.transition_error(order_id, current_status, new_status)
+
+    @classmethod
+    def validate_transitions(
+        cls, orders: Iterable["Order"], new_status: OrderStatus
+    ) -> Dict[UUID, DomainException]:
+        sources = cls._source_statuses[new_status]
+        return {
+            order.id: cls.transition_error(order.id, order.status, new_status)
+            for order in orders
+            if order.status not in sources
+        }
+
     def validate_transition_to(self, new_status: OrderStatus):
-        if self.status == OrderStatus.CANCELLED:
-            raise OrderAlreadyCancelledError(order_id=self.id)
-        elif self.status == OrderStatus.DELIVERED:
-            raise OrderAlreadyDeliveredError(order_id=self.id)
-
-        if new_status not in self._valid_transitions.get(self.status, []):
-            raise InvalidStatusTransitionError(
-                order_id=self.id,
-                current_status=self.status,
-                attempted_status=new_status,
-            )
+        self.validate_status_transition(self.id, self.status, new_status)
 
     @classmethod
     def create(
-        cls, customer_id: UUID, shipping_address: str, items: List[OrderItem]
+        cls, customer_id: UUID, shipping_address: str, items: Iterable[OrderItem]
     ) -> "Order":
 
         order = cls(
@@ -96,7 +174,7 @@ class Order:
             OrderCreatedEvent(
                 order_id=order.id,
                 customer_id=order.customer_id,
-                items_count=len(order.items),
+                items_count=order.items_count,
                 total_amount=order.total_amount,
             )
         )
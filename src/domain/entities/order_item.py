@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     product_id: UUID
     product_name: str
@@ -0,0 +1,40 @@
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Mapping, Tuple
+
+from domain.enums.order_status import OrderStatus
+
+StatusTransitions = Mapping[OrderStatus, FrozenSet[OrderStatus]]
+StatusSources = Mapping[OrderStatus, Tuple[OrderStatus, ...]]
+
+NO_TRANSITIONS: FrozenSet[OrderStatus] = frozenset()
+
+
+def compile_transitions(
+    rules: Mapping[OrderStatus, Iterable[OrderStatus]],
+) -> StatusTransitions:
+    return MappingProxyType(
+        {status: frozenset(rules.get(status, ())) for status in OrderStatus}
+    )
+
+
+def compile_sources(transitions: StatusTransitions) -> StatusSources:
+    return MappingProxyType(
+        {
+            new_status: tuple(
+                status for status in OrderStatus if new_status in transitions[status]
+            )
+            for new_status in OrderStatus
+        }
+    )
+
+
+ORDER_STATUS_TRANSITIONS = compile_transitions(
+    {
+        OrderStatus.CREATED: [OrderStatus.PROCESSING, OrderStatus.CANCELLED],
+        OrderStatus.PROCESSING: [OrderStatus.SHIPPED, OrderStatus.CANCELLED],
+        OrderStatus.SHIPPED: [OrderStatus.DELIVERED],
+    }
+)
+# the statuses an order may be in to move to each status, for the conditional
+# updates that check the transition on the database.
+ORDER_STATUS_SOURCES = compile_sources(ORDER_STATUS_TRANSITIONS)
@@ -1,12 +1,13 @@
-from typing import Any
+from typing import Any, ClassVar
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from uuid import uuid4
 
 
 class DomainEvent(ABC):
+    __slots__ = ("event_id", "occurred_at")
 
-    event_name: str
+    event_name: ClassVar[str] = ""
 
     def __init__(self):
         self.event_id = uuid4()
@@ -26,7 +27,7 @@ class DomainEvent(ABC):
 
     def __init_subclass__(cls, **kwargs: Any):
         super().__init_subclass__(**kwargs)
-        if not hasattr(cls, "event_name"):
+        if not cls.event_name:
             raise TypeError(
                 f"{cls.__name__} should define the attribte 'event_name'"
             )  # pragma: no cover
@@ -6,6 +6,7 @@ from .domain_event import DomainEvent
 
 
 class OrderCancelledEvent(DomainEvent):
+    __slots__ = ("order_id", "customer_id", "cancellation_reason", "refund_amount")
 
     event_name = "order.cancelled"
 
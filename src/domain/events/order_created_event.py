@@ -6,6 +6,7 @@ from .domain_event import DomainEvent
 
 
 class OrderCreatedEvent(DomainEvent):
+    __slots__ = ("order_id", "customer_id", "items_count", "total_amount")
 
     event_name = "order.created"
 
@@ -6,6 +6,7 @@ from .domain_event import DomainEvent
 
 
 class OrderDeliveredEvent(DomainEvent):
+    __slots__ = ("order_id", "customer_id", "delivery_address", "delivered_at")
 
     event_name = "oder.delivered"
 
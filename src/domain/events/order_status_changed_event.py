@@ -6,6 +6,8 @@ from .domain_event import DomainEvent
 
 
 class OrderStatusChangedEvent(DomainEvent):
+    __slots__ = ("order_id", "previous_status", "new_status", "changed_by", "reason")
+
     event_name = "order.changedStatus"
 
     def __init__(
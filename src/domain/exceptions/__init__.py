@@ -4,3 +4,5 @@ from .invalid_status_transation_error import InvalidStatusTransitionError
 from .order_already_cancelled_error import OrderAlreadyCancelledError
 from .order_not_found_error import OrderNotFoundError
 from .order_already_delivered_error import OrderAlreadyDeliveredError
+from .order_status_conflict_error import OrderStatusConflictError
+from .invalid_cursor_error import InvalidCursorError
@@ -0,0 +1,10 @@
+from domain.enums import ErrorCategory
+from .domain_exception import DomainException
+
+
+class InvalidCursorError(DomainException):
+    category: ErrorCategory = ErrorCategory.VALIDATION
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Cursor '{cursor}' is not valid")
@@ -0,0 +1,14 @@
+from uuid import UUID
+from domain.enums import ErrorCategory, OrderStatus
+from .domain_exception import DomainException
+
+
+class OrderStatusConflictError(DomainException):
+    category: ErrorCategory = ErrorCategory.CONFLICT
+
+    def __init__(self, order_id: UUID, attempted_status: OrderStatus):
+        self.order_id = order_id
+        self.attempted_status = attempted_status
+        super().__init__(
+            f"Order {str(order_id)} was modified concurrently, cannot transition to '{attempted_status.value}'"
+        )
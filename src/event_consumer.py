@@ -0,0 +1,63 @@
+import logging
+import signal
+from typing import Optional
+
+from config import (
+    CONSUMER_DEDUP_STORE,
+    CONSUMER_DEDUP_TTL_SECONDS,
+    CONSUMER_DEDUP_MAX_SIZE,
+    CONSUMER_DEDUP_BLOOM_CAPACITY,
+    CONSUMER_DEDUP_BLOOM_ERROR_RATE,
+)
+from infra.adapters import NoSqlAdapter, mongo_client_registry
+from infra.workers import (
+    EventConsumer,
+    EventDeduplicator,
+    InMemoryProcessedEventStore,
+    MongoProcessedEventStore,
+    ProcessedEventStore,
+    create_order_event_handlers,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def create_deduplicator() -> Optional[EventDeduplicator]:
+    store: ProcessedEventStore
+    if CONSUMER_DEDUP_STORE == "mongo":
+        store = MongoProcessedEventStore(
+            adapter=NoSqlAdapter(client=mongo_client_registry.client),
+            ttl_seconds=CONSUMER_DEDUP_TTL_SECONDS,
+        )
+        store.ensure_indexes()
+    elif CONSUMER_DEDUP_STORE == "memory":
+        store = InMemoryProcessedEventStore(
+            max_size=CONSUMER_DEDUP_MAX_SIZE, ttl_seconds=CONSUMER_DEDUP_TTL_SECONDS
+        )
+    else:
+        return None
+
+    return EventDeduplicator(
+        store=store,
+        bloom_capacity=CONSUMER_DEDUP_BLOOM_CAPACITY,
+        bloom_error_rate=CONSUMER_DEDUP_BLOOM_ERROR_RATE,
+    )
+
+
+def start_event_consumer():
+    logging.basicConfig(level=logging.INFO)
+    consumer = EventConsumer(
+        registry=create_order_event_handlers(), deduplicator=create_deduplicator()
+    )
+    signal.signal(signal.SIGTERM, lambda *_: consumer.stop())
+    signal.signal(signal.SIGINT, lambda *_: consumer.stop())
+
+    logger.info("Aguardando mensagens. Para sair pressione CTRL+C")
+    try:
+        consumer.run()
+    finally:
+        mongo_client_registry.close()
+
+
+if __name__ == "__main__":
+    start_event_consumer()
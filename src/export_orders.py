@@ -0,0 +1,55 @@
+from pathlib import Path
+from datetime import datetime
+from argparse import ArgumentParser
+
+from config import ORDERS_EXPORT_BATCH_SIZE, ORDERS_EXPORT_ROW_GROUP_SIZE
+from application.dtos import ListOrdersFilterDTO
+from domain.enums import OrderStatus
+from infra.adapters import NoSqlAdapter, mongo_client_registry
+from infra.exports import OrdersColumnarExporter
+from infra.repositories import OrdersRepository
+
+
+def export_orders():
+    parser = ArgumentParser(
+        description="Export orders and their items to Parquet or Arrow files"
+    )
+    parser.add_argument("--output-dir", type=Path, default=Path("."))
+    parser.add_argument("--format", choices=["parquet", "arrow"], default="parquet")
+    parser.add_argument("--status", type=OrderStatus, default=None)
+    parser.add_argument("--created-from", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--created-to", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--batch-size", type=int, default=ORDERS_EXPORT_BATCH_SIZE)
+    parser.add_argument(
+        "--row-group-size", type=int, default=ORDERS_EXPORT_ROW_GROUP_SIZE
+    )
+    args = parser.parse_args()
+
+    repository = OrdersRepository(
+        adapter=NoSqlAdapter(client=mongo_client_registry.client)
+    )
+    exporter = OrdersColumnarExporter(
+        file_format=args.format, row_group_size=args.row_group_size
+    )
+    filters = ListOrdersFilterDTO(
+        status=args.status,
+        created_from=args.created_from,
+        created_to=args.created_to,
+    )
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(args.output_dir / f"orders.{args.format}", "wb") as orders_file:
+            with open(args.output_dir / f"items.{args.format}", "wb") as items_file:
+                exported = exporter.write(
+                    repository.export(filters, args.batch_size),
+                    orders_file,
+                    items_file,
+                )
+        print(f"{exported} orders exported to {args.output_dir}")
+    finally:
+        mongo_client_registry.close()
+
+
+if __name__ == "__main__":
+    export_orders()
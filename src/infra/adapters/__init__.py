@@ -1,3 +1,31 @@
 # pyright: reportUnusedImport=false
-from .publisher_adapter import PublisherAdapter
+from .mongo_client_registry import MongoClientRegistry, mongo_client_registry
 from .no_sql_adapter import NoSqlAdapter
+from .mongo_transaction_adapter import MongoTransactionAdapter
+from .outbox_publisher_adapter import OutboxPublisherAdapter
+from .async_rabbitmq_connection_pool import (
+    AsyncRabbitMQConnectionPool,
+    async_rabbitmq_connection_pool,
+)
+from .async_confirm_publisher import (
+    AsyncConfirmPublisher,
+    OutgoingMessage,
+    PublishNotConfirmedError,
+    async_confirm_publisher,
+)
+from .confirm_publisher import ConfirmPublisher, confirm_publisher
+from .publisher_adapter import PublisherAdapter
+from .async_publisher_adapter import AsyncPublisherAdapter
+from .async_mongo_client_registry import (
+    AsyncMongoClientRegistry,
+    async_mongo_client_registry,
+)
+from .async_no_sql_adapter import AsyncNoSqlAdapter
+from .async_mongo_transaction_adapter import AsyncMongoTransactionAdapter
+from .async_outbox_publisher_adapter import AsyncOutboxPublisherAdapter
+from .lru_ttl_cache import LruTtlCache, orders_cache
+from .redis_client_registry import RedisClientRegistry, redis_client_registry
+from .async_redis_client_registry import (
+    AsyncRedisClientRegistry,
+    async_redis_client_registry,
+)
@@ -0,0 +1,107 @@
+from asyncio import Semaphore, TimeoutError as AsyncTimeoutError, gather
+from typing import List, Optional
+from dataclasses import dataclass
+from aio_pika import DeliveryMode, Message
+from aio_pika.abc import AbstractExchange
+from aiormq.exceptions import AMQPError, ChannelInvalidStateError, DeliveryError
+from pamqp.commands import Basic
+
+from config import MQ_PUBLISH_WINDOW, MQ_PUBLISH_MAX_RETRIES, MQ_CONFIRM_TIMEOUT_MS
+
+from .async_rabbitmq_connection_pool import (
+    AsyncRabbitMQConnectionPool,
+    async_rabbitmq_connection_pool,
+)
+
+
+class PublishNotConfirmedError(Exception):
+    def __init__(self, unconfirmed: int) -> None:
+        super().__init__(f"{unconfirmed} message(s) were not confirmed by the broker")
+        self.unconfirmed = unconfirmed
+
+
+@dataclass(frozen=True)
+class OutgoingMessage:
+    routing_key: str
+    body: bytes
+    content_type: str = "application/json"
+    message_id: Optional[str] = None
+
+
+class AsyncConfirmPublisher:
+    """Publishes on confirm-mode channels without waiting message by message.
+
+    Up to ``max_in_flight`` messages are sent before their confirmations come
+    back; aiormq matches each ack/nack to its delivery tag. Nacked messages are
+    published again up to ``max_retries`` times. Retries may reach the broker
+    after later messages of the same call. A message whose confirmation does
+    not arrive within ``confirm_timeout_ms``, or whose channel or connection
+    fails, is reported as unconfirmed instead of failing the whole call.
+    """
+
+    def __init__(
+        self,
+        connection_pool: AsyncRabbitMQConnectionPool = async_rabbitmq_connection_pool,
+        max_in_flight: int = MQ_PUBLISH_WINDOW,
+        max_retries: int = MQ_PUBLISH_MAX_RETRIES,
+        confirm_timeout_ms: int = MQ_CONFIRM_TIMEOUT_MS,
+    ) -> None:
+        self.connection_pool = connection_pool
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.confirm_timeout_ms = confirm_timeout_ms
+        self.in_flight = 0
+
+    async def publish(
+        self, exchange: str, messages: List[OutgoingMessage]
+    ) -> List[bool]:
+        """Whether each message was confirmed, in the order given."""
+        if not messages:
+            return []
+
+        async with self.connection_pool.channel() as channel:
+            declared = await self.connection_pool.get_exchange(channel, exchange)
+            window = Semaphore(self.max_in_flight)
+            return list(
+                await gather(
+                    *(self.__publish(declared, message, window) for message in messages)
+                )
+            )
+
+    async def __publish(
+        self, exchange: AbstractExchange, message: OutgoingMessage, window: Semaphore
+    ) -> bool:
+        for _ in range(self.max_retries + 1):
+            async with window:
+                self.in_flight += 1
+                try:
+                    confirmation = await exchange.publish(
+                        Message(
+                            body=message.body,
+                            content_type=message.content_type,
+                            message_id=message.message_id,
+                            delivery_mode=DeliveryMode.PERSISTENT,
+                        ),
+                        routing_key=message.routing_key,
+                        timeout=self.confirm_timeout_ms / 1000,
+                    )
+                except DeliveryError:
+                    continue
+                except (
+                    AMQPError,
+                    ChannelInvalidStateError,
+                    ConnectionError,
+                    AsyncTimeoutError,
+                ):
+                    # the channel is gone or the broker went quiet: a retry on
+                    # it would fail the same way, the caller retries later.
+                    return False
+                finally:
+                    self.in_flight -= 1
+            # a returned (unroutable) message is not an ack and retrying would
+            # not change that.
+            return isinstance(confirmation, Basic.Ack)
+        return False
+
+
+async_confirm_publisher = AsyncConfirmPublisher()
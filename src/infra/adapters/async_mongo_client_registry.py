@@ -0,0 +1,54 @@
+from typing import Any, Dict, Optional
+from threading import Lock
+from pymongo import AsyncMongoClient
+
+from config import (
+    MONGO_HOST,
+    MONGO_PORT,
+    MONGO_PASSWORD,
+    MONGO_USERNAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    MONGO_DIRECT_CONNECTION,
+)
+
+
+class AsyncMongoClientRegistry:
+    def __init__(self) -> None:
+        self.__client: Optional[AsyncMongoClient[Dict[str, Any]]] = None
+        self.__lock = Lock()
+
+    @property
+    def client(self) -> AsyncMongoClient[Dict[str, Any]]:
+        if self.__client is None:
+            with self.__lock:
+                if self.__client is None:
+                    self.__client = self.__create_client()
+        return self.__client
+
+    def __create_client(self) -> AsyncMongoClient[Dict[str, Any]]:
+        return AsyncMongoClient(
+            host=MONGO_HOST,
+            port=int(MONGO_PORT),
+            username=MONGO_USERNAME,
+            password=MONGO_PASSWORD,
+            authSource="admin",
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            directConnection=MONGO_DIRECT_CONNECTION,
+            tz_aware=True,
+        )
+
+    async def close(self) -> None:
+        with self.__lock:
+            client = self.__client
+            self.__client = None
+        if client is not None:
+            await client.close()
+
+
+async_mongo_client_registry = AsyncMongoClientRegistry()
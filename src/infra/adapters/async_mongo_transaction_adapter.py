@@ -0,0 +1,54 @@
+from typing import Awaitable, Callable, List, Optional, TypeVar
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from config import MONGO_TRANSACTIONS_ENABLED
+from application.adapters import AsyncTransactionAdapterInterface
+
+from .async_no_sql_adapter import AsyncNoSqlAdapter
+
+T = TypeVar("T")
+
+
+class AsyncMongoTransactionAdapter(AsyncTransactionAdapterInterface):
+    def __init__(
+        self, adapter: AsyncNoSqlAdapter, enabled: bool = MONGO_TRANSACTIONS_ENABLED
+    ) -> None:
+        self.adapter = adapter
+        self.enabled = enabled
+        self.__callbacks: Optional[List[Callable[[], Awaitable[None]]]] = None
+
+    async def execute(self, operation: Callable[[], Awaitable[T]]) -> T:
+        if not self.enabled:
+            self.__callbacks = []
+            try:
+                return await operation()
+            finally:
+                await self.__run_callbacks()
+
+        async def run(session: AsyncClientSession) -> T:
+            self.adapter.session = session
+            self.__callbacks = []
+            try:
+                return await operation()
+            finally:
+                self.adapter.session = None
+
+        try:
+            async with self.adapter.client.start_session() as session:
+                result = await session.with_transaction(run)
+        except BaseException:
+            self.__callbacks = None
+            raise
+        await self.__run_callbacks()
+        return result
+
+    async def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        if self.__callbacks is None:
+            await callback()
+        else:
+            self.__callbacks.append(callback)
+
+    async def __run_callbacks(self) -> None:
+        callbacks, self.__callbacks = self.__callbacks or [], None
+        for callback in callbacks:
+            await callback()
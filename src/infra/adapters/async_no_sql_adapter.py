@@ -0,0 +1,17 @@
+from typing import Any, Dict, Optional
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from config import MONGO_DATABASE
+from .async_mongo_client_registry import async_mongo_client_registry
+
+
+class AsyncNoSqlAdapter:
+    def __init__(
+        self, client: Optional[AsyncMongoClient[Dict[str, Any]]] = None
+    ) -> None:
+        self.client = (
+            client if client is not None else async_mongo_client_registry.client
+        )
+        self.database = self.client[MONGO_DATABASE]
+        self.session: Optional[AsyncClientSession] = None
@@ -0,0 +1,37 @@
+from typing import List
+
+from application.adapters import AsyncPublisherAdapterInterface
+from domain.events import DomainEvent
+from infra.serializers import Serializer, event_serializer
+
+from .async_no_sql_adapter import AsyncNoSqlAdapter
+from .outbox_publisher_adapter import OutboxPublisherAdapter
+
+
+class AsyncOutboxPublisherAdapter(AsyncPublisherAdapterInterface):
+    def __init__(
+        self,
+        adapter: AsyncNoSqlAdapter,
+        topic_name: str = "orders",
+        serializer: Serializer = event_serializer,
+    ) -> None:
+        self.adapter = adapter
+        self.topic_name = topic_name
+        self.serializer = serializer
+        self.collection = adapter.database["outbox"]
+
+    async def publish_event(self, event: DomainEvent) -> None:
+        await self.publish_events([event])
+
+    async def publish_events(self, events: List[DomainEvent]) -> None:
+        if not events:
+            return
+        await self.collection.insert_many(
+            [
+                OutboxPublisherAdapter.to_outbox_entry(
+                    event, self.topic_name, self.serializer
+                )
+                for event in events
+            ],
+            session=self.adapter.session,
+        )
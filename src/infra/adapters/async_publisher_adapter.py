@@ -0,0 +1,64 @@
+from typing import Any, Dict, List, Optional
+
+from application.adapters import (
+    AsyncPublisherAdapterInterface,
+    AsyncTransactionAdapterInterface,
+)
+from domain.events import DomainEvent
+from infra.serializers import Serializer, event_serializer
+
+from .async_confirm_publisher import (
+    AsyncConfirmPublisher,
+    OutgoingMessage,
+    PublishNotConfirmedError,
+    async_confirm_publisher,
+)
+
+
+class AsyncPublisherAdapter(AsyncPublisherAdapterInterface):
+    def __init__(
+        self,
+        topic_name: str = "orders",
+        publisher: AsyncConfirmPublisher = async_confirm_publisher,
+        serializer: Serializer = event_serializer,
+        transaction: Optional[AsyncTransactionAdapterInterface] = None,
+    ) -> None:
+        self.topic_name = topic_name
+        self.publisher = publisher
+        self.serializer = serializer
+        self.transaction = transaction
+
+    async def publish(self, event_name: str, payload: Dict[str, Any]):
+        await self.__publish_all([self.__to_message(event_name, payload)])
+
+    async def publish_event(self, event: DomainEvent):
+        await self.publish(event_name=event.event_name, payload=event.to_dict())
+
+    async def publish_events(self, events: List[DomainEvent]) -> None:
+        if not events:
+            return
+
+        await self.__publish_all(
+            [self.__to_message(event.event_name, event.to_dict()) for event in events]
+        )
+
+    async def __publish_all(self, messages: List[OutgoingMessage]) -> None:
+        if self.transaction is None:
+            await self.__send(messages)
+            return
+        # a send made inside the transaction would be repeated when it is
+        # retried and would still go out if it aborts, so it waits for commit.
+        await self.transaction.after_commit(lambda: self.__send(messages))
+
+    async def __send(self, messages: List[OutgoingMessage]) -> None:
+        confirmed = await self.publisher.publish(self.topic_name, messages)
+        unconfirmed = confirmed.count(False)
+        if unconfirmed:
+            raise PublishNotConfirmedError(unconfirmed)
+
+    def __to_message(self, event_name: str, payload: Dict[str, Any]) -> OutgoingMessage:
+        return OutgoingMessage(
+            routing_key=event_name,
+            body=self.serializer.dumps(payload),
+            content_type=self.serializer.content_type,
+        )
@@ -0,0 +1,67 @@
+from asyncio import Lock
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Set
+from aio_pika import ExchangeType, connect_robust
+from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractRobustConnection
+from aio_pika.pool import Pool
+
+from config import MQ_HOST, MQ_PASSWORD, MQ_USER, MQ_PORT, MQ_HEARTBEAT
+from config import MQ_CHANNEL_POOL_SIZE
+
+
+class AsyncRabbitMQConnectionPool:
+    def __init__(self, max_channels: int = MQ_CHANNEL_POOL_SIZE) -> None:
+        self.max_channels = max_channels
+        self.__connection: Optional[AbstractRobustConnection] = None
+        self.__channel_pool: Optional[Pool[AbstractChannel]] = None
+        self.__declared_exchanges: Set[str] = set()
+        self.__lock = Lock()
+
+    @asynccontextmanager
+    async def channel(self) -> AsyncIterator[AbstractChannel]:
+        channel_pool = await self.__get_channel_pool()
+        async with channel_pool.acquire() as channel:
+            yield channel
+
+    async def get_exchange(
+        self, channel: AbstractChannel, exchange: str
+    ) -> AbstractExchange:
+        if exchange in self.__declared_exchanges:
+            return await channel.get_exchange(exchange, ensure=False)
+        declared = await channel.declare_exchange(
+            exchange, ExchangeType.TOPIC, durable=True
+        )
+        self.__declared_exchanges.add(exchange)
+        return declared
+
+    async def close(self) -> None:
+        async with self.__lock:
+            channel_pool, connection = self.__channel_pool, self.__connection
+            self.__channel_pool = None
+            self.__connection = None
+            self.__declared_exchanges = set()
+        if channel_pool is not None:
+            await channel_pool.close()
+        if connection is not None:
+            await connection.close()
+
+    async def __get_channel_pool(self) -> Pool[AbstractChannel]:
+        if self.__channel_pool is None:
+            async with self.__lock:
+                if self.__channel_pool is None:
+                    # a robust connection reconnects and restores its channels
+                    # on broker drops, so the pool never needs to be rebuilt.
+                    self.__connection = await connect_robust(
+                        host=MQ_HOST,
+                        port=int(MQ_PORT),
+                        login=MQ_USER,
+                        password=MQ_PASSWORD,
+                        heartbeat=MQ_HEARTBEAT,
+                    )
+                    self.__channel_pool = Pool(
+                        self.__connection.channel, max_size=self.max_channels
+                    )
+        return self.__channel_pool
+
+
+async_rabbitmq_connection_pool = AsyncRabbitMQConnectionPool()
@@ -0,0 +1,32 @@
+from typing import Optional
+from threading import Lock
+from redis.asyncio import Redis
+
+from config import REDIS_URL, REDIS_MAX_CONNECTIONS
+
+
+class AsyncRedisClientRegistry:
+    def __init__(self) -> None:
+        self.__client: Optional["Redis[bytes]"] = None
+        self.__lock = Lock()
+
+    @property
+    def client(self) -> "Redis[bytes]":
+        if self.__client is None:
+            with self.__lock:
+                if self.__client is None:
+                    self.__client = self.__create_client()
+        return self.__client
+
+    def __create_client(self) -> "Redis[bytes]":
+        return Redis.from_url(REDIS_URL, max_connections=REDIS_MAX_CONNECTIONS)
+
+    async def close(self) -> None:
+        with self.__lock:
+            client = self.__client
+            self.__client = None
+        if client is not None:
+            await client.aclose()
+
+
+async_redis_client_registry = AsyncRedisClientRegistry()
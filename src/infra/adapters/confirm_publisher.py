@@ -0,0 +1,92 @@
+import os
+from asyncio import AbstractEventLoop, new_event_loop, run_coroutine_threadsafe
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from threading import Lock, Thread
+from typing import Callable, List, Optional, Tuple
+
+from config import (
+    MQ_PUBLISH_WINDOW,
+    MQ_PUBLISH_MAX_RETRIES,
+    MQ_CONFIRM_TIMEOUT_MS,
+    MQ_PUBLISH_TIMEOUT_MS,
+)
+
+from .async_rabbitmq_connection_pool import AsyncRabbitMQConnectionPool
+from .async_confirm_publisher import AsyncConfirmPublisher, OutgoingMessage
+
+
+class ConfirmPublisher:
+    """Blocking facade over AsyncConfirmPublisher for synchronous callers.
+
+    pika's BlockingChannel waits for each confirmation before sending the next
+    message, so pipelined confirms run on an aio-pika connection owned by a
+    background event loop thread. A call that is not settled within
+    ``publish_timeout_ms`` is cancelled and its messages reported unconfirmed.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = MQ_PUBLISH_WINDOW,
+        max_retries: int = MQ_PUBLISH_MAX_RETRIES,
+        confirm_timeout_ms: int = MQ_CONFIRM_TIMEOUT_MS,
+        publish_timeout_ms: int = MQ_PUBLISH_TIMEOUT_MS,
+        connection_pool_factory: Callable[
+            [], AsyncRabbitMQConnectionPool
+        ] = AsyncRabbitMQConnectionPool,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.confirm_timeout_ms = confirm_timeout_ms
+        self.publish_timeout_ms = publish_timeout_ms
+        self.connection_pool_factory = connection_pool_factory
+        self.__loop: Optional[AbstractEventLoop] = None
+        self.__thread: Optional[Thread] = None
+        self.__publisher: Optional[AsyncConfirmPublisher] = None
+        self.__owner_pid: Optional[int] = None
+        self.__lock = Lock()
+
+    def publish(self, exchange: str, messages: List[OutgoingMessage]) -> List[bool]:
+        loop, publisher = self.__start()
+        future = run_coroutine_threadsafe(publisher.publish(exchange, messages), loop)
+        try:
+            return future.result(timeout=self.publish_timeout_ms / 1000)
+        except FutureTimeoutError:
+            future.cancel()
+            return [False] * len(messages)
+
+    def close(self) -> None:
+        with self.__lock:
+            loop, thread, publisher = self.__loop, self.__thread, self.__publisher
+            self.__loop = self.__thread = self.__publisher = None
+            if loop is None or publisher is None or self.__owner_pid != os.getpid():
+                return
+        run_coroutine_threadsafe(publisher.connection_pool.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
+        loop.close()
+
+    def __start(self) -> Tuple[AbstractEventLoop, AsyncConfirmPublisher]:
+        with self.__lock:
+            if self.__owner_pid != os.getpid():
+                # a loop thread started by the parent process does not exist
+                # in a forked worker, so each process starts its own.
+                self.__loop = self.__thread = self.__publisher = None
+                self.__owner_pid = os.getpid()
+            if self.__loop is None or self.__publisher is None:
+                loop = new_event_loop()
+                self.__thread = Thread(
+                    target=loop.run_forever, name="confirm-publisher", daemon=True
+                )
+                self.__thread.start()
+                self.__publisher = AsyncConfirmPublisher(
+                    connection_pool=self.connection_pool_factory(),
+                    max_in_flight=self.max_in_flight,
+                    max_retries=self.max_retries,
+                    confirm_timeout_ms=self.confirm_timeout_ms,
+                )
+                self.__loop = loop
+            return self.__loop, self.__publisher
+
+
+confirm_publisher = ConfirmPublisher()
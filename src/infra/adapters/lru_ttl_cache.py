@@ -0,0 +1,72 @@
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+from config import ORDERS_CACHE_MAX_SIZE, ORDERS_CACHE_TTL_SECONDS
+
+V = TypeVar("V")
+
+
+class LruTtlCache(Generic[V]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__clock = clock
+        self.__entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self.__clock():
+                del self.__entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self.__lock:
+            self.__entries[key] = (self.__clock() + self.ttl_seconds, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+# order documents by id, local to this process: writes made by other API
+# workers are only seen once an entry expires.
+orders_cache: LruTtlCache[Dict[str, Any]] = LruTtlCache(
+    max_size=ORDERS_CACHE_MAX_SIZE, ttl_seconds=ORDERS_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,53 @@
+from typing import Any, Dict, Optional
+from threading import Lock
+from pymongo import MongoClient
+
+from config import (
+    MONGO_HOST,
+    MONGO_PORT,
+    MONGO_PASSWORD,
+    MONGO_USERNAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_MAX_IDLE_TIME_MS,
+    MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    MONGO_DIRECT_CONNECTION,
+)
+
+
+class MongoClientRegistry:
+    def __init__(self) -> None:
+        self.__client: Optional[MongoClient[Dict[str, Any]]] = None
+        self.__lock = Lock()
+
+    @property
+    def client(self) -> MongoClient[Dict[str, Any]]:
+        if self.__client is None:
+            with self.__lock:
+                if self.__client is None:
+                    self.__client = self.__create_client()
+        return self.__client
+
+    def __create_client(self) -> MongoClient[Dict[str, Any]]:
+        return MongoClient(
+            host=MONGO_HOST,
+            port=int(MONGO_PORT),
+            username=MONGO_USERNAME,
+            password=MONGO_PASSWORD,
+            authSource="admin",
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            directConnection=MONGO_DIRECT_CONNECTION,
+            tz_aware=True,
+        )
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__client is not None:
+                self.__client.close()
+                self.__client = None
+
+
+mongo_client_registry = MongoClientRegistry()
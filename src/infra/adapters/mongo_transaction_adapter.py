@@ -0,0 +1,60 @@
+from typing import Callable, List, Optional, TypeVar
+from pymongo.client_session import ClientSession
+
+from config import MONGO_TRANSACTIONS_ENABLED
+from application.adapters import TransactionAdapterInterface
+
+from .no_sql_adapter import NoSqlAdapter
+
+T = TypeVar("T")
+
+
+class MongoTransactionAdapter(TransactionAdapterInterface):
+    def __init__(
+        self, adapter: NoSqlAdapter, enabled: bool = MONGO_TRANSACTIONS_ENABLED
+    ) -> None:
+        self.adapter = adapter
+        self.enabled = enabled
+        self.__callbacks: Optional[List[Callable[[], None]]] = None
+
+    def execute(self, operation: Callable[[], T]) -> T:
+        if not self.enabled:
+            # without a transaction every write is durable as soon as it is
+            # made, even if the operation fails halfway, so callbacks always run.
+            self.__callbacks = []
+            try:
+                return operation()
+            finally:
+                self.__run_callbacks()
+
+        try:
+            with self.adapter.client.start_session() as session:
+                result = session.with_transaction(
+                    lambda current_session: self.__run(current_session, operation)
+                )
+        except BaseException:
+            self.__callbacks = None
+            raise
+        self.__run_callbacks()
+        return result
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        if self.__callbacks is None:
+            callback()
+        else:
+            self.__callbacks.append(callback)
+
+    def __run(self, session: ClientSession, operation: Callable[[], T]) -> T:
+        self.adapter.session = session
+        # with_transaction retries the whole operation on transient errors, so
+        # only the callbacks of the attempt that commits are kept.
+        self.__callbacks = []
+        try:
+            return operation()
+        finally:
+            self.adapter.session = None
+
+    def __run_callbacks(self) -> None:
+        callbacks, self.__callbacks = self.__callbacks or [], None
+        for callback in callbacks:
+            callback()
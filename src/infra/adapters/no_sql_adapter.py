@@ -1,21 +1,13 @@
+from typing import Any, Dict, Optional
 from pymongo import MongoClient
+from pymongo.client_session import ClientSession
 
-from config import (
-    MONGO_HOST,
-    MONGO_PORT,
-    MONGO_PASSWORD,
-    MONGO_USERNAME,
-    MONGO_DATABASE,
-)
+from config import MONGO_DATABASE
+from .mongo_client_registry import mongo_client_registry
 
 
 class NoSqlAdapter:
-    def __init__(self) -> None:
-        self.client = MongoClient(
-            host=MONGO_HOST,
-            port=int(MONGO_PORT),
-            username=MONGO_USERNAME,
-            password=MONGO_PASSWORD,
-            authSource="admin",
-        )
+    def __init__(self, client: Optional[MongoClient[Dict[str, Any]]] = None) -> None:
+        self.client = client if client is not None else mongo_client_registry.client
         self.database = self.client[MONGO_DATABASE]
+        self.session: Optional[ClientSession] = None
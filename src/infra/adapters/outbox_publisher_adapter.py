@@ -0,0 +1,52 @@
+from typing import Any, Dict, List
+from datetime import datetime, timezone
+
+from application.adapters import PublisherAdapterInterface
+from domain.events import DomainEvent
+from infra.serializers import Serializer, event_serializer
+
+from .no_sql_adapter import NoSqlAdapter
+
+
+class OutboxPublisherAdapter(PublisherAdapterInterface):
+    def __init__(
+        self,
+        adapter: NoSqlAdapter,
+        topic_name: str = "orders",
+        serializer: Serializer = event_serializer,
+    ) -> None:
+        self.adapter = adapter
+        self.topic_name = topic_name
+        self.serializer = serializer
+        self.collection = adapter.database["outbox"]
+
+    @staticmethod
+    def to_outbox_entry(
+        event: DomainEvent, exchange: str, serializer: Serializer = event_serializer
+    ) -> Dict[str, Any]:
+        return {
+            "eventId": str(event.event_id),
+            "eventName": event.event_name,
+            "exchange": exchange,
+            "contentType": serializer.content_type,
+            "body": serializer.dumps(event.to_dict()),
+            "createdAt": datetime.now(timezone.utc),
+            "publishedAt": None,
+            "attempts": 0,
+            "leaseUntil": None,
+            "deadLetteredAt": None,
+        }
+
+    def publish_event(self, event: DomainEvent) -> None:
+        self.publish_events([event])
+
+    def publish_events(self, events: List[DomainEvent]) -> None:
+        if not events:
+            return
+        self.collection.insert_many(
+            [
+                self.to_outbox_entry(event, self.topic_name, self.serializer)
+                for event in events
+            ],
+            session=self.adapter.session,
+        )
@@ -1,45 +1,57 @@
-from typing import Any, Dict, List
-from json import dumps
-from pika import (
-    ConnectionParameters,
-    BlockingConnection,
-    PlainCredentials,
-    BasicProperties,
-)
-
-from config import MQ_HOST, MQ_PASSWORD, MQ_USER, MQ_PORT
-from application.adapters import PublisherAdapterInterface
+from typing import Any, Dict, List, Optional
+
+from application.adapters import PublisherAdapterInterface, TransactionAdapterInterface
 from domain.events import DomainEvent
+from infra.serializers import Serializer, event_serializer
+
+from .async_confirm_publisher import OutgoingMessage, PublishNotConfirmedError
+from .confirm_publisher import ConfirmPublisher, confirm_publisher
 
 
 class PublisherAdapter(PublisherAdapterInterface):
-    def __init__(self, topic_name: str = "orders") -> None:
-        self.connection = BlockingConnection(
-            ConnectionParameters(
-                host=MQ_HOST,
-                port=int(MQ_PORT),
-                credentials=PlainCredentials(MQ_USER, MQ_PASSWORD),
-            )
-        )
+    def __init__(
+        self,
+        topic_name: str = "orders",
+        publisher: ConfirmPublisher = confirm_publisher,
+        serializer: Serializer = event_serializer,
+        transaction: Optional[TransactionAdapterInterface] = None,
+    ) -> None:
         self.topic_name = topic_name
-        self.channel = self.connection.channel()
-        self.channel.exchange_declare(
-            exchange=self.topic_name, exchange_type="topic", durable=True
-        )
+        self.publisher = publisher
+        self.serializer = serializer
+        self.transaction = transaction
 
     def publish(self, event_name: str, payload: Dict[str, Any]):
-        self.channel.basic_publish(
-            exchange=self.topic_name,
-            routing_key=event_name,
-            body=dumps(payload, default=str),
-            properties=BasicProperties(
-                content_type="application/json", delivery_mode=2
-            ),
-        )
+        self.__publish_all([self.__to_message(event_name, payload)])
 
     def publish_event(self, event: DomainEvent):
         self.publish(event_name=event.event_name, payload=event.to_dict())
 
     def publish_events(self, events: List[DomainEvent]) -> None:
-        for event in events:
-            self.publish_event(event)
+        if not events:
+            return
+
+        self.__publish_all(
+            [self.__to_message(event.event_name, event.to_dict()) for event in events]
+        )
+
+    def __publish_all(self, messages: List[OutgoingMessage]) -> None:
+        if self.transaction is None:
+            self.__send(messages)
+            return
+        # a send made inside the transaction would be repeated when it is
+        # retried and would still go out if it aborts, so it waits for commit.
+        self.transaction.after_commit(lambda: self.__send(messages))
+
+    def __send(self, messages: List[OutgoingMessage]) -> None:
+        confirmed = self.publisher.publish(self.topic_name, messages)
+        unconfirmed = confirmed.count(False)
+        if unconfirmed:
+            raise PublishNotConfirmedError(unconfirmed)
+
+    def __to_message(self, event_name: str, payload: Dict[str, Any]) -> OutgoingMessage:
+        return OutgoingMessage(
+            routing_key=event_name,
+            body=self.serializer.dumps(payload),
+            content_type=self.serializer.content_type,
+        )
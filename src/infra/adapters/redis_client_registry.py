@@ -0,0 +1,31 @@
+from typing import Optional
+from threading import Lock
+from redis import Redis
+
+from config import REDIS_URL, REDIS_MAX_CONNECTIONS
+
+
+class RedisClientRegistry:
+    def __init__(self) -> None:
+        self.__client: Optional["Redis[bytes]"] = None
+        self.__lock = Lock()
+
+    @property
+    def client(self) -> "Redis[bytes]":
+        if self.__client is None:
+            with self.__lock:
+                if self.__client is None:
+                    self.__client = self.__create_client()
+        return self.__client
+
+    def __create_client(self) -> "Redis[bytes]":
+        return Redis.from_url(REDIS_URL, max_connections=REDIS_MAX_CONNECTIONS)
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__client is not None:
+                self.__client.close()
+                self.__client = None
+
+
+redis_client_registry = RedisClientRegistry()
@@ -0,0 +1,8 @@
+# pyright: reportUnusedImport=false
+from .orders_arrow_schema import ORDERS_SCHEMA, ORDER_ITEMS_SCHEMA
+from .orders_columnar_exporter import (
+    ColumnarFormat,
+    OrdersColumnarExporter,
+    OrdersColumnBuffer,
+    OrdersTable,
+)
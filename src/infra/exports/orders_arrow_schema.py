@@ -0,0 +1,44 @@
+from decimal import Decimal
+from typing import Dict
+
+import pyarrow as pa
+
+from domain.enums import OrderStatus
+
+UUID_TYPE = pa.uuid()
+# BSON dates keep milliseconds only.
+TIMESTAMP_TYPE = pa.timestamp("ms", tz="UTC")
+DECIMAL_SCALE = 4
+DECIMAL_TYPE = pa.decimal128(20, DECIMAL_SCALE)
+DECIMAL_QUANTUM = Decimal(1).scaleb(-DECIMAL_SCALE)
+# every row group shares the same dictionary, so the status codes mean the
+# same thing across row groups and files.
+STATUS_TYPE = pa.dictionary(pa.int8(), pa.string())
+STATUS_DICTIONARY = pa.array([status.value for status in OrderStatus], pa.string())
+STATUS_CODES: Dict[str, int] = {
+    status.value: code for code, status in enumerate(OrderStatus)
+}
+
+ORDERS_SCHEMA = pa.schema(
+    [
+        pa.field("id", UUID_TYPE, nullable=False),
+        pa.field("customer_id", UUID_TYPE, nullable=False),
+        pa.field("shipping_address", pa.string()),
+        pa.field("status", STATUS_TYPE, nullable=False),
+        pa.field("created_at", TIMESTAMP_TYPE, nullable=False),
+        pa.field("updated_at", TIMESTAMP_TYPE, nullable=False),
+        pa.field("total_amount", DECIMAL_TYPE, nullable=False),
+        pa.field("items_count", pa.int32(), nullable=False),
+    ]
+)
+ORDER_ITEMS_SCHEMA = pa.schema(
+    [
+        pa.field("order_id", UUID_TYPE, nullable=False),
+        pa.field("order_created_at", TIMESTAMP_TYPE, nullable=False),
+        pa.field("product_id", UUID_TYPE, nullable=False),
+        pa.field("product_name", pa.string()),
+        pa.field("quantity", pa.int32(), nullable=False),
+        pa.field("unit_price", DECIMAL_TYPE, nullable=False),
+        pa.field("subtotal", DECIMAL_TYPE, nullable=False),
+    ]
+)
@@ -0,0 +1,205 @@
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterable, Iterator, List
+from typing import Literal, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config import ORDERS_EXPORT_ROW_GROUP_SIZE
+from .orders_arrow_schema import (
+    DECIMAL_QUANTUM,
+    ORDER_ITEMS_SCHEMA,
+    ORDERS_SCHEMA,
+    STATUS_CODES,
+    STATUS_DICTIONARY,
+    STATUS_TYPE,
+    UUID_TYPE,
+)
+
+ColumnarFormat = Literal["parquet", "arrow"]
+OrdersTable = Literal["orders", "items"]
+TableWriter = Union[pq.ParquetWriter, pa.RecordBatchFileWriter]
+
+TABLE_SCHEMAS: Dict[str, pa.Schema] = {
+    "orders": ORDERS_SCHEMA,
+    "items": ORDER_ITEMS_SCHEMA,
+}
+
+
+def to_array(field: pa.Field, values: List[Any]) -> pa.Array:
+    if field.type == UUID_TYPE:
+        return pa.ExtensionArray.from_storage(
+            UUID_TYPE, pa.array(values, pa.binary(16))
+        )
+    if field.type == STATUS_TYPE:
+        return pa.DictionaryArray.from_arrays(
+            pa.array(values, pa.int8()), STATUS_DICTIONARY
+        )
+    return pa.array(values, field.type)
+
+
+class OrdersColumnBuffer:
+    """Export rows of one row group, kept column by column; items are
+    flattened into their own table."""
+
+    def __init__(self) -> None:
+        self.orders: Dict[str, List[Any]] = {name: [] for name in ORDERS_SCHEMA.names}
+        self.items: Dict[str, List[Any]] = {
+            name: [] for name in ORDER_ITEMS_SCHEMA.names
+        }
+
+    def __len__(self) -> int:
+        return len(self.orders["id"])
+
+    def add(self, row: Dict[str, Any]) -> None:
+        order_id = row["id"].bytes
+        created_at = row["createdAt"]
+        orders = self.orders
+        orders["id"].append(order_id)
+        orders["customer_id"].append(row["customerId"].bytes)
+        orders["shipping_address"].append(row["shippingAddress"])
+        orders["status"].append(STATUS_CODES[row["status"]])
+        orders["created_at"].append(created_at)
+        orders["updated_at"].append(row["updatedAt"])
+        orders["total_amount"].append(row["totalAmount"].quantize(DECIMAL_QUANTUM))
+        orders["items_count"].append(len(row["items"]))
+
+        items = self.items
+        for item in row["items"]:
+            unit_price = item["unityPrice"]
+            items["order_id"].append(order_id)
+            items["order_created_at"].append(created_at)
+            items["product_id"].append(item["productId"].bytes)
+            items["product_name"].append(item["productName"])
+            items["quantity"].append(item["quantity"])
+            items["unit_price"].append(unit_price.quantize(DECIMAL_QUANTUM))
+            items["subtotal"].append(
+                (unit_price * item["quantity"]).quantize(DECIMAL_QUANTUM)
+            )
+
+    def batch(self, table: OrdersTable) -> pa.RecordBatch:
+        schema = TABLE_SCHEMAS[table]
+        columns = self.orders if table == "orders" else self.items
+        return pa.RecordBatch.from_arrays(
+            [to_array(field, columns[field.name]) for field in schema], schema=schema
+        )
+
+
+class ChunkSink:
+    """Write-only file object that hands back whatever the writer has
+    produced so far, so a file can be streamed while it is written."""
+
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class OrdersColumnarExporter:
+    def __init__(
+        self,
+        file_format: ColumnarFormat = "parquet",
+        row_group_size: int = ORDERS_EXPORT_ROW_GROUP_SIZE,
+    ) -> None:
+        self.file_format = file_format
+        self.row_group_size = row_group_size
+
+    def open_writer(self, sink: Any, schema: pa.Schema) -> TableWriter:
+        if self.file_format == "parquet":
+            return pq.ParquetWriter(sink, schema, compression="zstd")
+        return pa.ipc.new_file(sink, schema)
+
+    def row_groups(
+        self, rows: Iterable[Dict[str, Any]]
+    ) -> Iterator[OrdersColumnBuffer]:
+        buffer = OrdersColumnBuffer()
+        for row in rows:
+            buffer.add(row)
+            if len(buffer) >= self.row_group_size:
+                yield buffer
+                buffer = OrdersColumnBuffer()
+        if len(buffer):
+            yield buffer
+
+    async def row_groups_async(
+        self, rows: AsyncIterator[Dict[str, Any]]
+    ) -> AsyncIterator[OrdersColumnBuffer]:
+        buffer = OrdersColumnBuffer()
+        async for row in rows:
+            buffer.add(row)
+            if len(buffer) >= self.row_group_size:
+                yield buffer
+                buffer = OrdersColumnBuffer()
+        if len(buffer):
+            yield buffer
+
+    def write(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        orders_sink: BinaryIO,
+        items_sink: BinaryIO,
+    ) -> int:
+        orders_writer = self.open_writer(orders_sink, ORDERS_SCHEMA)
+        items_writer = self.open_writer(items_sink, ORDER_ITEMS_SCHEMA)
+        exported = 0
+        try:
+            for buffer in self.row_groups(rows):
+                orders_writer.write_batch(buffer.batch("orders"))
+                items_writer.write_batch(buffer.batch("items"))
+                exported += len(buffer)
+        finally:
+            orders_writer.close()
+            items_writer.close()
+        return exported
+
+    def stream(
+        self, rows: Iterable[Dict[str, Any]], table: OrdersTable
+    ) -> Iterator[bytes]:
+        sink = ChunkSink()
+        writer = self.open_writer(sink, TABLE_SCHEMAS[table])
+        try:
+            for buffer in self.row_groups(rows):
+                writer.write_batch(buffer.batch(table))
+                yield sink.drain()
+            writer.close()
+            yield sink.drain()
+        finally:
+            # closing the stream early closes the rows, and with them the cursor.
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    async def stream_async(
+        self, rows: AsyncIterator[Dict[str, Any]], table: OrdersTable
+    ) -> AsyncIterator[bytes]:
+        sink = ChunkSink()
+        writer = self.open_writer(sink, TABLE_SCHEMAS[table])
+        try:
+            async for buffer in self.row_groups_async(rows):
+                writer.write_batch(buffer.batch(table))
+                yield sink.drain()
+            writer.close()
+            yield sink.drain()
+        finally:
+            close = getattr(rows, "aclose", None)
+            if close is not None:
+                await close()
@@ -1,2 +1,8 @@
 # pyright: reportUnusedImport=false
 from .orders_repository import OrdersRepository
+from .async_orders_repository import AsyncOrdersRepository
+from .cached_orders_repository import CachedOrdersRepository
+from .async_cached_orders_repository import AsyncCachedOrdersRepository
+from .redis_cached_orders_repository import RedisCachedOrdersRepository
+from .async_redis_cached_orders_repository import AsyncRedisCachedOrdersRepository
+from .orders_bson_migration import OrdersBsonMigration, LEGACY_ORDERS_FILTER
@@ -0,0 +1,128 @@
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set
+from uuid import UUID
+from application.adapters import AsyncTransactionAdapterInterface
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
+from domain.entities import Order
+from domain.enums.order_status import OrderStatus
+
+from infra.adapters import LruTtlCache
+from .orders_repository import OrdersRepository
+
+
+class AsyncCachedOrdersRepository(AsyncOrderRepositoryInterface):
+    def __init__(
+        self,
+        repository: AsyncOrderRepositoryInterface,
+        cache: LruTtlCache[Dict[str, Any]],
+        transaction: Optional[AsyncTransactionAdapterInterface] = None,
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.transaction = transaction
+
+    async def invalidate(self, order_ids: Iterable[UUID]) -> None:
+        keys = [str(order_id) for order_id in order_ids]
+
+        async def invalidate_keys() -> None:
+            for key in keys:
+                self.cache.invalidate(key)
+
+        if self.transaction is None:
+            await invalidate_keys()
+        else:
+            await self.transaction.after_commit(invalidate_keys)
+
+    async def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        if item_fields is not None:
+            # only whole orders are cached.
+            return await self.repository.find_by_id(order_id, item_fields)
+        order = self.__cached(order_id)
+        if order is None:
+            order = await self.repository.find_by_id(order_id)
+            if order is not None:
+                self.__store(order)
+        return order
+
+    async def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        return await self.repository.find_summary_by_id(order_id)
+
+    async def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        if item_fields is not None:
+            return await self.repository.find_many(order_ids, item_fields)
+        orders: List[Order] = []
+        missing: List[UUID] = []
+        for order_id in order_ids:
+            order = self.__cached(order_id)
+            if order is None:
+                missing.append(order_id)
+            else:
+                orders.append(order)
+        if missing:
+            for order in await self.repository.find_many(missing):
+                self.__store(order)
+                orders.append(order)
+        return orders
+
+    async def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        return await self.repository.find_page(
+            filters=filters, limit=limit, cursor=cursor, item_fields=item_fields
+        )
+
+    async def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        return await self.repository.find_for_transition(order_ids, new_status)
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.repository.export(filters, batch_size)
+
+    async def save(self, order: Order) -> bool:
+        saved = await self.repository.save(order)
+        await self.invalidate([order.id])
+        return saved
+
+    async def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        errors = await self.repository.save_many(orders)
+        await self.invalidate(order.id for order in orders)
+        return errors
+
+    async def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        updated = await self.repository.update_status(order_id, new_status)
+        await self.invalidate([order_id])
+        return updated
+
+    async def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        previous_order = await self.repository.transition_status(order_id, new_status)
+        await self.invalidate([order_id])
+        return previous_order
+
+    async def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        transitioned = await self.repository.transition_status_many(orders, new_status)
+        await self.invalidate(transitioned)
+        return transitioned
+
+    def __cached(self, order_id: UUID) -> Optional[Order]:
+        # the cache holds documents and every hit builds its own entity, so
+        # concurrent requests never share (and mutate) one Order instance.
+        document = self.cache.get(str(order_id))
+        return None if document is None else OrdersRepository.from_dict(document)
+
+    def __store(self, order: Order) -> None:
+        self.cache.set(str(order.id), OrdersRepository.to_document(order))
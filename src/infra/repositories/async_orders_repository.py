@@ -0,0 +1,180 @@
+from typing import Dict, Any, AsyncIterator, List, Optional, Sequence, Set, cast
+from datetime import datetime, timezone
+from uuid import UUID
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
+from domain.entities import Order
+from domain.enums.order_status import OrderStatus
+
+from infra.adapters import AsyncNoSqlAdapter
+from .orders_repository import OrdersRepository, ORDERS_INDEXES, ORDERS_PAGE_SORT
+from .orders_repository import ORDERS_READ_PROJECTION
+from .bson_values import as_uuid, uuid_match
+
+
+class AsyncOrdersRepository(AsyncOrderRepositoryInterface):
+    def __init__(self, adapter: AsyncNoSqlAdapter) -> None:
+        self.adapter = adapter
+        self.collection = adapter.database["orders"]
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_indexes(ORDERS_INDEXES)
+
+    async def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        order_document = cast(
+            Optional[Dict[str, Any]],
+            await self.collection.find_one(
+                {"id": uuid_match(order_id)},
+                OrdersRepository.read_projection(item_fields),
+                session=self.adapter.session,
+            ),
+        )
+        if order_document is not None:
+            return OrdersRepository.from_dict(order_document)
+
+    async def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        order_document = cast(
+            Optional[Dict[str, Any]],
+            await self.collection.find_one(
+                {"id": uuid_match(order_id)},
+                OrdersRepository.read_projection(()),
+                session=self.adapter.session,
+            ),
+        )
+        if order_document is not None:
+            return OrdersRepository.to_summary(order_document)
+
+    async def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        if not order_ids:
+            return []
+        documents = await self.collection.find(
+            OrdersRepository.ids_query(order_ids),
+            OrdersRepository.read_projection(item_fields),
+            session=self.adapter.session,
+        ).to_list()
+        return [OrdersRepository.from_dict(document) for document in documents]
+
+    async def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        documents = await (
+            self.collection.find(
+                OrdersRepository.page_query(filters, cursor),
+                OrdersRepository.read_projection(item_fields),
+                session=self.adapter.session,
+            )
+            .sort(ORDERS_PAGE_SORT)
+            .limit(limit + 1)
+            .to_list()
+        )
+        return OrdersRepository.to_page(documents, limit)
+
+    async def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        documents = await self.collection.find(
+            OrdersRepository.ids_query(order_ids),
+            OrdersRepository.transition_status_projection(new_status),
+            session=self.adapter.session,
+        ).to_list()
+        return [OrdersRepository.from_dict(document) for document in documents]
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.__export_rows(filters, batch_size)
+
+    async def __export_rows(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        cursor = self.collection.find(
+            OrdersRepository.page_query(filters, None),
+            ORDERS_READ_PROJECTION,
+            batch_size=batch_size,
+            session=self.adapter.session,
+        ).sort(ORDERS_PAGE_SORT)
+        try:
+            async for document in cursor:
+                yield OrdersRepository.to_export_row(document)
+        finally:
+            await cursor.close()
+
+    async def save(self, order: Order) -> bool:
+        await self.collection.insert_one(
+            OrdersRepository.to_document(order), session=self.adapter.session
+        )
+        return True
+
+    async def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        if not orders:
+            return {}
+        try:
+            await self.collection.insert_many(
+                [OrdersRepository.to_document(order) for order in orders],
+                ordered=False,
+                session=self.adapter.session,
+            )
+        except BulkWriteError as error:
+            if self.adapter.session is not None:
+                raise
+            return OrdersRepository.save_many_errors(orders, error)
+        return {}
+
+    async def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        filter = {"id": uuid_match(order_id)}
+        new_data = {
+            "$set": {
+                "status": new_status.value,
+                "updatedAt": datetime.now(timezone.utc),
+            }
+        }
+        await self.collection.update_one(
+            filter=filter, update=new_data, session=self.adapter.session
+        )
+        return True
+
+    async def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        previous_document = cast(
+            Optional[Dict[str, Any]],
+            await self.collection.find_one_and_update(
+                filter=OrdersRepository.transition_status_filter(order_id, new_status),
+                update=OrdersRepository.transition_status_update(new_status),
+                projection=OrdersRepository.transition_status_projection(new_status),
+                return_document=ReturnDocument.BEFORE,
+                session=self.adapter.session,
+            ),
+        )
+        if previous_document is not None:
+            return OrdersRepository.from_dict(previous_document)
+
+    async def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        if not orders:
+            return set()
+        updated_at = OrdersRepository.batch_updated_at()
+        result = await self.collection.bulk_write(
+            OrdersRepository.transition_status_updates(orders, new_status, updated_at),
+            ordered=False,
+            session=self.adapter.session,
+        )
+        if result.matched_count == len(orders):
+            return {order.id for order in orders}
+        documents = await self.collection.find(
+            OrdersRepository.transitioned_query(orders, new_status, updated_at),
+            {"_id": 0, "id": 1},
+            session=self.adapter.session,
+        ).to_list()
+        return {as_uuid(document["id"]) for document in documents}
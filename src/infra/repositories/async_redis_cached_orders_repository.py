@@ -0,0 +1,198 @@
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set
+from asyncio import sleep
+from time import monotonic
+from uuid import UUID
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from application.adapters import AsyncTransactionAdapterInterface
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
+from domain.entities import Order
+from domain.enums.order_status import OrderStatus
+
+from config import REDIS_CACHE_TTL_SECONDS, REDIS_CACHE_LOCK_TIMEOUT_MS
+from .redis_cached_orders_repository import (
+    RedisCachedOrdersRepository,
+    LOCK_POLL_INTERVAL_SECONDS,
+)
+
+
+class AsyncRedisCachedOrdersRepository(AsyncOrderRepositoryInterface):
+    def __init__(
+        self,
+        repository: AsyncOrderRepositoryInterface,
+        client: "Redis[bytes]",
+        ttl_seconds: int = REDIS_CACHE_TTL_SECONDS,
+        lock_timeout_ms: int = REDIS_CACHE_LOCK_TIMEOUT_MS,
+        transaction: Optional[AsyncTransactionAdapterInterface] = None,
+    ) -> None:
+        self.repository = repository
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.lock_timeout_ms = lock_timeout_ms
+        self.transaction = transaction
+
+    async def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        if item_fields is not None:
+            # only whole orders are cached.
+            return await self.repository.find_by_id(order_id, item_fields)
+        try:
+            return await self.__find_cached(order_id)
+        except RedisError:
+            return await self.repository.find_by_id(order_id)
+
+    async def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        return await self.repository.find_summary_by_id(order_id)
+
+    async def __find_cached(self, order_id: UUID) -> Optional[Order]:
+        data_key = RedisCachedOrdersRepository.data_key(
+            order_id,
+            await self.client.get(RedisCachedOrdersRepository.version_key(order_id)),
+        )
+        payload = await self.client.get(data_key)
+        if payload is not None:
+            return RedisCachedOrdersRepository.deserialize(payload)
+
+        lock_key = RedisCachedOrdersRepository.lock_key(data_key)
+        if not await self.client.set(lock_key, 1, nx=True, px=self.lock_timeout_ms):
+            payload = await self.__wait_for(data_key)
+            if payload is not None:
+                return RedisCachedOrdersRepository.deserialize(payload)
+            return await self.repository.find_by_id(order_id)
+
+        try:
+            order = await self.repository.find_by_id(order_id)
+            if order is not None:
+                await self.client.set(
+                    data_key,
+                    RedisCachedOrdersRepository.serialize(order),
+                    ex=self.ttl_seconds,
+                )
+            return order
+        finally:
+            await self.client.delete(lock_key)
+
+    async def __wait_for(self, data_key: str) -> Optional[bytes]:
+        deadline = monotonic() + self.lock_timeout_ms / 1000
+        while monotonic() < deadline:
+            await sleep(LOCK_POLL_INTERVAL_SECONDS)
+            payload = await self.client.get(data_key)
+            if payload is not None:
+                return payload
+            if not await self.client.exists(
+                RedisCachedOrdersRepository.lock_key(data_key)
+            ):
+                return None
+        return None
+
+    async def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        if item_fields is not None or not order_ids:
+            return await self.repository.find_many(order_ids, item_fields)
+        try:
+            return await self.__find_many_cached(order_ids)
+        except RedisError:
+            return await self.repository.find_many(order_ids)
+
+    async def __find_many_cached(self, order_ids: Sequence[UUID]) -> List[Order]:
+        versions = await self.client.mget(
+            [
+                RedisCachedOrdersRepository.version_key(order_id)
+                for order_id in order_ids
+            ]
+        )
+        data_keys = [
+            RedisCachedOrdersRepository.data_key(order_id, version)
+            for order_id, version in zip(order_ids, versions)
+        ]
+        orders: List[Order] = []
+        missing: Dict[UUID, str] = {}
+        for order_id, data_key, payload in zip(
+            order_ids, data_keys, await self.client.mget(data_keys)
+        ):
+            if payload is None:
+                missing[order_id] = data_key
+            else:
+                orders.append(RedisCachedOrdersRepository.deserialize(payload))
+        if missing:
+            fetched = await self.repository.find_many(list(missing))
+            pipeline = self.client.pipeline(transaction=False)
+            for order in fetched:
+                pipeline.set(
+                    missing[order.id],
+                    RedisCachedOrdersRepository.serialize(order),
+                    ex=self.ttl_seconds,
+                )
+            await pipeline.execute()
+            orders.extend(fetched)
+        return orders
+
+    async def invalidate(self, order_ids: Iterable[UUID]) -> None:
+        ids = list(order_ids)
+        if self.transaction is None:
+            await self.bump_versions(ids)
+        else:
+            await self.transaction.after_commit(lambda: self.bump_versions(ids))
+
+    async def bump_versions(self, order_ids: List[UUID]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for order_id in order_ids:
+            pipeline.set(
+                RedisCachedOrdersRepository.version_key(order_id),
+                RedisCachedOrdersRepository.new_version(),
+                ex=self.ttl_seconds * 2,
+            )
+        await pipeline.execute()
+
+    async def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        return await self.repository.find_page(
+            filters=filters, limit=limit, cursor=cursor, item_fields=item_fields
+        )
+
+    async def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        return await self.repository.find_for_transition(order_ids, new_status)
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.repository.export(filters, batch_size)
+
+    async def save(self, order: Order) -> bool:
+        saved = await self.repository.save(order)
+        await self.invalidate([order.id])
+        return saved
+
+    async def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        errors = await self.repository.save_many(orders)
+        await self.invalidate(order.id for order in orders)
+        return errors
+
+    async def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        updated = await self.repository.update_status(order_id, new_status)
+        await self.invalidate([order_id])
+        return updated
+
+    async def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        previous_order = await self.repository.transition_status(order_id, new_status)
+        await self.invalidate([order_id])
+        return previous_order
+
+    async def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        transitioned = await self.repository.transition_status_many(orders, new_status)
+        await self.invalidate(transitioned)
+        return transitioned
@@ -0,0 +1,112 @@
+from typing import Any, Iterable, List, Optional
+from uuid import UUID
+from decimal import Decimal
+from datetime import datetime, timezone, tzinfo
+from zoneinfo import ZoneInfo
+from bson import Binary, Decimal128, UUID_SUBTYPE
+
+from config import LEGACY_ORDER_IDS_ENABLED, LEGACY_TIMESTAMPS_TIMEZONE
+
+# Readers for order fields. Documents written before the BSON migration keep
+# ids, dates and prices as strings/floats, and the Redis cache still stores
+# the JSON form, so each reader takes the native value first and falls back
+# to parsing the legacy one.
+
+
+def to_binary_uuid(value: UUID) -> Binary:
+    # the clients keep pymongo's default UUID representation: decoding subtype
+    # 4 into UUID objects in the driver costs more than doing it here.
+    return Binary(value.bytes, UUID_SUBTYPE)
+
+
+# until the migration has run, orders written before it keep their ids (and
+# customer ids) as strings, so lookups and filters match both forms.
+LEGACY_UUIDS = LEGACY_ORDER_IDS_ENABLED
+
+
+def uuid_values(values: Iterable[UUID]) -> List[Any]:
+    uuids = list(values)
+    binaries: List[Any] = [to_binary_uuid(value) for value in uuids]
+    if not LEGACY_UUIDS:
+        return binaries
+    return binaries + [str(value) for value in uuids]
+
+
+def uuid_match(value: UUID) -> Any:
+    if not LEGACY_UUIDS:
+        return to_binary_uuid(value)
+    return {"$in": [to_binary_uuid(value), str(value)]}
+
+
+def as_uuid(value: Any) -> UUID:
+    if isinstance(value, Binary):
+        return UUID(bytes=bytes(value))
+    if isinstance(value, UUID):
+        return value
+    return UUID(value)
+
+
+def legacy_timezone(name: str) -> Optional[tzinfo]:
+    if name == "local":
+        return None
+    if name.upper() == "UTC":
+        return timezone.utc
+    return ZoneInfo(name)
+
+
+# legacy documents stored datetime.now().isoformat(): a naive wall-clock time
+# of the server that wrote it, "local" by default.
+LEGACY_TIMEZONE = legacy_timezone(LEGACY_TIMESTAMPS_TIMEZONE)
+
+
+def as_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        # BSON dates are UTC; they only come back naive from a client built
+        # without tz_aware.
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        return parsed
+    if LEGACY_TIMEZONE is None:
+        # astimezone reads a naive value as the system's local time, with the
+        # UTC offset in force on that date.
+        return parsed.astimezone()
+    return parsed.replace(tzinfo=LEGACY_TIMEZONE)
+
+
+def as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+# Decimal128 is IEEE 754-2008 BID: sign bit, 14-bit biased exponent and a
+# 113-bit coefficient in the usual form; the rest (large form, inf, nan) is
+# left to Decimal128.to_decimal.
+_DECIMAL128_FORM_MASK = 0x6000000000000000
+_DECIMAL128_EXPONENT_BIAS = 6176
+_DECIMAL128_COEFFICIENT_MASK = (1 << 113) - 1
+
+
+def decimal128_to_decimal(value: Decimal128) -> Decimal:
+    # to_decimal builds the digits one by one in Python; for the usual form
+    # the Decimal is parsed from "<coefficient>E<exponent>" instead.
+    bits = int.from_bytes(value.bid, "little")
+    high = bits >> 64
+    if high & _DECIMAL128_FORM_MASK == _DECIMAL128_FORM_MASK:
+        return value.to_decimal()
+    exponent = ((high >> 49) & 0x3FFF) - _DECIMAL128_EXPONENT_BIAS
+    sign = "-" if high >> 63 else ""
+    return Decimal(f"{sign}{bits & _DECIMAL128_COEFFICIENT_MASK}E{exponent}")
+
+
+def as_decimal(value: Any) -> Decimal:
+    if isinstance(value, Decimal128):
+        return decimal128_to_decimal(value)
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def to_decimal128(value: Any) -> Decimal128:
+    return Decimal128(as_decimal(value))
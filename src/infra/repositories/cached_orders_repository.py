@@ -0,0 +1,130 @@
+from typing import Any, Iterable, Iterator, Dict, List, Optional, Sequence, Set
+from uuid import UUID
+from application.adapters import TransactionAdapterInterface
+from application.repositories import OrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
+from domain.entities import Order
+from domain.enums.order_status import OrderStatus
+
+from infra.adapters import LruTtlCache
+from .orders_repository import OrdersRepository
+
+
+class CachedOrdersRepository(OrderRepositoryInterface):
+    def __init__(
+        self,
+        repository: OrderRepositoryInterface,
+        cache: LruTtlCache[Dict[str, Any]],
+        transaction: Optional[TransactionAdapterInterface] = None,
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.transaction = transaction
+
+    def invalidate(self, order_ids: Iterable[UUID]) -> None:
+        keys = [str(order_id) for order_id in order_ids]
+
+        def invalidate_keys() -> None:
+            for key in keys:
+                self.cache.invalidate(key)
+
+        # evicting before the commit would let a concurrent read cache the
+        # pre-commit order again, so writes inside a transaction evict after it.
+        if self.transaction is None:
+            invalidate_keys()
+        else:
+            self.transaction.after_commit(invalidate_keys)
+
+    def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        if item_fields is not None:
+            # only whole orders are cached.
+            return self.repository.find_by_id(order_id, item_fields)
+        order = self.__cached(order_id)
+        if order is None:
+            order = self.repository.find_by_id(order_id)
+            if order is not None:
+                self.__store(order)
+        return order
+
+    def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        return self.repository.find_summary_by_id(order_id)
+
+    def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        if item_fields is not None:
+            return self.repository.find_many(order_ids, item_fields)
+        orders: List[Order] = []
+        missing: List[UUID] = []
+        for order_id in order_ids:
+            order = self.__cached(order_id)
+            if order is None:
+                missing.append(order_id)
+            else:
+                orders.append(order)
+        if missing:
+            for order in self.repository.find_many(missing):
+                self.__store(order)
+                orders.append(order)
+        return orders
+
+    def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        return self.repository.find_page(
+            filters=filters, limit=limit, cursor=cursor, item_fields=item_fields
+        )
+
+    def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        return self.repository.find_for_transition(order_ids, new_status)
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        return self.repository.export(filters, batch_size)
+
+    def save(self, order: Order) -> bool:
+        saved = self.repository.save(order)
+        self.invalidate([order.id])
+        return saved
+
+    def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        errors = self.repository.save_many(orders)
+        self.invalidate(order.id for order in orders)
+        return errors
+
+    def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        updated = self.repository.update_status(order_id, new_status)
+        self.invalidate([order_id])
+        return updated
+
+    def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        previous_order = self.repository.transition_status(order_id, new_status)
+        self.invalidate([order_id])
+        return previous_order
+
+    def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        transitioned = self.repository.transition_status_many(orders, new_status)
+        self.invalidate(transitioned)
+        return transitioned
+
+    def __cached(self, order_id: UUID) -> Optional[Order]:
+        # the cache holds documents and every hit builds its own entity, so
+        # concurrent requests never share (and mutate) one Order instance.
+        document = self.cache.get(str(order_id))
+        return None if document is None else OrdersRepository.from_dict(document)
+
+    def __store(self, order: Order) -> None:
+        self.cache.set(str(order.id), OrdersRepository.to_document(order))
@@ -0,0 +1,59 @@
+from typing import Any, Dict, List
+from pymongo import ReplaceOne
+
+from infra.adapters import NoSqlAdapter
+from .orders_repository import OrdersRepository
+
+# any order still holding a string id/date or a non-Decimal128 price, or
+# written before the total was stored.
+LEGACY_ORDERS_FILTER: Dict[str, Any] = {
+    "$or": [
+        {"id": {"$type": "string"}},
+        {"customerId": {"$type": "string"}},
+        {"createdAt": {"$type": "string"}},
+        {"updatedAt": {"$type": "string"}},
+        {"items.productId": {"$type": "string"}},
+        {"items.unitPrice": {"$type": ["double", "int", "long", "string"]}},
+        {"totalAmount": {"$exists": False}},
+    ]
+}
+
+Replacement = ReplaceOne[Dict[str, Any]]
+
+
+class OrdersBsonMigration:
+    """Rewrites order documents from the JSON-style layout (string ids and
+    dates, float prices) to native BSON types. Safe to run more than once."""
+
+    def __init__(self, adapter: NoSqlAdapter, batch_size: int = 500) -> None:
+        self.collection = adapter.database["orders"]
+        self.batch_size = batch_size
+
+    @staticmethod
+    def to_replacement(document: Dict[str, Any]) -> Replacement:
+        # matching on the updatedAt that was read leaves an order changed in the
+        # meantime untouched; it still matches the filter on the next run.
+        return ReplaceOne(
+            {"_id": document["_id"], "updatedAt": document.get("updatedAt")},
+            OrdersRepository.to_document(OrdersRepository.from_dict(document)),
+        )
+
+    def count_pending(self) -> int:
+        return self.collection.count_documents(LEGACY_ORDERS_FILTER)
+
+    def run(self) -> int:
+        migrated = 0
+        replacements: List[Replacement] = []
+        for document in self.collection.find(LEGACY_ORDERS_FILTER).batch_size(
+            self.batch_size
+        ):
+            replacements.append(self.to_replacement(document))
+            if len(replacements) >= self.batch_size:
+                migrated += self.__write(replacements)
+                replacements = []
+        if replacements:
+            migrated += self.__write(replacements)
+        return migrated
+
+    def __write(self, replacements: List[Replacement]) -> int:
+        return self.collection.bulk_write(replacements, ordered=False).modified_count
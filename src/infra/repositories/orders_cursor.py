@@ -0,0 +1,30 @@
+from json import dumps, loads
+from typing import Tuple
+from uuid import UUID
+from datetime import datetime
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+
+from domain.exceptions import InvalidCursorError
+
+
+def encode_cursor(created_at: str, order_id: str) -> str:
+    return urlsafe_b64encode(dumps([created_at, order_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        created_at, order_id = loads(urlsafe_b64decode(cursor.encode()))
+    except (BinasciiError, UnicodeDecodeError, ValueError, TypeError) as error:
+        raise InvalidCursorError(cursor) from error
+    if not isinstance(created_at, str) or not isinstance(order_id, str):
+        raise InvalidCursorError(cursor)
+    return created_at, order_id
+
+
+def decode_cursor_position(cursor: str) -> Tuple[datetime, UUID]:
+    created_at, order_id = decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(created_at), UUID(order_id)
+    except ValueError as error:
+        raise InvalidCursorError(cursor) from error
@@ -1,11 +1,64 @@
-from typing import Dict, Any, Optional, cast
-from datetime import datetime
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    cast,
+)
+from datetime import datetime, timezone
+from decimal import Decimal
 from uuid import UUID
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 from application.repositories import OrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
 from domain.entities import Order, OrderItem
+from domain.entities.order_status_transitions import ORDER_STATUS_SOURCES
 from domain.enums.order_status import OrderStatus
 
 from infra.adapters import NoSqlAdapter
+from .orders_cursor import encode_cursor, decode_cursor_position
+from .bson_values import as_datetime, as_decimal, as_utc, as_uuid
+from .bson_values import to_binary_uuid, to_decimal128, uuid_match, uuid_values
+
+ORDERS_INDEXES = [
+    IndexModel([("id", ASCENDING)], unique=True),
+    IndexModel(
+        [("customerId", ASCENDING), ("createdAt", DESCENDING), ("id", DESCENDING)]
+    ),
+    IndexModel([("status", ASCENDING), ("createdAt", DESCENDING), ("id", DESCENDING)]),
+    IndexModel([("createdAt", DESCENDING), ("id", DESCENDING)]),
+]
+ORDERS_PAGE_SORT = [("createdAt", DESCENDING), ("id", DESCENDING)]
+# the stored item subtotals are for queries on the database; Order computes
+# its own, so reads skip decoding them.
+ORDERS_READ_PROJECTION = {"_id": 0, "items.subtotal": 0}
+ORDER_FIELDS = (
+    "id",
+    "customerId",
+    "shippingAddress",
+    "status",
+    "createdAt",
+    "updatedAt",
+    "totalAmount",
+)
+# what the refund amount of a cancelled order is computed from when the
+# document predates the stored totalAmount.
+REFUND_ITEM_FIELDS = ("productId", "quantity", "unitPrice")
+# stored status values an order may hold to move to each status, built once
+# from the domain transition table.
+TRANSITION_SOURCE_VALUES: Mapping[OrderStatus, List[str]] = MappingProxyType(
+    {
+        new_status: [status.value for status in sources]
+        for new_status, sources in ORDER_STATUS_SOURCES.items()
+    }
+)
 
 
 class OrdersRepository(OrderRepositoryInterface):
@@ -13,44 +66,377 @@ class OrdersRepository(OrderRepositoryInterface):
         self.adapter = adapter
         self.collection = adapter.database["orders"]
 
-    def from_dict(self, document: Dict[str, Any]) -> Order:
+    @staticmethod
+    def to_document(order: Order) -> Dict[str, Any]:
+        return {
+            "id": to_binary_uuid(order.id),
+            "customerId": to_binary_uuid(order.customer_id),
+            "shippingAddress": order.shipping_address,
+            "status": order.status.value,
+            "createdAt": order.created_at,
+            "updatedAt": order.updated_at,
+            "totalAmount": to_decimal128(order.total_amount),
+            "items": [
+                {
+                    "productId": to_binary_uuid(item.product_id),
+                    "productName": item.product_name,
+                    "quantity": item.quantity,
+                    "unitPrice": to_decimal128(item.unit_price),
+                    "subtotal": to_decimal128(item.subtotal),
+                }
+                for item in order.items
+            ],
+        }
+
+    @staticmethod
+    def from_dict(document: Dict[str, Any]) -> Order:
+        created_at = document.get("createdAt", "")
+        total_amount = document.get("totalAmount")
         return Order(
-            id=UUID(document.get("id")),
-            customer_id=UUID(document.get("customerId")),
+            id=as_uuid(document.get("id")),
+            customer_id=as_uuid(document.get("customerId")),
             shipping_address=document.get("shippingAddress", ""),
             status=OrderStatus[document.get("status", "")],
-            created_at=datetime.fromisoformat(document.get("createdAt", "")),
-            updated_at=datetime.fromisoformat(document.get("createdAt", "")),
+            created_at=as_datetime(created_at),
+            updated_at=as_datetime(document.get("updatedAt", created_at)),
             items=[
                 OrderItem(
-                    product_id=UUID(item.get("productId")),
-                    product_name=item.get("productName"),
-                    quantity=item.get("quantity"),
-                    unit_price=item.get("unitPrice"),
+                    product_id=as_uuid(item.get("productId")),
+                    product_name=item.get("productName", ""),
+                    quantity=item.get("quantity", 0),
+                    unit_price=as_decimal(item.get("unitPrice", 0)),
                 )
                 for item in document.get("items", [])
             ],
+            total_amount=as_decimal(total_amount) if total_amount is not None else None,
+        )
+
+    @staticmethod
+    def to_summary(document: Dict[str, Any]) -> OrderSummaryDTO:
+        created_at = document.get("createdAt", "")
+        return OrderSummaryDTO(
+            id=as_uuid(document.get("id")),
+            customer_id=as_uuid(document.get("customerId")),
+            shipping_address=document.get("shippingAddress", ""),
+            status=OrderStatus[document.get("status", "")],
+            created_at=as_datetime(created_at),
+            updated_at=as_datetime(document.get("updatedAt", created_at)),
+        )
+
+    @staticmethod
+    def to_export_row(document: Dict[str, Any]) -> Dict[str, Any]:
+        # goes straight from the stored document to the response shape, leaving
+        # datetimes, UUIDs and Decimals for the JSON encoder.
+        created_at = as_utc(as_datetime(document.get("createdAt", "")))
+        items = [
+            {
+                "productId": as_uuid(item.get("productId")),
+                "productName": item.get("productName", ""),
+                "quantity": item.get("quantity", 0),
+                "unityPrice": as_decimal(item.get("unitPrice", 0)),
+            }
+            for item in document.get("items", [])
+        ]
+        total_amount = document.get("totalAmount")
+        return {
+            "id": as_uuid(document.get("id")),
+            "customerId": as_uuid(document.get("customerId")),
+            "shippingAddress": document.get("shippingAddress", ""),
+            "status": document.get("status", ""),
+            "createdAt": created_at,
+            "updatedAt": as_utc(as_datetime(document.get("updatedAt", created_at))),
+            "totalAmount": (
+                as_decimal(total_amount)
+                if total_amount is not None
+                else sum(
+                    (item["unityPrice"] * item["quantity"] for item in items),
+                    Decimal("0"),
+                )
+            ),
+            "items": items,
+        }
+
+    @staticmethod
+    def read_projection(item_fields: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        # every order field is always read; item_fields picks the item fields,
+        # and an empty one leaves the items out.
+        if item_fields is None:
+            return ORDERS_READ_PROJECTION
+        projection = {"_id": 0, **{field: 1 for field in ORDER_FIELDS}}
+        projection.update({f"items.{field}": 1 for field in item_fields})
+        return projection
+
+    @staticmethod
+    def transition_status_filter(
+        order_id: UUID, new_status: OrderStatus
+    ) -> Dict[str, Any]:
+        return {
+            "id": uuid_match(order_id),
+            "status": {"$in": TRANSITION_SOURCE_VALUES[new_status]},
+        }
+
+    @staticmethod
+    def transition_status_update(new_status: OrderStatus) -> Dict[str, Any]:
+        return {
+            "$set": {
+                "status": new_status.value,
+                "updatedAt": datetime.now(timezone.utc),
+            }
+        }
+
+    @staticmethod
+    def transition_status_projection(new_status: OrderStatus) -> Dict[str, int]:
+        return OrdersRepository.read_projection(
+            REFUND_ITEM_FIELDS if new_status == OrderStatus.CANCELLED else ()
+        )
+
+    @staticmethod
+    def ids_query(order_ids: Iterable[UUID]) -> Dict[str, Any]:
+        return {"id": {"$in": uuid_values(order_ids)}}
+
+    @staticmethod
+    def transition_status_updates(
+        orders: Sequence[Order], new_status: OrderStatus, updated_at: datetime
+    ) -> List[UpdateOne]:
+        # each update only applies while the order still has the status it was
+        # validated and read with, so the events carry the right previous status.
+        update = {"$set": {"status": new_status.value, "updatedAt": updated_at}}
+        return [
+            UpdateOne(
+                {"id": uuid_match(order.id), "status": order.status.value}, update
+            )
+            for order in orders
+        ]
+
+    @staticmethod
+    def transitioned_query(
+        orders: Sequence[Order], new_status: OrderStatus, updated_at: datetime
+    ) -> Dict[str, Any]:
+        return {
+            **OrdersRepository.ids_query(order.id for order in orders),
+            "status": new_status.value,
+            "updatedAt": updated_at,
+        }
+
+    @staticmethod
+    def batch_updated_at() -> datetime:
+        # BSON dates keep milliseconds only; the stamp is matched back exactly.
+        now = datetime.now(timezone.utc)
+        return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+    @staticmethod
+    def save_many_errors(orders: List[Order], error: BulkWriteError) -> Dict[UUID, str]:
+        return {
+            orders[write_error["index"]].id: write_error["errmsg"]
+            for write_error in error.details.get("writeErrors", [])
+        }
+
+    @staticmethod
+    def page_query(
+        filters: ListOrdersFilterDTO, cursor: Optional[str]
+    ) -> Dict[str, Any]:
+        query: Dict[str, Any] = {}
+        if filters.customer_id is not None:
+            query["customerId"] = uuid_match(filters.customer_id)
+        if filters.status is not None:
+            query["status"] = filters.status.value
+
+        created_at: Dict[str, datetime] = {}
+        if filters.created_from is not None:
+            created_at["$gte"] = as_utc(filters.created_from)
+        if filters.created_to is not None:
+            created_at["$lte"] = as_utc(filters.created_to)
+        if created_at:
+            query["createdAt"] = created_at
+
+        if cursor is not None:
+            # seek past the last (createdAt, id) pair already returned instead of
+            # skipping, so every page costs a single index range scan. The
+            # pair is always native: range comparisons never match string
+            # dates, so later pages only hold migrated orders.
+            last_created_at, last_id = decode_cursor_position(cursor)
+            query["$or"] = [
+                {"createdAt": {"$lt": last_created_at}},
+                {
+                    "createdAt": last_created_at,
+                    "id": {"$lt": to_binary_uuid(last_id)},
+                },
+            ]
+        return query
+
+    @staticmethod
+    def to_page(documents: List[Dict[str, Any]], limit: int) -> OrdersPageDTO:
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            last = documents[-1]
+            next_cursor = encode_cursor(
+                as_utc(as_datetime(last["createdAt"])).isoformat(),
+                str(as_uuid(last["id"])),
+            )
+        return OrdersPageDTO(
+            items=[OrdersRepository.from_dict(document) for document in documents],
+            next_cursor=next_cursor,
         )
 
-    def find_by_id(self, order_id: UUID) -> Optional[Order]:
+    def ensure_indexes(self) -> None:
+        self.collection.create_indexes(ORDERS_INDEXES)
+
+    def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
         order_document = cast(
             Optional[Dict[str, Any]],
-            self.collection.find_one({"id": str(order_id)}),
+            self.collection.find_one(
+                {"id": uuid_match(order_id)},
+                self.read_projection(item_fields),
+                session=self.adapter.session,
+            ),
         )
         if order_document is not None:
             return self.from_dict(order_document)
 
+    def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        order_document = cast(
+            Optional[Dict[str, Any]],
+            self.collection.find_one(
+                {"id": uuid_match(order_id)},
+                self.read_projection(()),
+                session=self.adapter.session,
+            ),
+        )
+        if order_document is not None:
+            return self.to_summary(order_document)
+
+    def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        if not order_ids:
+            return []
+        return [
+            self.from_dict(document)
+            for document in self.collection.find(
+                self.ids_query(order_ids),
+                self.read_projection(item_fields),
+                session=self.adapter.session,
+            )
+        ]
+
+    def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        documents = list(
+            self.collection.find(
+                self.page_query(filters, cursor),
+                self.read_projection(item_fields),
+                session=self.adapter.session,
+            )
+            .sort(ORDERS_PAGE_SORT)
+            .limit(limit + 1)
+        )
+        return self.to_page(documents, limit)
+
+    def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        return [
+            self.from_dict(document)
+            for document in self.collection.find(
+                self.ids_query(order_ids),
+                self.transition_status_projection(new_status),
+                session=self.adapter.session,
+            )
+        ]
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        cursor = self.collection.find(
+            self.page_query(filters, None),
+            ORDERS_READ_PROJECTION,
+            batch_size=batch_size,
+            session=self.adapter.session,
+        ).sort(ORDERS_PAGE_SORT)
+        with cursor:
+            for document in cursor:
+                yield self.to_export_row(document)
+
     def save(self, order: Order) -> bool:
-        self.collection.insert_one(order.to_dict())
+        self.collection.insert_one(
+            self.to_document(order), session=self.adapter.session
+        )
         return True
 
+    def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        if not orders:
+            return {}
+        try:
+            self.collection.insert_many(
+                [self.to_document(order) for order in orders],
+                ordered=False,
+                session=self.adapter.session,
+            )
+        except BulkWriteError as error:
+            # a write error aborts the whole transaction, so there is no
+            # partial result to report when running inside one.
+            if self.adapter.session is not None:
+                raise
+            return self.save_many_errors(orders, error)
+        return {}
+
     def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
-        filter = {"id": str(order_id)}
+        filter = {"id": uuid_match(order_id)}
         new_data = {
             "$set": {
                 "status": new_status.value,
-                "updatedAt": datetime.now().isoformat(),
+                "updatedAt": datetime.now(timezone.utc),
             }
         }
-        self.collection.update_one(filter=filter, update=new_data)
+        self.collection.update_one(
+            filter=filter, update=new_data, session=self.adapter.session
+        )
         return True
+
+    def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        previous_document = cast(
+            Optional[Dict[str, Any]],
+            self.collection.find_one_and_update(
+                filter=self.transition_status_filter(order_id, new_status),
+                update=self.transition_status_update(new_status),
+                projection=self.transition_status_projection(new_status),
+                return_document=ReturnDocument.BEFORE,
+                session=self.adapter.session,
+            ),
+        )
+        if previous_document is not None:
+            return self.from_dict(previous_document)
+
+    def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        if not orders:
+            return set()
+        updated_at = self.batch_updated_at()
+        result = self.collection.bulk_write(
+            self.transition_status_updates(orders, new_status, updated_at),
+            ordered=False,
+            session=self.adapter.session,
+        )
+        if result.matched_count == len(orders):
+            return {order.id for order in orders}
+        # bulk_write only reports totals; the orders carrying this write's stamp
+        # are the ones it moved.
+        return {
+            as_uuid(document["id"])
+            for document in self.collection.find(
+                self.transitioned_query(orders, new_status, updated_at),
+                {"_id": 0, "id": 1},
+                session=self.adapter.session,
+            )
+        }
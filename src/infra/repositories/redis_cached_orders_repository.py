@@ -0,0 +1,226 @@
+from typing import Any, Iterable, Iterator, Dict, List, Optional, Sequence, Set
+from json import dumps, loads
+from time import monotonic, sleep
+from uuid import UUID, uuid4
+from redis import Redis
+from redis.exceptions import RedisError
+from application.adapters import TransactionAdapterInterface
+from application.repositories import OrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
+from domain.entities import Order
+from domain.enums.order_status import OrderStatus
+
+from config import REDIS_CACHE_TTL_SECONDS, REDIS_CACHE_LOCK_TIMEOUT_MS
+from .orders_repository import OrdersRepository
+
+INITIAL_VERSION = "0"
+LOCK_POLL_INTERVAL_SECONDS = 0.025
+
+
+class RedisCachedOrdersRepository(OrderRepositoryInterface):
+    def __init__(
+        self,
+        repository: OrderRepositoryInterface,
+        client: "Redis[bytes]",
+        ttl_seconds: int = REDIS_CACHE_TTL_SECONDS,
+        lock_timeout_ms: int = REDIS_CACHE_LOCK_TIMEOUT_MS,
+        transaction: Optional[TransactionAdapterInterface] = None,
+    ) -> None:
+        self.repository = repository
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.lock_timeout_ms = lock_timeout_ms
+        self.transaction = transaction
+
+    @staticmethod
+    def version_key(order_id: UUID) -> str:
+        return f"orders:{order_id}:version"
+
+    @staticmethod
+    def data_key(order_id: UUID, version: Optional[bytes]) -> str:
+        version_value = version.decode() if version is not None else INITIAL_VERSION
+        return f"orders:{order_id}:v:{version_value}"
+
+    @staticmethod
+    def lock_key(data_key: str) -> str:
+        return f"{data_key}:lock"
+
+    @staticmethod
+    def new_version() -> str:
+        # versions are never reused, so a reader that loaded the order before a
+        # write can only ever fill a key nobody looks up anymore.
+        return uuid4().hex
+
+    @staticmethod
+    def to_cache_dict(order: Order) -> Dict[str, Any]:
+        # prices are kept as Decimal strings instead of the floats of
+        # Order.to_dict, so a cached read returns the same Decimal as Mongo.
+        document = order.to_dict()
+        for item_document, item in zip(document["items"], order.items):
+            item_document["unitPrice"] = str(item.unit_price)
+            del item_document["subtotal"]
+        document["totalAmount"] = str(order.total_amount)
+        return document
+
+    @staticmethod
+    def serialize(order: Order) -> str:
+        return dumps(RedisCachedOrdersRepository.to_cache_dict(order))
+
+    @staticmethod
+    def deserialize(payload: bytes) -> Order:
+        return OrdersRepository.from_dict(loads(payload))
+
+    def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        if item_fields is not None:
+            # only whole orders are cached.
+            return self.repository.find_by_id(order_id, item_fields)
+        try:
+            return self.__find_cached(order_id)
+        except RedisError:
+            return self.repository.find_by_id(order_id)
+
+    def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        return self.repository.find_summary_by_id(order_id)
+
+    def __find_cached(self, order_id: UUID) -> Optional[Order]:
+        data_key = self.data_key(order_id, self.client.get(self.version_key(order_id)))
+        payload = self.client.get(data_key)
+        if payload is not None:
+            return self.deserialize(payload)
+
+        lock_key = self.lock_key(data_key)
+        if not self.client.set(lock_key, 1, nx=True, px=self.lock_timeout_ms):
+            payload = self.__wait_for(data_key)
+            if payload is not None:
+                return self.deserialize(payload)
+            return self.repository.find_by_id(order_id)
+
+        try:
+            order = self.repository.find_by_id(order_id)
+            if order is not None:
+                self.client.set(data_key, self.serialize(order), ex=self.ttl_seconds)
+            return order
+        finally:
+            self.client.delete(lock_key)
+
+    def __wait_for(self, data_key: str) -> Optional[bytes]:
+        deadline = monotonic() + self.lock_timeout_ms / 1000
+        while monotonic() < deadline:
+            sleep(LOCK_POLL_INTERVAL_SECONDS)
+            payload = self.client.get(data_key)
+            if payload is not None:
+                return payload
+            if not self.client.exists(self.lock_key(data_key)):
+                return None
+        return None
+
+    def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        if item_fields is not None or not order_ids:
+            return self.repository.find_many(order_ids, item_fields)
+        try:
+            return self.__find_many_cached(order_ids)
+        except RedisError:
+            return self.repository.find_many(order_ids)
+
+    def __find_many_cached(self, order_ids: Sequence[UUID]) -> List[Order]:
+        versions = self.client.mget(
+            [self.version_key(order_id) for order_id in order_ids]
+        )
+        data_keys = [
+            self.data_key(order_id, version)
+            for order_id, version in zip(order_ids, versions)
+        ]
+        orders: List[Order] = []
+        missing: Dict[UUID, str] = {}
+        for order_id, data_key, payload in zip(
+            order_ids, data_keys, self.client.mget(data_keys)
+        ):
+            if payload is None:
+                missing[order_id] = data_key
+            else:
+                orders.append(self.deserialize(payload))
+        if missing:
+            # misses are filled without the per-order lock: a batch would hold
+            # many of them, and the versioned keys already keep stale fills out.
+            fetched = self.repository.find_many(list(missing))
+            pipeline = self.client.pipeline(transaction=False)
+            for order in fetched:
+                pipeline.set(
+                    missing[order.id], self.serialize(order), ex=self.ttl_seconds
+                )
+            pipeline.execute()
+            orders.extend(fetched)
+        return orders
+
+    def invalidate(self, order_ids: Iterable[UUID]) -> None:
+        ids = list(order_ids)
+        # bumping before the commit would let a concurrent read cache the
+        # pre-commit order under the new version, so it waits for the commit.
+        if self.transaction is None:
+            self.bump_versions(ids)
+        else:
+            self.transaction.after_commit(lambda: self.bump_versions(ids))
+
+    def bump_versions(self, order_ids: List[UUID]) -> None:
+        # the version outlives every payload written under the previous one, so
+        # an expired version can never resurrect a stale payload.
+        pipeline = self.client.pipeline(transaction=False)
+        for order_id in order_ids:
+            pipeline.set(
+                self.version_key(order_id), self.new_version(), ex=self.ttl_seconds * 2
+            )
+        pipeline.execute()
+
+    def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        return self.repository.find_page(
+            filters=filters, limit=limit, cursor=cursor, item_fields=item_fields
+        )
+
+    def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        return self.repository.find_for_transition(order_ids, new_status)
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        return self.repository.export(filters, batch_size)
+
+    def save(self, order: Order) -> bool:
+        saved = self.repository.save(order)
+        self.invalidate([order.id])
+        return saved
+
+    def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        errors = self.repository.save_many(orders)
+        self.invalidate(order.id for order in orders)
+        return errors
+
+    def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        updated = self.repository.update_status(order_id, new_status)
+        self.invalidate([order_id])
+        return updated
+
+    def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        previous_order = self.repository.transition_status(order_id, new_status)
+        self.invalidate([order_id])
+        return previous_order
+
+    def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        transitioned = self.repository.transition_status_many(orders, new_status)
+        self.invalidate(transitioned)
+        return transitioned
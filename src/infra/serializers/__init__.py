@@ -0,0 +1,38 @@
+# pyright: reportUnusedImport=false
+from typing import Dict, Optional, Type
+
+from config import EVENT_SERIALIZER
+
+from .serializer import Serializer
+from .json_serializer import JsonSerializer
+from .orjson_serializer import OrjsonSerializer
+from .msgpack_serializer import MsgpackSerializer
+
+SERIALIZERS: Dict[str, Type[Serializer]] = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+# JSON is always read with orjson, whichever serializer wrote it.
+DECODERS: Dict[str, Serializer] = {
+    OrjsonSerializer.content_type: OrjsonSerializer(),
+    MsgpackSerializer.content_type: MsgpackSerializer(),
+}
+
+
+def create_serializer(name: str) -> Serializer:
+    if name not in SERIALIZERS:
+        raise ValueError(f"unknown serializer: {name}")
+    return SERIALIZERS[name]()
+
+
+def serializer_for(content_type: Optional[str]) -> Serializer:
+    # messages published without a content type are JSON.
+    decoder = DECODERS.get(content_type or JsonSerializer.content_type)
+    if decoder is None:
+        raise ValueError(f"unsupported content type: {content_type}")
+    return decoder
+
+
+event_serializer = create_serializer(EVENT_SERIALIZER)
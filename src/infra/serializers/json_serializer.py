@@ -0,0 +1,17 @@
+from typing import Any, Callable
+from json import dumps, loads
+
+from .serializer import Serializer
+
+
+class JsonSerializer(Serializer):
+    content_type = "application/json"
+
+    def __init__(self, default: Callable[[Any], Any] = str) -> None:
+        self.default = default
+
+    def dumps(self, value: Any) -> bytes:
+        return dumps(value, default=self.default).encode()
+
+    def loads(self, payload: bytes) -> Any:
+        return loads(payload)
@@ -0,0 +1,21 @@
+from typing import Any, Callable
+from orjson import dumps, loads  # pylint: disable=no-name-in-module
+
+from .serializer import Serializer
+
+
+class OrjsonSerializer(Serializer):
+    """JSON through orjson, which encodes UUID, datetime, enums and dataclasses
+    natively; ``default`` is only reached for the remaining types (Decimal)."""
+
+    content_type = "application/json"
+
+    def __init__(self, default: Callable[[Any], Any] = str, option: int = 0) -> None:
+        self.default = default
+        self.option = option
+
+    def dumps(self, value: Any) -> bytes:
+        return dumps(value, default=self.default, option=self.option)
+
+    def loads(self, payload: bytes) -> Any:
+        return loads(payload)
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Serializer(ABC):
+    content_type: str
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def loads(self, payload: bytes) -> Any:
+        raise NotImplementedError  # pragma: no cover
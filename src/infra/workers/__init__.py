@@ -0,0 +1,16 @@
+# pyright: reportUnusedImport=false
+from .outbox_relay import OutboxRelay
+from .event_handler_registry import (
+    EventHandlerRegistry,
+    EventHandler,
+    BatchEventHandler,
+    BatchRegistration,
+)
+from .delivery_tracker import DeliveryTracker
+from .consumer_metrics import ConsumerMetrics
+from .bloom_filter import BloomFilter
+from .processed_event_store import ProcessedEventStore, InMemoryProcessedEventStore
+from .mongo_processed_event_store import MongoProcessedEventStore
+from .event_deduplicator import EventDeduplicator
+from .event_consumer import EventConsumer
+from .order_event_handlers import create_order_event_handlers
@@ -0,0 +1,35 @@
+from math import ceil, log
+from hashlib import blake2b
+from typing import Iterator
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.size = max(8, ceil(-capacity * log(error_rate) / log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * log(2)))
+        self.count = 0
+        self.__bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: str) -> None:
+        for index in self.__indexes(key):
+            self.__bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.__bits[index >> 3] & (1 << (index & 7))
+            for index in self.__indexes(key)
+        )
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    def __indexes(self, key: str) -> Iterator[int]:
+        # double hashing: k indexes out of one 128-bit digest.
+        digest = blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for position in range(self.hash_count):
+            yield (first + position * second) % self.size
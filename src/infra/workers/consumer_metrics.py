@@ -0,0 +1,46 @@
+from typing import Callable, Dict
+from collections import Counter
+from threading import Lock
+from time import monotonic
+
+
+class ConsumerMetrics:
+    def __init__(self, clock: Callable[[], float] = monotonic) -> None:
+        self.__clock = clock
+        self.__lock = Lock()
+        self.__processed: "Counter[str]" = Counter()
+        self.__failed: "Counter[str]" = Counter()
+        self.__duplicates: "Counter[str]" = Counter()
+        self.__window_started_at = clock()
+        self.__window_count = 0
+
+    def record(self, routing_key: str, succeeded: bool) -> None:
+        with self.__lock:
+            if succeeded:
+                self.__processed[routing_key] += 1
+            else:
+                self.__failed[routing_key] += 1
+            self.__window_count += 1
+
+    def record_duplicates(self, routing_key: str, count: int) -> None:
+        with self.__lock:
+            self.__duplicates[routing_key] += count
+
+    def snapshot(self) -> Dict[str, float]:
+        """Totals so far plus the rate of messages since the previous snapshot."""
+        with self.__lock:
+            now = self.__clock()
+            elapsed = now - self.__window_started_at
+            rate = self.__window_count / elapsed if elapsed > 0 else 0.0
+            self.__window_started_at = now
+            self.__window_count = 0
+            return {
+                "processed": sum(self.__processed.values()),
+                "failed": sum(self.__failed.values()),
+                "duplicates": sum(self.__duplicates.values()),
+                "messages_per_s": rate,
+                **{
+                    f"processed.{key}": count for key, count in self.__processed.items()
+                },
+                **{f"failed.{key}": count for key, count in self.__failed.items()},
+            }
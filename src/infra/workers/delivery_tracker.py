@@ -0,0 +1,33 @@
+from typing import Deque, Dict, Iterable, Optional
+from collections import deque
+
+
+class DeliveryTracker:
+    """Turns out-of-order completions into cumulative ``multiple=True`` acks.
+
+    Delivery tags grow monotonically on a channel, so a tag can only be acked
+    with ``multiple=True`` once every earlier delivery has been settled.
+    """
+
+    def __init__(self) -> None:
+        self.__pending: Deque[int] = deque()
+        self.__settled: Dict[int, bool] = {}
+
+    def track(self, delivery_tag: int) -> None:
+        self.__pending.append(delivery_tag)
+
+    def settle(self, delivery_tags: Iterable[int], succeeded: bool) -> None:
+        for delivery_tag in delivery_tags:
+            self.__settled[delivery_tag] = succeeded
+
+    def pop_acknowledgeable(self) -> Optional[int]:
+        """Highest successful tag of the settled prefix, if there is one."""
+        last_acknowledgeable: Optional[int] = None
+        while self.__pending and self.__pending[0] in self.__settled:
+            delivery_tag = self.__pending.popleft()
+            if self.__settled.pop(delivery_tag):
+                last_acknowledgeable = delivery_tag
+        return last_acknowledgeable
+
+    def __len__(self) -> int:
+        return len(self.__pending)
@@ -0,0 +1,254 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from pika import BasicProperties, BlockingConnection, ConnectionParameters
+from pika import PlainCredentials
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.spec import Basic
+
+from config import MQ_HOST, MQ_PASSWORD, MQ_USER, MQ_PORT, MQ_HEARTBEAT
+from config import (
+    CONSUMER_QUEUE,
+    CONSUMER_PREFETCH_COUNT,
+    CONSUMER_WORKERS,
+    CONSUMER_METRICS_INTERVAL_SECONDS,
+)
+from infra.serializers import serializer_for
+
+from .event_handler_registry import EventHandlerRegistry, BatchRegistration
+from .consumer_metrics import ConsumerMetrics
+from .delivery_tracker import DeliveryTracker
+from .event_deduplicator import EventDeduplicator
+
+logger = logging.getLogger(__name__)
+
+
+def create_connection() -> BlockingConnection:
+    return BlockingConnection(
+        ConnectionParameters(
+            host=MQ_HOST,
+            port=int(MQ_PORT),
+            credentials=PlainCredentials(MQ_USER, MQ_PASSWORD),
+            heartbeat=MQ_HEARTBEAT,
+        )
+    )
+
+
+@dataclass(frozen=True)
+class Delivery:
+    delivery_tag: int
+    routing_key: str
+    redelivered: bool
+    body: bytes
+    content_type: Optional[str] = None
+
+
+class EventConsumer:
+    def __init__(
+        self,
+        registry: EventHandlerRegistry,
+        exchange: str = "orders",
+        queue: str = CONSUMER_QUEUE,
+        prefetch_count: int = CONSUMER_PREFETCH_COUNT,
+        workers: int = CONSUMER_WORKERS,
+        metrics_interval_seconds: float = CONSUMER_METRICS_INTERVAL_SECONDS,
+        connection_factory: Callable[[], BlockingConnection] = create_connection,
+        deduplicator: Optional[EventDeduplicator] = None,
+    ) -> None:
+        self.registry = registry
+        self.deduplicator = deduplicator
+        self.exchange = exchange
+        self.queue = queue
+        self.prefetch_count = prefetch_count
+        self.metrics_interval_seconds = metrics_interval_seconds
+        self.metrics = ConsumerMetrics()
+        self.__connection_factory = connection_factory
+        self.__executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="event-consumer"
+        )
+        self.__connection: Optional[BlockingConnection] = None
+        self.__channel: Optional[BlockingChannel] = None
+        # everything below is only touched from the connection's thread.
+        self.__tracker = DeliveryTracker()
+        self.__batches: Dict[str, List[Delivery]] = {}
+        self.__batch_timers: Dict[str, object] = {}
+
+    def run(self) -> None:
+        self.__connection = self.__connection_factory()
+        self.__channel = self.__connection.channel()
+        self.__declare(self.__channel)
+        # prefetch bounds the deliveries held by the worker pool; without it the
+        # broker pushes the whole queue into this process.
+        self.__channel.basic_qos(prefetch_count=self.prefetch_count)
+        self.__channel.basic_consume(
+            queue=self.queue, on_message_callback=self.on_message
+        )
+        self.__connection.call_later(
+            self.metrics_interval_seconds, self.__report_metrics
+        )
+
+        try:
+            self.__channel.start_consuming()
+        finally:
+            for routing_key in list(self.__batches):
+                self.__flush_batch(routing_key)
+            self.__executor.shutdown(wait=True)
+            if self.__connection.is_open:
+                # flush the acks queued by the workers before closing.
+                self.__connection.process_data_events(time_limit=0)
+                self.__connection.close()
+
+    def stop(self) -> None:
+        connection, channel = self.__connection, self.__channel
+        if connection is not None and channel is not None:
+            connection.add_callback_threadsafe(channel.stop_consuming)
+
+    def on_message(
+        self,
+        _channel: BlockingChannel,
+        method: Basic.Deliver,
+        properties: BasicProperties,
+        body: bytes,
+    ) -> None:
+        delivery = Delivery(
+            delivery_tag=int(method.delivery_tag),  # type: ignore
+            routing_key=str(method.routing_key),
+            redelivered=bool(method.redelivered),
+            body=body,
+            content_type=properties.content_type,
+        )
+        self.__tracker.track(delivery.delivery_tag)
+
+        registration = self.registry.get_batch(delivery.routing_key)
+        if registration is None:
+            self.__executor.submit(self.__process, [delivery])
+        else:
+            self.__add_to_batch(delivery, registration)
+
+    def dispatch(self, routing_key: str, events: List[Dict[str, Any]]) -> None:
+        registration = self.registry.get_batch(routing_key)
+        if registration is not None:
+            registration.handler(events)
+            return
+
+        handler = self.registry.get(routing_key)
+        if handler is None:
+            raise LookupError(f"no handler registered for {routing_key}")
+        for event in events:
+            handler(event)
+
+    def __add_to_batch(
+        self, delivery: Delivery, registration: BatchRegistration
+    ) -> None:
+        routing_key = delivery.routing_key
+        batch = self.__batches.setdefault(routing_key, [])
+        batch.append(delivery)
+        if len(batch) >= registration.max_size:
+            self.__flush_batch(routing_key)
+        elif len(batch) == 1 and self.__connection is not None:
+            self.__batch_timers[routing_key] = self.__connection.call_later(
+                registration.max_wait_ms / 1000,
+                lambda: self.__flush_batch(routing_key),
+            )
+
+    def __flush_batch(self, routing_key: str) -> None:
+        timer = self.__batch_timers.pop(routing_key, None)
+        if timer is not None and self.__connection is not None:
+            self.__connection.remove_timeout(timer)
+        batch = self.__batches.pop(routing_key, None)
+        if batch:
+            self.__executor.submit(self.__process, batch)
+
+    def __process(self, deliveries: List[Delivery]) -> None:
+        routing_key = deliveries[0].routing_key
+        try:
+            events = self.__without_duplicates(deliveries)
+            if events:
+                self.dispatch(routing_key, [event for _, event in events])
+                if self.deduplicator is not None:
+                    self.deduplicator.mark_processed(
+                        [event_id for event_id, _ in events if event_id is not None]
+                    )
+        except Exception:  # pylint: disable=broad-except
+            succeeded = False
+            processed = len(deliveries)
+        else:
+            succeeded = True
+            processed = len(events)
+            self.metrics.record_duplicates(routing_key, len(deliveries) - processed)
+
+        for _ in range(processed):
+            self.metrics.record(routing_key, succeeded=succeeded)
+        connection = self.__connection
+        if connection is not None:
+            # pika channels are not thread-safe: workers hand the outcome back to
+            # the connection's thread instead of writing frames themselves.
+            connection.add_callback_threadsafe(
+                lambda: self.__settle(deliveries, succeeded)
+            )
+
+    def __without_duplicates(
+        self, deliveries: List[Delivery]
+    ) -> List[Tuple[Optional[str], Dict[str, Any]]]:
+        events: List[Tuple[Optional[str], Dict[str, Any]]] = []
+        for delivery in deliveries:
+            serializer = serializer_for(delivery.content_type)
+            event: Dict[str, Any] = serializer.loads(delivery.body)
+            event_id = event.get("event_id")
+            events.append((str(event_id) if event_id is not None else None, event))
+        if self.deduplicator is None:
+            return events
+
+        duplicates = self.deduplicator.find_duplicates(
+            [
+                (event_id, delivery.redelivered)
+                for delivery, (event_id, _) in zip(deliveries, events)
+                if event_id is not None
+            ]
+        )
+        unique: List[Tuple[Optional[str], Dict[str, Any]]] = []
+        for event_id, event in events:
+            if event_id is not None:
+                if event_id in duplicates:
+                    continue
+                # the same event twice in one batch is handled once.
+                duplicates.add(event_id)
+            unique.append((event_id, event))
+        return unique
+
+    def __settle(self, deliveries: List[Delivery], succeeded: bool) -> None:
+        channel = self.__channel
+        if channel is None:
+            return
+        if not succeeded:
+            for delivery in deliveries:
+                # a first failure is retried once; a redelivered message that
+                # fails again is dropped instead of looping forever.
+                channel.basic_nack(
+                    delivery_tag=delivery.delivery_tag,
+                    requeue=not delivery.redelivered,
+                )
+        self.__tracker.settle(
+            [delivery.delivery_tag for delivery in deliveries], succeeded
+        )
+        delivery_tag = self.__tracker.pop_acknowledgeable()
+        if delivery_tag is not None:
+            channel.basic_ack(delivery_tag=delivery_tag, multiple=True)
+
+    def __declare(self, channel: BlockingChannel) -> None:
+        channel.exchange_declare(
+            exchange=self.exchange, exchange_type="topic", durable=True
+        )
+        channel.queue_declare(queue=self.queue, durable=True)
+        for routing_key in self.registry.routing_keys:
+            channel.queue_bind(
+                exchange=self.exchange, queue=self.queue, routing_key=routing_key
+            )
+
+    def __report_metrics(self) -> None:
+        logger.info("consumer metrics: %s", self.metrics.snapshot())
+        if self.__connection is not None and self.__connection.is_open:
+            self.__connection.call_later(
+                self.metrics_interval_seconds, self.__report_metrics
+            )
@@ -0,0 +1,69 @@
+from typing import List, Optional, Set, Tuple
+from threading import Lock
+
+from .bloom_filter import BloomFilter
+from .processed_event_store import ProcessedEventStore
+
+
+class EventDeduplicator:
+    """Remembers processed ``event_id``s so redeliveries are acked, not rerun.
+
+    With a store local to this process, a Bloom filter answers "definitely
+    never processed" for first deliveries without touching the store;
+    redelivered messages are always checked in the store. A shared store can
+    hold ids processed by other consumers, which a local filter never sees,
+    so with one there is no filter and every delivery is checked in the store.
+    """
+
+    def __init__(
+        self, store: ProcessedEventStore, bloom_capacity: int, bloom_error_rate: float
+    ) -> None:
+        self.store = store
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.store_lookups = 0
+        self.__lock = Lock()
+        self.__current: Optional[BloomFilter] = None
+        self.__previous: Optional[BloomFilter] = None
+        if not store.shared:
+            self.__current = self.__new_filter()
+            # a full filter is kept for one more generation, so ids stay known
+            # for at least bloom_capacity further events after it is rotated out.
+            self.__previous = self.__new_filter()
+
+    def find_duplicates(self, deliveries: List[Tuple[str, bool]]) -> Set[str]:
+        """Processed ids among ``(event_id, redelivered)`` pairs."""
+        with self.__lock:
+            candidates = [
+                event_id
+                for event_id, redelivered in deliveries
+                if redelivered or self.__may_be_processed(event_id)
+            ]
+            if not candidates:
+                return set()
+            self.store_lookups += 1
+        return self.store.find_processed(candidates)
+
+    def mark_processed(self, event_ids: List[str]) -> None:
+        self.store.mark_processed(event_ids)
+        for event_id in event_ids:
+            self.__remember(event_id)
+
+    def __may_be_processed(self, event_id: str) -> bool:
+        if self.__current is None or self.__previous is None:
+            return True
+        return event_id in self.__current or event_id in self.__previous
+
+    def __remember(self, event_id: str) -> None:
+        with self.__lock:
+            if self.__current is None:
+                return
+            if self.__current.is_full:
+                self.__previous = self.__current
+                self.__current = self.__new_filter()
+            self.__current.add(event_id)
+
+    def __new_filter(self) -> BloomFilter:
+        return BloomFilter(
+            capacity=self.bloom_capacity, error_rate=self.bloom_error_rate
+        )
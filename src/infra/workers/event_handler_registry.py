@@ -0,0 +1,69 @@
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass
+
+from config import CONSUMER_BATCH_SIZE, CONSUMER_BATCH_MAX_WAIT_MS
+
+EventHandler = Callable[[Dict[str, Any]], None]
+BatchEventHandler = Callable[[List[Dict[str, Any]]], None]
+
+
+@dataclass(frozen=True)
+class BatchRegistration:
+    handler: BatchEventHandler
+    max_size: int
+    max_wait_ms: int
+
+
+class EventHandlerRegistry:
+    def __init__(self) -> None:
+        self.__handlers: Dict[str, EventHandler] = {}
+        self.__batch_handlers: Dict[str, BatchRegistration] = {}
+
+    def register(self, routing_key: str, handler: EventHandler) -> None:
+        self.__ensure_unregistered(routing_key)
+        self.__handlers[routing_key] = handler
+
+    def register_batch(
+        self,
+        routing_key: str,
+        handler: BatchEventHandler,
+        max_size: int = CONSUMER_BATCH_SIZE,
+        max_wait_ms: int = CONSUMER_BATCH_MAX_WAIT_MS,
+    ) -> None:
+        self.__ensure_unregistered(routing_key)
+        self.__batch_handlers[routing_key] = BatchRegistration(
+            handler=handler, max_size=max_size, max_wait_ms=max_wait_ms
+        )
+
+    def handles(self, routing_key: str) -> Callable[[EventHandler], EventHandler]:
+        def decorator(handler: EventHandler) -> EventHandler:
+            self.register(routing_key, handler)
+            return handler
+
+        return decorator
+
+    def handles_batch(
+        self,
+        routing_key: str,
+        max_size: int = CONSUMER_BATCH_SIZE,
+        max_wait_ms: int = CONSUMER_BATCH_MAX_WAIT_MS,
+    ) -> Callable[[BatchEventHandler], BatchEventHandler]:
+        def decorator(handler: BatchEventHandler) -> BatchEventHandler:
+            self.register_batch(routing_key, handler, max_size, max_wait_ms)
+            return handler
+
+        return decorator
+
+    def get(self, routing_key: str) -> Optional[EventHandler]:
+        return self.__handlers.get(routing_key)
+
+    def get_batch(self, routing_key: str) -> Optional[BatchRegistration]:
+        return self.__batch_handlers.get(routing_key)
+
+    @property
+    def routing_keys(self) -> List[str]:
+        return [*self.__handlers, *self.__batch_handlers]
+
+    def __ensure_unregistered(self, routing_key: str) -> None:
+        if routing_key in self.__handlers or routing_key in self.__batch_handlers:
+            raise ValueError(f"a handler is already registered for {routing_key}")
@@ -0,0 +1,53 @@
+from typing import List, Set
+from datetime import datetime, timezone
+from pymongo import IndexModel
+from pymongo.errors import BulkWriteError
+
+from infra.adapters import NoSqlAdapter
+
+from .processed_event_store import ProcessedEventStore
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class MongoProcessedEventStore(ProcessedEventStore):
+    shared = True
+
+    def __init__(self, adapter: NoSqlAdapter, ttl_seconds: int) -> None:
+        self.collection = adapter.database["processed_events"]
+        self.ttl_seconds = ttl_seconds
+
+    def ensure_indexes(self) -> None:
+        self.collection.create_indexes(
+            [IndexModel("processedAt", expireAfterSeconds=self.ttl_seconds)]
+        )
+
+    def find_processed(self, event_ids: List[str]) -> Set[str]:
+        if not event_ids:
+            return set()
+        return {
+            document["_id"]
+            for document in self.collection.find(
+                {"_id": {"$in": event_ids}}, {"_id": 1}
+            )
+        }
+
+    def mark_processed(self, event_ids: List[str]) -> None:
+        if not event_ids:
+            return
+        processed_at = datetime.now(timezone.utc)
+        try:
+            self.collection.insert_many(
+                [
+                    {"_id": event_id, "processedAt": processed_at}
+                    for event_id in event_ids
+                ],
+                ordered=False,
+            )
+        except BulkWriteError as error:
+            # an id already marked by another consumer is not a failure.
+            if any(
+                write_error["code"] != DUPLICATE_KEY_ERROR
+                for write_error in error.details.get("writeErrors", [])
+            ):
+                raise
@@ -0,0 +1,27 @@
+import logging
+from typing import Any, Dict
+
+from domain.events import (
+    OrderCreatedEvent,
+    OrderStatusChangedEvent,
+    OrderCancelledEvent,
+    OrderDeliveredEvent,
+)
+
+from .event_handler_registry import EventHandlerRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def log_event(event: Dict[str, Any]) -> None:
+    payload = event.get("payload", {})
+    logger.info("%s: pedido %s", event.get("event_name"), payload.get("order_id"))
+
+
+def create_order_event_handlers() -> EventHandlerRegistry:
+    registry = EventHandlerRegistry()
+    registry.register(OrderCreatedEvent.event_name, log_event)
+    registry.register(OrderStatusChangedEvent.event_name, log_event)
+    registry.register(OrderCancelledEvent.event_name, log_event)
+    registry.register(OrderDeliveredEvent.event_name, log_event)
+    return registry
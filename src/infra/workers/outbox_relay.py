@@ -0,0 +1,148 @@
+import logging
+from threading import Event
+from typing import Any, Dict, List, Union
+from uuid import uuid4
+from itertools import groupby
+from datetime import datetime, timedelta, timezone
+
+from config import (
+    OUTBOX_RELAY_BATCH_SIZE,
+    OUTBOX_RELAY_POLL_INTERVAL_MS,
+    OUTBOX_RELAY_MAX_BACKOFF_MS,
+    OUTBOX_RELAY_LEASE_MS,
+    OUTBOX_RELAY_MAX_ATTEMPTS,
+)
+from infra.adapters import NoSqlAdapter, ConfirmPublisher, OutgoingMessage
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        adapter: NoSqlAdapter,
+        publisher: ConfirmPublisher,
+        batch_size: int = OUTBOX_RELAY_BATCH_SIZE,
+        poll_interval_ms: int = OUTBOX_RELAY_POLL_INTERVAL_MS,
+        max_backoff_ms: int = OUTBOX_RELAY_MAX_BACKOFF_MS,
+        lease_ms: int = OUTBOX_RELAY_LEASE_MS,
+        max_attempts: int = OUTBOX_RELAY_MAX_ATTEMPTS,
+    ) -> None:
+        self.collection = adapter.database["outbox"]
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval_ms = poll_interval_ms
+        self.max_backoff_ms = max_backoff_ms
+        self.lease_ms = lease_ms
+        self.max_attempts = max_attempts
+
+    def run(self, stop_event: Event) -> None:
+        failures = 0
+        while not stop_event.is_set():
+            try:
+                relayed = self.relay_batch()
+            except Exception:  # pylint: disable=broad-except
+                # a broker or Mongo outage must not kill the relay: entries stay
+                # pending and the next batch retries them once the backoff ends.
+                failures += 1
+                logger.exception("outbox relay batch failed (attempt %d)", failures)
+                stop_event.wait(self.backoff_ms(failures) / 1000)
+                continue
+            failures = 0
+            if relayed < self.batch_size:
+                stop_event.wait(self.poll_interval_ms / 1000)
+
+    def backoff_ms(self, failures: int) -> int:
+        return min(self.poll_interval_ms * 2 ** (failures - 1), self.max_backoff_ms)
+
+    def relay_batch(self) -> int:
+        entries = self.claim_batch()
+        if not entries:
+            return 0
+
+        published_ids = self.__publish(entries)
+        now = datetime.now(timezone.utc)
+        if published_ids:
+            self.collection.update_many(
+                {"_id": {"$in": published_ids}},
+                {"$set": {"publishedAt": now, "leaseUntil": None}},
+            )
+        published = set(published_ids)
+        exhausted_ids = [
+            entry["_id"]
+            for entry in entries
+            if entry["_id"] not in published and entry["attempts"] >= self.max_attempts
+        ]
+        if exhausted_ids:
+            self.collection.update_many(
+                {"_id": {"$in": exhausted_ids}},
+                {"$set": {"deadLetteredAt": now, "leaseUntil": None}},
+            )
+        return len(published_ids)
+
+    def claim_batch(self) -> List[Dict[str, Any]]:
+        now = datetime.now(timezone.utc)
+        claimable = self.claimable_query(now)
+        candidate_ids = [
+            entry["_id"]
+            for entry in self.collection.find(claimable, {"_id": 1})
+            .sort("_id", 1)
+            .limit(self.batch_size)
+        ]
+        if not candidate_ids:
+            return []
+
+        # the claim re-checks the lease per entry, so ids another relay claimed
+        # since the find are skipped instead of published twice. Entries left
+        # unconfirmed keep their lease and are retried only after it expires,
+        # so they do not hold back the entries written after them.
+        lease_id = uuid4().hex
+        self.collection.update_many(
+            {**claimable, "_id": {"$in": candidate_ids}},
+            {
+                "$set": {
+                    "leaseId": lease_id,
+                    "leaseUntil": now + timedelta(milliseconds=self.lease_ms),
+                },
+                "$inc": {"attempts": 1},
+            },
+        )
+        return list(self.collection.find({"leaseId": lease_id}).sort("_id", 1))
+
+    @staticmethod
+    def claimable_query(now: datetime) -> Dict[str, Any]:
+        return {
+            "publishedAt": None,
+            "deadLetteredAt": None,
+            "$or": [{"leaseUntil": None}, {"leaseUntil": {"$lte": now}}],
+        }
+
+    @staticmethod
+    def to_bytes(body: Union[bytes, str]) -> bytes:
+        # entries written before bodies were stored as binary hold a str.
+        return body.encode() if isinstance(body, str) else bytes(body)
+
+    def __publish(self, entries: List[Dict[str, Any]]) -> List[Any]:
+        published_ids: List[Any] = []
+        for exchange, group in groupby(entries, key=lambda entry: entry["exchange"]):
+            exchange_entries = list(group)
+            # the whole group is in flight at once; entries left unconfirmed stay
+            # pending and are picked up again by the next batch.
+            confirmed = self.publisher.publish(
+                exchange,
+                [
+                    OutgoingMessage(
+                        routing_key=entry["eventName"],
+                        body=self.to_bytes(entry["body"]),
+                        content_type=entry["contentType"],
+                        message_id=entry["eventId"],
+                    )
+                    for entry in exchange_entries
+                ],
+            )
+            published_ids.extend(
+                entry["_id"]
+                for entry, is_confirmed in zip(exchange_entries, confirmed)
+                if is_confirmed
+            )
+        return published_ids
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import List, Set
+
+from infra.adapters import LruTtlCache
+
+
+class ProcessedEventStore(ABC):
+    # whether other consumers mark ids in this store too.
+    shared: bool = False
+
+    @abstractmethod
+    def find_processed(self, event_ids: List[str]) -> Set[str]:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def mark_processed(self, event_ids: List[str]) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+
+class InMemoryProcessedEventStore(ProcessedEventStore):
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.cache: LruTtlCache[bool] = LruTtlCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
+    def find_processed(self, event_ids: List[str]) -> Set[str]:
+        return {event_id for event_id in event_ids if self.cache.get(event_id)}
+
+    def mark_processed(self, event_ids: List[str]) -> None:
+        for event_id in event_ids:
+            self.cache.set(event_id, True)
@@ -0,0 +1,29 @@
+from argparse import ArgumentParser
+
+from config import LEGACY_TIMESTAMPS_TIMEZONE
+from infra.adapters import NoSqlAdapter, mongo_client_registry
+from infra.repositories import OrdersBsonMigration
+
+
+def migrate_orders():
+    parser = ArgumentParser(description="Convert order documents to native BSON types")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    migration = OrdersBsonMigration(
+        adapter=NoSqlAdapter(client=mongo_client_registry.client),
+        batch_size=args.batch_size,
+    )
+
+    try:
+        print(f"naive legacy timestamps read as {LEGACY_TIMESTAMPS_TIMEZONE} time")
+        print(f"{migration.count_pending()} order documents to migrate")
+        if not args.dry_run:
+            print(f"{migration.run()} order documents migrated")
+    finally:
+        mongo_client_registry.close()
+
+
+if __name__ == "__main__":
+    migrate_orders()
@@ -0,0 +1,29 @@
+import logging
+import signal
+from threading import Event
+
+from infra.adapters import NoSqlAdapter, ConfirmPublisher, mongo_client_registry
+from infra.workers import OutboxRelay
+
+
+def start_outbox_relay():
+    logging.basicConfig(level=logging.INFO)
+    stop_event = Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    publisher = ConfirmPublisher()
+    relay = OutboxRelay(
+        adapter=NoSqlAdapter(client=mongo_client_registry.client),
+        publisher=publisher,
+    )
+
+    try:
+        relay.run(stop_event)
+    finally:
+        publisher.close()
+        mongo_client_registry.close()
+
+
+if __name__ == "__main__":
+    start_outbox_relay()
@@ -1,4 +1,7 @@
 # pylint: disable=W0611
 # pyright: reportUnusedImport=false
-from tests.fixtures.app import client
+from tests.fixtures.app import client, async_client
 from tests.fixtures.mock_fake_order_repository import mock_fake_order_repository
+from tests.fixtures.mock_fake_outbox_publisher_adapter import (
+    mock_fake_outbox_publisher_adapter,
+)
@@ -0,0 +1,5 @@
+# pyright: reportUnusedImport=false
+from .fake_publisher_adapter import fake_publisher_adapter
+from .fake_async_publisher_adapter import fake_async_publisher_adapter
+from .fake_async_transaction_adapter import fake_async_transaction_adapter
+from .fake_transaction_adapter import fake_transaction_adapter
@@ -0,0 +1,21 @@
+from typing import List
+from application.adapters import AsyncPublisherAdapterInterface
+from domain.events import DomainEvent
+
+
+class FakeAsyncPublisherAdapter(AsyncPublisherAdapterInterface):
+
+    def __init__(self):
+        self.events: List[DomainEvent] = []
+
+    async def publish_event(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+    async def publish_events(self, events: List[DomainEvent]) -> None:
+        self.events.extend(events)
+
+    def clear_data(self):
+        self.events = []
+
+
+fake_async_publisher_adapter = FakeAsyncPublisherAdapter()
@@ -0,0 +1,31 @@
+from typing import Awaitable, Callable, List, Optional, TypeVar
+from application.adapters import AsyncTransactionAdapterInterface
+
+T = TypeVar("T")
+
+
+class FakeAsyncTransactionAdapter(AsyncTransactionAdapterInterface):
+
+    def __init__(self) -> None:
+        self.callbacks: Optional[List[Callable[[], Awaitable[None]]]] = None
+
+    async def execute(self, operation: Callable[[], Awaitable[T]]) -> T:
+        self.callbacks = []
+        try:
+            result = await operation()
+        except BaseException:
+            self.callbacks = None
+            raise
+        callbacks, self.callbacks = self.callbacks, None
+        for callback in callbacks:
+            await callback()
+        return result
+
+    async def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        if self.callbacks is None:
+            await callback()
+        else:
+            self.callbacks.append(callback)
+
+
+fake_async_transaction_adapter = FakeAsyncTransactionAdapter()
@@ -0,0 +1,21 @@
+from typing import List
+from application.adapters import PublisherAdapterInterface
+from domain.events import DomainEvent
+
+
+class FakePublisherAdapter(PublisherAdapterInterface):
+
+    def __init__(self):
+        self.events: List[DomainEvent] = []
+
+    def publish_event(self, event: DomainEvent) -> None:
+        self.events.append(event)
+
+    def publish_events(self, events: List[DomainEvent]) -> None:
+        self.events.extend(events)
+
+    def clear_data(self):
+        self.events = []
+
+
+fake_publisher_adapter = FakePublisherAdapter()
@@ -0,0 +1,31 @@
+from typing import Callable, List, Optional, TypeVar
+from application.adapters import TransactionAdapterInterface
+
+T = TypeVar("T")
+
+
+class FakeTransactionAdapter(TransactionAdapterInterface):
+
+    def __init__(self) -> None:
+        self.callbacks: Optional[List[Callable[[], None]]] = None
+
+    def execute(self, operation: Callable[[], T]) -> T:
+        self.callbacks = []
+        try:
+            result = operation()
+        except BaseException:
+            self.callbacks = None
+            raise
+        callbacks, self.callbacks = self.callbacks, None
+        for callback in callbacks:
+            callback()
+        return result
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        if self.callbacks is None:
+            callback()
+        else:
+            self.callbacks.append(callback)
+
+
+fake_transaction_adapter = FakeTransactionAdapter()
@@ -13,6 +13,13 @@ from dotenv import find_dotenv, load_dotenv
 
 
 from api.app import create_app
+from api.controllers import AsyncOrdersController
+from api.dependencies import get_orders_controller
+from tests.fixtures.repositories import fake_async_order_repository
+from tests.fixtures.adapters import (
+    fake_async_publisher_adapter,
+    fake_async_transaction_adapter,
+)
 
 
 class Client(TestClient):
@@ -65,3 +72,18 @@ def client():
     app = create_app()
 
     yield Client(app)
+
+
+@pytest.fixture(scope="function")
+def async_client():
+    env = find_dotenv(".env.test")
+    load_dotenv(env)
+    app = create_app()
+    app.dependency_overrides[get_orders_controller] = lambda: AsyncOrdersController(
+        order_repository=fake_async_order_repository,
+        publisher=fake_async_publisher_adapter,
+        transaction=fake_async_transaction_adapter,
+    )
+
+    yield Client(app)
+    fake_async_publisher_adapter.clear_data()
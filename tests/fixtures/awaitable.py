@@ -0,0 +1,8 @@
+from typing import Any, Callable, Coroutine
+
+
+def awaitable(value: Any = None) -> Callable[..., Coroutine[Any, Any, Any]]:
+    async def answer(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return answer
@@ -8,10 +8,26 @@ from tests.fixtures.repositories.fake_order_repository import fake_order_reposit
 @fixture(scope="function", autouse=True)
 def mock_fake_order_repository():
     when(OrdersRepository).save(...).thenAnswer(fake_order_repository.save)
+    when(OrdersRepository).save_many(...).thenAnswer(fake_order_repository.save_many)
     when(OrdersRepository).find_by_id(...).thenAnswer(fake_order_repository.find_by_id)
+    when(OrdersRepository).find_summary_by_id(...).thenAnswer(
+        fake_order_repository.find_summary_by_id
+    )
+    when(OrdersRepository).find_many(...).thenAnswer(fake_order_repository.find_many)
+    when(OrdersRepository).export(...).thenAnswer(fake_order_repository.export)
+    when(OrdersRepository).find_page(...).thenAnswer(fake_order_repository.find_page)
     when(OrdersRepository).update_status(...).thenAnswer(
         fake_order_repository.update_status
     )
+    when(OrdersRepository).transition_status(...).thenAnswer(
+        fake_order_repository.transition_status
+    )
+    when(OrdersRepository).find_for_transition(...).thenAnswer(
+        fake_order_repository.find_for_transition
+    )
+    when(OrdersRepository).transition_status_many(...).thenAnswer(
+        fake_order_repository.transition_status_many
+    )
 
     yield
     fake_order_repository.clear_data()
@@ -0,0 +1,16 @@
+from pytest import fixture
+from mockito import when, unstub
+
+from infra.adapters import OutboxPublisherAdapter
+from tests.fixtures.adapters.fake_publisher_adapter import fake_publisher_adapter
+
+
+@fixture(scope="function", autouse=True)
+def mock_fake_outbox_publisher_adapter():
+    when(OutboxPublisherAdapter).publish_events(...).thenAnswer(
+        fake_publisher_adapter.publish_events
+    )
+
+    yield
+    fake_publisher_adapter.clear_data()
+    unstub()
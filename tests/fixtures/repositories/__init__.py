@@ -1,2 +1,3 @@
 # pyright: reportUnusedImport=false
 from .fake_order_repository import fake_order_repository
+from .fake_async_order_repository import fake_async_order_repository
@@ -0,0 +1,74 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set
+from uuid import UUID
+from application.repositories import AsyncOrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
+from domain.entities import Order
+from domain.enums.order_status import OrderStatus
+
+from .fake_order_repository import FakeOrderRepository, fake_order_repository
+
+
+class FakeAsyncOrderRepository(AsyncOrderRepositoryInterface):
+
+    def __init__(self, repository: FakeOrderRepository):
+        self.repository = repository
+
+    async def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        return self.repository.find_by_id(order_id, item_fields)
+
+    async def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        return self.repository.find_summary_by_id(order_id)
+
+    async def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        return self.repository.find_many(order_ids, item_fields)
+
+    async def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        return self.repository.find_page(filters, limit, cursor, item_fields)
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.__export_rows(filters, batch_size)
+
+    async def __export_rows(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for row in self.repository.export(filters, batch_size):
+            yield row
+
+    async def save(self, order: Order) -> bool:
+        return self.repository.save(order)
+
+    async def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        return self.repository.save_many(orders)
+
+    async def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        return self.repository.update_status(order_id, new_status)
+
+    async def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        return self.repository.transition_status(order_id, new_status)
+
+    async def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        return self.repository.find_for_transition(order_ids, new_status)
+
+    async def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        return self.repository.transition_status_many(orders, new_status)
+
+
+fake_async_order_repository = FakeAsyncOrderRepository(fake_order_repository)
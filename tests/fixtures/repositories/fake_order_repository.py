@@ -1,8 +1,11 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
 from uuid import UUID
 from application.repositories import OrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrderSummaryDTO, OrdersPageDTO
 from domain.entities import Order
 from domain.enums.order_status import OrderStatus
+from infra.repositories.orders_cursor import encode_cursor, decode_cursor
+from infra.repositories.orders_repository import OrdersRepository
 
 
 class FakeOrderRepository(OrderRepositoryInterface):
@@ -10,15 +13,89 @@ class FakeOrderRepository(OrderRepositoryInterface):
     def __init__(self):
         self.data: List[Order] = []
 
-    def find_by_id(self, order_id: UUID) -> Optional[Order]:
+    def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
         for item in self.data:
             if str(item.id) == str(order_id):
                 return item
 
+    def find_summary_by_id(self, order_id: UUID) -> Optional[OrderSummaryDTO]:
+        order = self.find_by_id(order_id)
+        if order is not None:
+            return OrderSummaryDTO(
+                id=order.id,
+                customer_id=order.customer_id,
+                shipping_address=order.shipping_address,
+                status=order.status,
+                created_at=order.created_at,
+                updated_at=order.updated_at,
+            )
+
+    def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        return [order for order in self.data if order.id in order_ids]
+
+    def find_page(
+        self,
+        filters: ListOrdersFilterDTO,
+        limit: int,
+        cursor: Optional[str] = None,
+        item_fields: Optional[Sequence[str]] = None,
+    ) -> OrdersPageDTO:
+        orders = self.filter(filters)
+
+        if cursor is not None:
+            last_created_at, last_id = decode_cursor(cursor)
+            orders = [
+                order
+                for order in orders
+                if (order.created_at.isoformat(), str(order.id))
+                < (last_created_at, last_id)
+            ]
+
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = encode_cursor(
+                orders[-1].created_at.isoformat(), str(orders[-1].id)
+            )
+        return OrdersPageDTO(items=orders, next_cursor=next_cursor)
+
+    def export(
+        self, filters: ListOrdersFilterDTO, batch_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        for order in self.filter(filters):
+            yield OrdersRepository.to_export_row(OrdersRepository.to_document(order))
+
+    def filter(self, filters: ListOrdersFilterDTO) -> List[Order]:
+        orders = [
+            order
+            for order in self.data
+            if (filters.customer_id is None or order.customer_id == filters.customer_id)
+            and (filters.status is None or order.status == filters.status)
+            and (
+                filters.created_from is None or order.created_at >= filters.created_from
+            )
+            and (filters.created_to is None or order.created_at <= filters.created_to)
+        ]
+        orders.sort(key=lambda order: (order.created_at, str(order.id)), reverse=True)
+        return orders
+
     def save(self, order: Order) -> bool:
         self.data.append(order)
         return True
 
+    def save_many(self, orders: List[Order]) -> Dict[UUID, str]:
+        errors: Dict[UUID, str] = {}
+        for order in orders:
+            if self.find_by_id(order.id) is not None:
+                errors[order.id] = f"duplicate key: {order.id}"
+                continue
+            self.data.append(order)
+        return errors
+
     def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
         for order in self.data:
             if order.id == order_id:
@@ -27,6 +104,47 @@ class FakeOrderRepository(OrderRepositoryInterface):
 
         return False
 
+    def transition_status(
+        self, order_id: UUID, new_status: OrderStatus
+    ) -> Optional[Order]:
+        order = self.find_by_id(order_id)
+        if order is None or order.status not in Order.allowed_source_statuses(
+            new_status
+        ):
+            return None
+
+        previous_order = self.copy(order)
+        order.status = new_status
+        return previous_order
+
+    def find_for_transition(
+        self, order_ids: Sequence[UUID], new_status: OrderStatus
+    ) -> List[Order]:
+        return [self.copy(order) for order in self.data if order.id in order_ids]
+
+    def transition_status_many(
+        self, orders: Sequence[Order], new_status: OrderStatus
+    ) -> Set[UUID]:
+        transitioned: Set[UUID] = set()
+        for order in orders:
+            stored = self.find_by_id(order.id)
+            if stored is not None and stored.status == order.status:
+                stored.status = new_status
+                transitioned.add(order.id)
+        return transitioned
+
+    @staticmethod
+    def copy(order: Order) -> Order:
+        return Order(
+            id=order.id,
+            customer_id=order.customer_id,
+            shipping_address=order.shipping_address,
+            items=order.items,
+            status=order.status,
+            created_at=order.created_at,
+            updated_at=order.updated_at,
+        )
+
     def clear_data(self):
         self.data = []
 
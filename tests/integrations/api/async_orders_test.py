@@ -0,0 +1,159 @@
+import json
+from io import BytesIO
+import pyarrow as pa
+from http import HTTPStatus
+from uuid import uuid4
+from tests.fixtures.app import Client
+from tests.fixtures.repositories import fake_order_repository
+from tests.fixtures.adapters import fake_async_publisher_adapter
+from domain.enums import OrderStatus
+
+DEFAULT_ORDER = {
+    "customerId": "87d8e330-2878-4742-a86f-dbbb3bf522ac",
+    "shippingAddress": "Rua Teste, 123",
+    "items": [
+        {
+            "productId": "dcd53ddb-8104-4e48-8cc0-5df1088c6113",
+            "productName": "Produto Teste",
+            "quantity": 2,
+            "unityPrice": 100.50,
+        }
+    ],
+}
+
+
+def test_should_create_an_order_in_async_mode(async_client: Client):
+    response = async_client.post("/orders", data=DEFAULT_ORDER)
+
+    assert response.status_code == HTTPStatus.CREATED
+    order_id = response.json().get("orderId", "")
+    assert fake_order_repository.find_by_id(order_id) is not None
+    assert len(fake_async_publisher_adapter.events) == 1
+
+
+def test_should_find_order_by_id_in_async_mode(async_client: Client):
+    order_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+
+    response = async_client.get(f"/orders/{order_id}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["id"] == order_id
+    assert response.json()["status"] == OrderStatus.CREATED.value
+
+
+def test_should_return_404_when_order_not_found_in_async_mode(async_client: Client):
+    response = async_client.get(f"/orders/{uuid4()}")
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_should_update_order_status_in_async_mode(async_client: Client):
+    order_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+
+    response = async_client.patch(
+        f"/orders/{order_id}", data={"newStatus": OrderStatus.PROCESSING.value}
+    )
+
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    order = fake_order_repository.find_by_id(order_id)
+    assert order is not None
+    assert order.status == OrderStatus.PROCESSING
+
+
+def test_should_fail_to_update_with_invalid_status_transition_in_async_mode(
+    async_client: Client,
+):
+    order_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+
+    response = async_client.patch(
+        f"/orders/{order_id}", data={"newStatus": OrderStatus.DELIVERED.value}
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+def test_should_create_orders_in_batch_in_async_mode(async_client: Client):
+    response = async_client.post(
+        "/orders/batch", data={"orders": [DEFAULT_ORDER, DEFAULT_ORDER]}
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS
+    results = response.json()["results"]
+    assert all(result["created"] for result in results)
+    assert len(fake_async_publisher_adapter.events) == 2
+
+
+def test_should_lookup_orders_in_async_mode(async_client: Client):
+    order_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+    missing_id = str(uuid4())
+
+    response = async_client.post(
+        "/orders/lookup", data={"orderIds": [missing_id, order_id]}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [order["id"] for order in response.json()["items"]] == [order_id]
+    assert response.json()["missingIds"] == [missing_id]
+
+
+def test_should_export_orders_as_ndjson_in_async_mode(async_client: Client):
+    first_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+    second_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+
+    response = async_client.get("/orders/export")
+
+    assert response.status_code == HTTPStatus.OK
+    assert {json.loads(line)["id"] for line in response.text.splitlines()} == {
+        first_id,
+        second_id,
+    }
+
+
+def test_should_export_orders_as_arrow_in_async_mode(async_client: Client):
+    order_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+
+    response = async_client.get("/orders/export/orders", params={"format": "arrow"})
+
+    assert response.status_code == HTTPStatus.OK
+    table = pa.ipc.open_file(BytesIO(response.content)).read_all()
+    assert [str(value) for value in table.column("id").to_pylist()] == [order_id]
+    assert table.column("status").to_pylist() == [OrderStatus.CREATED.value]
+
+
+def test_should_update_status_of_orders_in_batch_in_async_mode(
+    async_client: Client,
+):
+    order_id = async_client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+    missing_id = str(uuid4())
+
+    response = async_client.patch(
+        "/orders/status",
+        data={
+            "orderIds": [order_id, missing_id],
+            "newStatus": OrderStatus.CANCELLED.value,
+        },
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS
+    assert [result["updated"] for result in response.json()["results"]] == [
+        True,
+        False,
+    ]
+    order = fake_order_repository.find_by_id(order_id)
+    assert order is not None
+    assert order.status == OrderStatus.CANCELLED
+    assert [event.event_name for event in fake_async_publisher_adapter.events][-2:] == [
+        "order.changedStatus",
+        "order.cancelled",
+    ]
+
+
+def test_should_list_orders_in_async_mode(async_client: Client):
+    for _ in range(2):
+        async_client.post("/orders", data=DEFAULT_ORDER)
+
+    response = async_client.get("/orders", params={"limit": 1})
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["items"]) == 1
+    assert response.json()["nextCursor"] is not None
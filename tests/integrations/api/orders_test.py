@@ -1,7 +1,13 @@
+import json
+from io import BytesIO
+import pyarrow.parquet as pq
 from http import HTTPStatus
 from uuid import UUID, uuid4
+import pytest
+from api.app import ensure_atomic_outbox
 from tests.fixtures.app import Client
 from tests.fixtures.repositories.fake_order_repository import fake_order_repository
+from tests.fixtures.adapters.fake_publisher_adapter import fake_publisher_adapter
 from domain.enums import OrderStatus
 
 DEFAULT_ORDER = {
@@ -286,3 +292,230 @@ def test_should_fail_to_update_status_with_invalid_order_id(client: Client):
     response = client.patch(f"/orders/{invalid_id}", data=update_data)
 
     assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_should_write_order_created_event_to_outbox(client: Client):
+    response = client.post("/orders", data=DEFAULT_ORDER)
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert [event.event_name for event in fake_publisher_adapter.events] == [
+        "order.created"
+    ]
+
+
+def test_should_write_status_changed_event_to_outbox(client: Client):
+    order_id = client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+
+    client.patch(f"/orders/{order_id}", data={"newStatus": OrderStatus.CANCELLED.value})
+
+    assert [event.event_name for event in fake_publisher_adapter.events][-2:] == [
+        "order.changedStatus",
+        "order.cancelled",
+    ]
+
+
+def test_should_create_orders_in_batch(client: Client):
+    response = client.post(
+        "/orders/batch", data={"orders": [DEFAULT_ORDER, DEFAULT_ORDER]}
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS
+    results = response.json()["results"]
+    assert len(results) == 2
+    assert all(result["created"] for result in results)
+    for result in results:
+        assert fake_order_repository.find_by_id(result["orderId"]) is not None
+    assert len(fake_publisher_adapter.events) == 2
+
+
+def test_should_fail_to_create_empty_batch(client: Client):
+    response = client.post("/orders/batch", data={"orders": []})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_should_fail_to_create_batch_with_invalid_order(client: Client):
+    invalid_order = {**DEFAULT_ORDER, "customerId": "invalid-uuid"}
+    response = client.post(
+        "/orders/batch", data={"orders": [DEFAULT_ORDER, invalid_order]}
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert len(fake_order_repository.data) == 0
+
+
+def test_should_lookup_orders_in_request_order(client: Client):
+    first_id = client.post("/orders", data=DEFAULT_ORDER).json()["orderId"]
+    second_id = client.post("/orders", data=DEFAULT_ORDER).json()["orderId"]
+    missing_id = str(uuid4())
+
+    response = client.post(
+        "/orders/lookup", data={"orderIds": [second_id, missing_id, first_id]}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert [order["id"] for order in body["items"]] == [second_id, first_id]
+    assert body["items"][0]["items"][0]["productName"] == "Produto Teste"
+    assert body["missingIds"] == [missing_id]
+
+
+def test_should_fail_to_lookup_without_order_ids(client: Client):
+    response = client.post("/orders/lookup", data={"orderIds": []})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_should_export_orders_as_ndjson(client: Client):
+    order = {
+        **DEFAULT_ORDER,
+        "items": [{**DEFAULT_ORDER["items"][0], "unityPrice": "100.50"}],
+    }
+    cancelled_id = client.post("/orders", data=order).json()["orderId"]
+    client.post("/orders", data=DEFAULT_ORDER)
+    client.patch(
+        f"/orders/{cancelled_id}", data={"newStatus": OrderStatus.CANCELLED.value}
+    )
+
+    response = client.get("/orders/export", params={"status": "CANCELLED"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    row = json.loads(lines[0])
+    assert row["id"] == cancelled_id
+    assert row["status"] == OrderStatus.CANCELLED.value
+    assert row["totalAmount"] == "201.00"
+    assert row["items"][0]["unityPrice"] == "100.50"
+
+
+def test_should_export_nothing_outside_the_date_range(client: Client):
+    client.post("/orders", data=DEFAULT_ORDER)
+
+    response = client.get(
+        "/orders/export", params={"createdTo": "2000-01-01T00:00:00+00:00"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == ""
+
+
+def test_should_export_order_items_as_parquet(client: Client):
+    order_id = client.post("/orders", data=DEFAULT_ORDER).json()["orderId"]
+
+    response = client.get("/orders/export/items", params={"status": "CREATED"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    table = pq.read_table(BytesIO(response.content))
+    assert [str(value) for value in table.column("order_id").to_pylist()] == [order_id]
+    assert table.column("quantity").to_pylist() == [2]
+
+
+def test_should_fail_to_export_unknown_table(client: Client):
+    response = client.get("/orders/export/customers")
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_should_update_status_of_orders_in_batch(client: Client):
+    created_id = client.post("/orders", data=DEFAULT_ORDER).json()["orderId"]
+    cancelled_id = client.post("/orders", data=DEFAULT_ORDER).json()["orderId"]
+    client.patch(
+        f"/orders/{cancelled_id}", data={"newStatus": OrderStatus.CANCELLED.value}
+    )
+    missing_id = str(uuid4())
+
+    response = client.patch(
+        "/orders/status",
+        data={
+            "orderIds": [created_id, cancelled_id, missing_id, created_id],
+            "newStatus": OrderStatus.PROCESSING.value,
+        },
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS
+    results = response.json()["results"]
+    assert [result["orderId"] for result in results] == [
+        created_id,
+        cancelled_id,
+        missing_id,
+    ]
+    assert [result["updated"] for result in results] == [True, False, False]
+    assert "already cancelled" in results[1]["error"]
+    assert "not found" in results[2]["error"]
+
+    order = fake_order_repository.find_by_id(created_id)
+    assert order is not None
+    assert order.status == OrderStatus.PROCESSING
+    assert fake_publisher_adapter.events[-1].event_name == "order.changedStatus"
+
+
+def test_should_fail_to_update_status_of_empty_batch(client: Client):
+    response = client.patch(
+        "/orders/status",
+        data={"orderIds": [], "newStatus": OrderStatus.PROCESSING.value},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_should_list_orders_page_by_page(client: Client):
+    order_ids = {
+        client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+        for _ in range(3)
+    }
+
+    first_page = client.get("/orders", params={"limit": 2}).json()
+    assert len(first_page["items"]) == 2
+    assert first_page["nextCursor"] is not None
+
+    second_page = client.get(
+        "/orders", params={"limit": 2, "cursor": first_page["nextCursor"]}
+    ).json()
+    assert len(second_page["items"]) == 1
+    assert second_page["nextCursor"] is None
+
+    listed_ids = [item["id"] for item in first_page["items"] + second_page["items"]]
+    assert set(listed_ids) == order_ids
+
+
+def test_should_list_orders_filtered_by_status(client: Client):
+    order_id = client.post("/orders", data=DEFAULT_ORDER).json().get("orderId")
+    client.post("/orders", data=DEFAULT_ORDER)
+    client.patch(f"/orders/{order_id}", data={"newStatus": OrderStatus.CANCELLED.value})
+
+    response = client.get("/orders", params={"status": OrderStatus.CANCELLED.value})
+
+    assert response.status_code == HTTPStatus.OK
+    assert [item["id"] for item in response.json()["items"]] == [order_id]
+
+
+def test_should_list_orders_filtered_by_customer_id(client: Client):
+    client.post("/orders", data=DEFAULT_ORDER)
+
+    response = client.get("/orders", params={"customerId": str(uuid4())})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"items": [], "nextCursor": None}
+
+
+def test_should_fail_to_list_orders_with_invalid_cursor(client: Client):
+    response = client.get("/orders", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_should_fail_to_list_orders_with_limit_above_maximum(client: Client):
+    response = client.get("/orders", params={"limit": 100000})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_should_refuse_outbox_without_transactions():
+    with pytest.raises(RuntimeError):
+        ensure_atomic_outbox(outbox_enabled=True, transactions_enabled=False)
+
+    ensure_atomic_outbox(outbox_enabled=False, transactions_enabled=False)
+    ensure_atomic_outbox(outbox_enabled=True, transactions_enabled=True)
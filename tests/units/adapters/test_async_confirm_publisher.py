@@ -0,0 +1,175 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+from aiormq.exceptions import ChannelInvalidStateError, DeliveryError
+from pamqp.commands import Basic
+
+from infra.adapters import AsyncConfirmPublisher, ConfirmPublisher, OutgoingMessage
+
+
+class FakeExchange:
+    def __init__(
+        self,
+        nacks: int = 0,
+        returned: bool = False,
+        failing: Optional[List[str]] = None,
+        delay: float = 0,
+    ):
+        self.nacks = nacks
+        self.returned = returned
+        self.failing = failing or []
+        self.delay = delay
+        self.published: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def publish(
+        self, message: Any, routing_key: str, timeout: Optional[float] = None
+    ):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.wait_for(asyncio.sleep(self.delay), timeout)
+            self.published.append(message.message_id)
+            if message.message_id in self.failing:
+                raise ChannelInvalidStateError("channel closed")
+            if self.nacks:
+                self.nacks -= 1
+                raise DeliveryError(None, Basic.Nack())
+            return object() if self.returned else Basic.Ack()
+        finally:
+            self.in_flight -= 1
+
+
+class FakeConnectionPool:
+    def __init__(self, exchange: FakeExchange):
+        self.exchange = exchange
+
+    @asynccontextmanager
+    async def channel(self) -> AsyncIterator[Any]:
+        yield object()
+
+    async def get_exchange(self, channel: Any, exchange: str):
+        return self.exchange
+
+
+def build_messages(count: int) -> List[OutgoingMessage]:
+    return [
+        OutgoingMessage(routing_key="order.created", body=b"{}", message_id=str(index))
+        for index in range(count)
+    ]
+
+
+def test_should_pipeline_messages_within_window():
+    exchange = FakeExchange()
+    publisher = AsyncConfirmPublisher(
+        connection_pool=FakeConnectionPool(exchange),  # type: ignore
+        max_in_flight=4,
+    )
+
+    confirmed = asyncio.run(publisher.publish("orders", build_messages(10)))
+
+    assert confirmed == [True] * 10
+    assert exchange.max_in_flight == 4
+    assert publisher.in_flight == 0
+
+
+def test_should_retry_nacked_messages():
+    exchange = FakeExchange(nacks=2)
+    publisher = AsyncConfirmPublisher(
+        connection_pool=FakeConnectionPool(exchange),  # type: ignore
+        max_in_flight=1,
+        max_retries=3,
+    )
+
+    confirmed = asyncio.run(publisher.publish("orders", build_messages(1)))
+
+    assert confirmed == [True]
+    assert exchange.published == ["0", "0", "0"]
+
+
+def test_should_give_up_after_max_retries():
+    exchange = FakeExchange(nacks=10)
+    publisher = AsyncConfirmPublisher(
+        connection_pool=FakeConnectionPool(exchange),  # type: ignore
+        max_retries=2,
+    )
+
+    confirmed = asyncio.run(publisher.publish("orders", build_messages(1)))
+
+    assert confirmed == [False]
+    assert len(exchange.published) == 3
+
+
+def test_should_not_confirm_returned_messages():
+    exchange = FakeExchange(returned=True)
+    publisher = AsyncConfirmPublisher(
+        connection_pool=FakeConnectionPool(exchange)  # type: ignore
+    )
+
+    assert asyncio.run(publisher.publish("orders", build_messages(2))) == [
+        False,
+        False,
+    ]
+
+
+def test_should_publish_from_synchronous_callers():
+    exchange = FakeExchange()
+    closed: List[bool] = []
+
+    class ClosableConnectionPool(FakeConnectionPool):
+        async def close(self):
+            closed.append(True)
+
+    publisher = ConfirmPublisher(
+        connection_pool_factory=lambda: ClosableConnectionPool(exchange)  # type: ignore
+    )
+
+    confirmed = publisher.publish("orders", build_messages(3))
+    publisher.close()
+
+    assert confirmed == [True, True, True]
+    assert closed == [True]
+
+
+def test_should_report_messages_on_a_failed_channel_as_unconfirmed():
+    exchange = FakeExchange(failing=["1"])
+    publisher = AsyncConfirmPublisher(
+        connection_pool=FakeConnectionPool(exchange)  # type: ignore
+    )
+
+    confirmed = asyncio.run(publisher.publish("orders", build_messages(3)))
+
+    assert confirmed == [True, False, True]
+    assert publisher.in_flight == 0
+
+
+def test_should_report_late_confirmations_as_unconfirmed():
+    exchange = FakeExchange(delay=1)
+    publisher = AsyncConfirmPublisher(
+        connection_pool=FakeConnectionPool(exchange),  # type: ignore
+        confirm_timeout_ms=10,
+    )
+
+    assert asyncio.run(publisher.publish("orders", build_messages(2))) == [
+        False,
+        False,
+    ]
+
+
+def test_should_bound_synchronous_publishes():
+    exchange = FakeExchange(delay=1)
+
+    class ClosableConnectionPool(FakeConnectionPool):
+        async def close(self):
+            pass
+
+    publisher = ConfirmPublisher(
+        publish_timeout_ms=10,
+        connection_pool_factory=lambda: ClosableConnectionPool(exchange),  # type: ignore
+    )
+
+    confirmed = publisher.publish("orders", build_messages(2))
+    publisher.close()
+
+    assert confirmed == [False, False]
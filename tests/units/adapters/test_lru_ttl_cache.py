@@ -0,0 +1,57 @@
+from infra.adapters import LruTtlCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_should_count_hits_and_misses():
+    cache: LruTtlCache[str] = LruTtlCache(max_size=2, ttl_seconds=10)
+
+    assert cache.get("a") is None
+    cache.set("a", "value")
+
+    assert cache.get("a") == "value"
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_should_evict_least_recently_used_entry():
+    cache: LruTtlCache[str] = LruTtlCache(max_size=2, ttl_seconds=10)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_should_expire_entries_after_ttl():
+    clock = FakeClock()
+    cache: LruTtlCache[str] = LruTtlCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set("a", "A")
+
+    clock.now = 10
+
+    assert cache.get("a") is None
+    assert cache.evictions == 1
+    assert len(cache) == 0
+
+
+def test_should_invalidate_entry():
+    cache: LruTtlCache[str] = LruTtlCache(max_size=2, ttl_seconds=10)
+    cache.set("a", "A")
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+
+    assert cache.get("a") is None
@@ -0,0 +1,127 @@
+from decimal import Decimal
+from uuid import uuid4
+from typing import Any, Callable, List
+import pytest
+from mockito import mock
+
+from domain.events import OrderCreatedEvent
+from infra.adapters import (
+    MongoTransactionAdapter,
+    NoSqlAdapter,
+    OutgoingMessage,
+    PublisherAdapter,
+)
+
+
+class FakeSession:
+    def __init__(self, transient_failures: int = 0):
+        self.transient_failures = transient_failures
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: Any):
+        return False
+
+    def with_transaction(self, callback: Callable[[Any], Any]):
+        while self.transient_failures:
+            self.transient_failures -= 1
+            callback(self)
+        return callback(self)
+
+
+def build_transaction(session: FakeSession) -> MongoTransactionAdapter:
+    adapter = mock(NoSqlAdapter)
+    adapter.session = None
+    adapter.client = mock({"start_session": lambda: session})
+    return MongoTransactionAdapter(adapter=adapter, enabled=True)
+
+
+def test_should_run_callbacks_once_after_commit():
+    transaction = build_transaction(FakeSession(transient_failures=1))
+    calls: List[str] = []
+
+    def operation() -> str:
+        transaction.after_commit(lambda: calls.append("invalidate"))
+        assert calls == []
+        return "done"
+
+    assert transaction.execute(operation) == "done"
+    assert calls == ["invalidate"]
+
+
+def test_should_drop_callbacks_of_an_aborted_transaction():
+    transaction = build_transaction(FakeSession())
+    calls: List[str] = []
+
+    def operation() -> None:
+        transaction.after_commit(lambda: calls.append("invalidate"))
+        raise RuntimeError("abort")
+
+    with pytest.raises(RuntimeError):
+        transaction.execute(operation)
+
+    assert calls == []
+    transaction.after_commit(lambda: calls.append("now"))
+    assert calls == ["now"]
+
+
+def test_should_run_callbacks_of_failed_operations_without_transactions():
+    transaction = MongoTransactionAdapter(adapter=mock(NoSqlAdapter), enabled=False)
+    calls: List[str] = []
+
+    def operation() -> None:
+        transaction.after_commit(lambda: calls.append("invalidate"))
+        raise RuntimeError("partial write")
+
+    with pytest.raises(RuntimeError):
+        transaction.execute(operation)
+
+    assert calls == ["invalidate"]
+
+
+CREATED_EVENT = OrderCreatedEvent(
+    order_id=uuid4(), customer_id=uuid4(), items_count=1, total_amount=Decimal("10")
+)
+
+
+class RecordingConfirmPublisher:
+    def __init__(self):
+        self.sent: List[str] = []
+
+    def publish(self, exchange: str, messages: List[OutgoingMessage]) -> List[bool]:
+        self.sent.extend(message.routing_key for message in messages)
+        return [True] * len(messages)
+
+
+def test_should_publish_directly_only_once_after_commit():
+    transaction = build_transaction(FakeSession(transient_failures=1))
+    confirm_publisher = RecordingConfirmPublisher()
+    publisher = PublisherAdapter(
+        publisher=confirm_publisher, transaction=transaction  # type: ignore
+    )
+
+    def operation() -> None:
+        publisher.publish_event(CREATED_EVENT)
+        assert confirm_publisher.sent == []
+
+    transaction.execute(operation)
+
+    assert confirm_publisher.sent == ["order.created"]
+
+
+def test_should_not_publish_directly_for_an_aborted_transaction():
+    transaction = build_transaction(FakeSession())
+    confirm_publisher = RecordingConfirmPublisher()
+    publisher = PublisherAdapter(
+        publisher=confirm_publisher, transaction=transaction  # type: ignore
+    )
+
+    def operation() -> None:
+        publisher.publish_event(CREATED_EVENT)
+        raise RuntimeError("abort")
+
+    with pytest.raises(RuntimeError):
+        transaction.execute(operation)
+
+    assert confirm_publisher.sent == []
@@ -39,7 +39,7 @@ def test_should_create_order_with_default_values():
     assert isinstance(order.id, UUID)
     assert order.customer_id == customer_id
     assert order.shipping_address == shipping_address
-    assert order.items == items
+    assert order.items == tuple(items)
     assert order.status == OrderStatus.CREATED
     assert isinstance(order.created_at, datetime)
     assert isinstance(order.updated_at, datetime)
@@ -157,7 +157,7 @@ def test_should_create_order_with_factory_method():
     assert isinstance(order.id, UUID)
     assert order.customer_id == customer_id
     assert order.shipping_address == shipping_address
-    assert order.items == items
+    assert order.items == tuple(items)
     assert order.status == OrderStatus.CREATED
 
 
@@ -474,3 +474,125 @@ def test_should_add_status_changed_event_with_metadata():
     assert isinstance(event, OrderStatusChangedEvent)
     assert event.changed_by == "admin@example.com"
     assert event.reason == "Manual processing"
+
+
+def test_should_list_allowed_source_statuses_for_a_target_status():
+    assert Order.allowed_source_statuses(OrderStatus.PROCESSING) == (
+        OrderStatus.CREATED,
+    )
+    assert Order.allowed_source_statuses(OrderStatus.CANCELLED) == (
+        OrderStatus.CREATED,
+        OrderStatus.PROCESSING,
+    )
+    assert Order.allowed_source_statuses(OrderStatus.CREATED) == ()
+
+
+def test_should_keep_order_items_and_events_without_instance_dict():
+    order = Order.create(
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name="Product",
+                quantity=1,
+                unit_price=Decimal("10.00"),
+            )
+        ],
+    )
+    order.change_status(OrderStatus.CANCELLED)
+
+    for instance in [order, *order.items, *order.pending_events]:
+        assert not hasattr(instance, "__dict__")
+
+
+def test_should_keep_total_amount_when_items_change():
+    first = OrderItem(
+        product_id=uuid4(),
+        product_name="First",
+        quantity=2,
+        unit_price=Decimal("10.00"),
+    )
+    second = OrderItem(
+        product_id=uuid4(),
+        product_name="Second",
+        quantity=1,
+        unit_price=Decimal("5.50"),
+    )
+    order = Order(customer_id=uuid4(), shipping_address="Test Address", items=[])
+
+    order.add_item(first)
+    order.add_item(second)
+
+    assert order.total_amount == Decimal("25.50")
+    assert order.items_count == 2
+
+    order.remove_item(first)
+
+    assert order.total_amount == Decimal("5.50")
+    assert order.items_count == 1
+
+    order.items = [first, first]
+
+    assert order.total_amount == Decimal("40.00")
+    assert order.items_count == 2
+
+
+def test_should_report_orders_that_cannot_transition():
+    orders = {
+        status: Order(
+            customer_id=uuid4(),
+            shipping_address="Test Address",
+            items=[],
+            status=status,
+        )
+        for status in OrderStatus
+    }
+
+    errors = Order.validate_transitions(orders.values(), OrderStatus.CANCELLED)
+
+    assert set(errors) == {
+        orders[OrderStatus.SHIPPED].id,
+        orders[OrderStatus.DELIVERED].id,
+        orders[OrderStatus.CANCELLED].id,
+    }
+    assert isinstance(
+        errors[orders[OrderStatus.SHIPPED].id], InvalidStatusTransitionError
+    )
+    assert isinstance(
+        errors[orders[OrderStatus.DELIVERED].id], OrderAlreadyDeliveredError
+    )
+    assert isinstance(
+        errors[orders[OrderStatus.CANCELLED].id], OrderAlreadyCancelledError
+    )
+
+
+def test_should_not_expose_mutable_items():
+    item = OrderItem(
+        product_id=uuid4(),
+        product_name="Item",
+        quantity=1,
+        unit_price=Decimal("10.00"),
+    )
+    items = [item]
+    order = Order(customer_id=uuid4(), shipping_address="Test Address", items=items)
+
+    items.append(item)
+
+    assert isinstance(order.items, tuple)
+    assert order.items_count == 1
+    assert order.total_amount == Decimal("10.00")
+
+
+def test_should_compute_total_only_when_it_is_read():
+    item = OrderItem(
+        product_id=uuid4(),
+        product_name="Item",
+        quantity=2,
+        unit_price=Decimal("10.00"),
+    )
+    order = Order(customer_id=uuid4(), shipping_address="Test Address", items=[])
+    order.items = [item]
+    order.add_item(item)
+
+    assert order.total_amount == Decimal("40.00")
@@ -0,0 +1,95 @@
+from io import BytesIO
+from uuid import uuid4
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from domain.entities import Order, OrderItem
+from domain.enums import OrderStatus
+from infra.exports import ORDER_ITEMS_SCHEMA, ORDERS_SCHEMA, OrdersColumnarExporter
+from infra.repositories import OrdersRepository
+
+
+def build_rows(size: int) -> List[Dict[str, Any]]:
+    orders = [
+        Order(
+            customer_id=uuid4(),
+            shipping_address=f"Address {index}",
+            items=[
+                OrderItem(
+                    product_id=uuid4(),
+                    product_name="Product",
+                    quantity=index + 1,
+                    unit_price=Decimal("10.50"),
+                )
+                for _ in range(2)
+            ],
+            status=OrderStatus.SHIPPED if index % 2 else OrderStatus.CREATED,
+        )
+        for index in range(size)
+    ]
+    return [
+        OrdersRepository.to_export_row(OrdersRepository.to_document(order))
+        for order in orders
+    ]
+
+
+def test_should_write_orders_and_flattened_items_in_row_groups():
+    rows = build_rows(5)
+    orders_file, items_file = BytesIO(), BytesIO()
+
+    exported = OrdersColumnarExporter(row_group_size=2).write(
+        iter(rows), orders_file, items_file
+    )
+
+    orders = pq.ParquetFile(BytesIO(orders_file.getvalue()))
+    items = pq.read_table(BytesIO(items_file.getvalue()))
+    assert exported == 5
+    assert orders.metadata.num_row_groups == 3
+    assert orders.schema_arrow == ORDERS_SCHEMA
+    assert items.schema == ORDER_ITEMS_SCHEMA
+    assert items.num_rows == 10
+
+    table = orders.read()
+    assert table.column("id")[0].as_py() == rows[0]["id"]
+    assert table.column("status").to_pylist()[:2] == ["CREATED", "SHIPPED"]
+    assert table.column("total_amount")[1].as_py() == Decimal("42.0000")
+    created_at = rows[0]["createdAt"]
+    # timestamps keep milliseconds, like BSON dates.
+    assert table.column("created_at")[0].as_py() == created_at.replace(
+        microsecond=created_at.microsecond // 1000 * 1000
+    )
+    assert items.column("subtotal")[2].as_py() == Decimal("21.0000")
+    assert items.column("order_id")[2].as_py() == rows[1]["id"]
+
+
+def test_should_stream_a_readable_file_one_row_group_at_a_time():
+    rows = build_rows(3)
+    closed = []
+
+    def source() -> Iterator[Dict[str, Any]]:
+        try:
+            yield from rows
+        finally:
+            closed.append(True)
+
+    chunks = list(
+        OrdersColumnarExporter(file_format="arrow", row_group_size=1).stream(
+            source(), "items"
+        )
+    )
+
+    table = pa.ipc.open_file(BytesIO(b"".join(chunks))).read_all()
+    assert len(chunks) == 4
+    assert table.num_rows == 6
+    assert table.column("quantity").to_pylist() == [1, 1, 2, 2, 3, 3]
+    assert closed == [True]
+
+
+def test_should_write_empty_files_when_nothing_matches():
+    chunks = list(OrdersColumnarExporter().stream(iter([]), "orders"))
+
+    table = pq.read_table(BytesIO(b"".join(chunks)))
+    assert table.num_rows == 0
+    assert table.schema == ORDERS_SCHEMA
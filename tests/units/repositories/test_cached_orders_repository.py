@@ -0,0 +1,158 @@
+from typing import Any, Dict
+from uuid import uuid4
+import pytest
+from mockito import spy2, verify
+
+from domain.entities import Order
+from domain.enums import OrderStatus
+from infra.adapters import LruTtlCache
+from infra.repositories import CachedOrdersRepository, OrdersRepository
+from tests.fixtures.repositories.fake_order_repository import FakeOrderRepository
+from tests.fixtures.adapters.fake_transaction_adapter import FakeTransactionAdapter
+
+
+def build_repository():
+    repository = FakeOrderRepository()
+    cache: LruTtlCache[Dict[str, Any]] = LruTtlCache(max_size=10, ttl_seconds=60)
+    return repository, cache, CachedOrdersRepository(repository, cache)
+
+
+def build_order() -> Order:
+    return Order(customer_id=uuid4(), shipping_address="Address", items=[])
+
+
+def test_should_read_through_cache():
+    repository, cache, cached_repository = build_repository()
+    order = build_order()
+    repository.save(order)
+    spy2(repository.find_by_id)
+
+    first = cached_repository.find_by_id(order.id)
+    second = cached_repository.find_by_id(order.id)
+
+    verify(repository, times=1).find_by_id(order.id)
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert first is not None and second is not None
+    assert first.id == second.id == order.id
+    assert first.to_dict() == second.to_dict() == order.to_dict()
+
+
+def test_should_build_a_new_order_on_each_hit():
+    repository, _, cached_repository = build_repository()
+    order = build_order()
+    repository.save(order)
+    cached_repository.find_by_id(order.id)
+
+    first = cached_repository.find_by_id(order.id)
+    assert first is not None
+    first.change_status(OrderStatus.PROCESSING)
+    second = cached_repository.find_by_id(order.id)
+
+    assert second is not None and second is not first
+    assert second.status == OrderStatus.CREATED
+
+
+def test_should_not_cache_missing_order():
+    _, cache, cached_repository = build_repository()
+
+    assert cached_repository.find_by_id(uuid4()) is None
+    assert len(cache) == 0
+
+
+def test_should_not_cache_projected_reads():
+    repository, cache, cached_repository = build_repository()
+    order = build_order()
+    repository.save(order)
+
+    assert cached_repository.find_by_id(order.id, item_fields=()) is order
+    assert len(cache) == 0
+    assert cache.misses == 0
+
+
+def test_should_read_only_missing_orders_of_a_multi_get():
+    repository, cache, cached_repository = build_repository()
+    cached, uncached = build_order(), build_order()
+    repository.save(cached)
+    repository.save(uncached)
+    cached_repository.find_by_id(cached.id)
+    spy2(repository.find_many)
+
+    missing_id = uuid4()
+
+    orders = cached_repository.find_many([cached.id, uncached.id, missing_id])
+
+    assert {order.id for order in orders} == {cached.id, uncached.id}
+    verify(repository, times=1).find_many([uncached.id, missing_id])
+    assert cache.get(str(uncached.id)) == OrdersRepository.to_document(uncached)
+
+
+def test_should_invalidate_on_update_status():
+    _, cache, cached_repository = build_repository()
+    order = build_order()
+    cached_repository.save(order)
+    cached_repository.find_by_id(order.id)
+
+    cached_repository.update_status(order.id, OrderStatus.PROCESSING)
+
+    assert len(cache) == 0
+
+
+def test_should_invalidate_on_transition_status():
+    _, cache, cached_repository = build_repository()
+    order = build_order()
+    cached_repository.save(order)
+    cached_repository.find_by_id(order.id)
+
+    cached_repository.transition_status(order.id, OrderStatus.CANCELLED)
+
+    assert len(cache) == 0
+
+
+def test_should_invalidate_on_save():
+    _, cache, cached_repository = build_repository()
+    order = build_order()
+    cache.set(str(order.id), OrdersRepository.to_document(order))
+
+    cached_repository.save(order)
+
+    assert cache.get(str(order.id)) is None
+
+
+def test_should_invalidate_only_after_the_transaction_commits():
+    repository = FakeOrderRepository()
+    cache: LruTtlCache[Dict[str, Any]] = LruTtlCache(max_size=10, ttl_seconds=60)
+    transaction = FakeTransactionAdapter()
+    cached_repository = CachedOrdersRepository(repository, cache, transaction)
+    order = build_order()
+    cached_repository.save(order)
+    cached_repository.find_by_id(order.id)
+
+    def update() -> bool:
+        updated = cached_repository.update_status(order.id, OrderStatus.PROCESSING)
+        assert cache.get(str(order.id)) is not None
+        return updated
+
+    transaction.execute(update)
+
+    assert cache.get(str(order.id)) is None
+
+
+def test_should_keep_cache_when_the_transaction_aborts():
+    repository = FakeOrderRepository()
+    cache: LruTtlCache[Dict[str, Any]] = LruTtlCache(max_size=10, ttl_seconds=60)
+    transaction = FakeTransactionAdapter()
+    cached_repository = CachedOrdersRepository(repository, cache, transaction)
+    order = build_order()
+    cached_repository.save(order)
+    cached_repository.find_by_id(order.id)
+    cached_document = OrdersRepository.to_document(order)
+
+    def update() -> None:
+        cached_repository.update_status(order.id, OrderStatus.PROCESSING)
+        raise RuntimeError("abort")
+
+    with pytest.raises(RuntimeError):
+        transaction.execute(update)
+
+    assert cache.get(str(order.id)) == cached_document
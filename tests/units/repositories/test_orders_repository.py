@@ -0,0 +1,266 @@
+from uuid import uuid4
+from decimal import Decimal
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+from bson import Binary, CodecOptions, Decimal128, decode, encode
+import pytest
+
+from application.dtos import ListOrdersFilterDTO
+from domain.entities import Order, OrderItem
+from domain.enums import OrderStatus
+from domain.exceptions import InvalidCursorError
+from infra.repositories import OrdersBsonMigration, OrdersRepository, bson_values
+from infra.repositories.orders_repository import ORDERS_READ_PROJECTION
+from infra.repositories.orders_cursor import encode_cursor, decode_cursor
+
+
+def test_should_build_page_query_from_filters():
+    customer_id = uuid4()
+    filters = ListOrdersFilterDTO(
+        customer_id=customer_id,
+        status=OrderStatus.SHIPPED,
+        created_from=datetime(2024, 1, 1),
+        created_to=datetime(2024, 2, 1, tzinfo=timezone.utc),
+    )
+
+    query = OrdersRepository.page_query(filters, cursor=None)
+
+    assert query == {
+        "customerId": {"$in": [Binary.from_uuid(customer_id), str(customer_id)]},
+        "status": OrderStatus.SHIPPED.value,
+        "createdAt": {
+            "$gte": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "$lte": datetime(2024, 2, 1, tzinfo=timezone.utc),
+        },
+    }
+
+
+def test_should_seek_after_cursor_position():
+    order_id = uuid4()
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at.isoformat(), str(order_id))
+
+    query = OrdersRepository.page_query(ListOrdersFilterDTO(), cursor=cursor)
+
+    assert query == {
+        "$or": [
+            {"createdAt": {"$lt": created_at}},
+            {"createdAt": created_at, "id": {"$lt": Binary.from_uuid(order_id)}},
+        ]
+    }
+
+
+def test_should_decode_encoded_cursor():
+    order_id = str(uuid4())
+
+    cursor = encode_cursor("2024-01-01T00:00:00+00:00", order_id)
+
+    assert decode_cursor(cursor) == ("2024-01-01T00:00:00+00:00", order_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10=", "WzEsIDJd"])
+def test_should_raise_invalid_cursor_error(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_should_raise_invalid_cursor_error_for_invalid_position():
+    cursor = encode_cursor("yesterday", "not-an-id")
+
+    with pytest.raises(InvalidCursorError):
+        OrdersRepository.page_query(ListOrdersFilterDTO(), cursor=cursor)
+
+
+def build_order() -> Order:
+    return Order.create(
+        customer_id=uuid4(),
+        shipping_address="Rua Teste, 123",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name="Produto",
+                quantity=3,
+                unit_price=Decimal("10.50"),
+            )
+        ],
+    )
+
+
+def test_should_write_native_bson_types():
+    order = build_order()
+
+    document = OrdersRepository.to_document(order)
+
+    assert document["id"] == Binary.from_uuid(order.id)
+    assert document["createdAt"] == order.created_at
+    assert document["items"][0]["productId"] == Binary.from_uuid(
+        order.items[0].product_id
+    )
+    assert document["items"][0]["unitPrice"] == Decimal128("10.50")
+    assert document["items"][0]["subtotal"] == Decimal128("31.50")
+    assert document["totalAmount"] == Decimal128("31.50")
+
+
+def test_should_read_native_and_legacy_documents_alike():
+    order = build_order()
+    native = decode(
+        encode(OrdersRepository.to_document(order)), CodecOptions(tz_aware=True)
+    )
+
+    from_native = OrdersRepository.from_dict(native)
+    from_legacy = OrdersRepository.from_dict(order.to_dict())
+
+    assert from_native.id == from_legacy.id == order.id
+    assert from_native.items == from_legacy.items == order.items
+    assert from_native.total_amount == Decimal("31.50")
+    # BSON dates keep milliseconds only.
+    assert from_native.created_at == order.created_at.replace(
+        microsecond=order.created_at.microsecond // 1000 * 1000
+    )
+    assert from_legacy.created_at == order.created_at
+
+
+def test_should_replace_legacy_document_with_native_one():
+    order = build_order()
+    legacy = {"_id": "object-id", **order.to_dict()}
+
+    replacement = OrdersBsonMigration.to_replacement(legacy)
+
+    assert replacement._filter == {"_id": "object-id", "updatedAt": legacy["updatedAt"]}
+    assert replacement._doc["id"] == Binary.from_uuid(order.id)
+    assert OrdersRepository.from_dict(replacement._doc).items == order.items
+
+
+def test_should_project_only_requested_item_fields():
+    assert OrdersRepository.read_projection() == ORDERS_READ_PROJECTION
+    assert OrdersRepository.read_projection(()) == {
+        "_id": 0,
+        "id": 1,
+        "customerId": 1,
+        "shippingAddress": 1,
+        "status": 1,
+        "createdAt": 1,
+        "updatedAt": 1,
+        "totalAmount": 1,
+    }
+    assert OrdersRepository.read_projection(("unitPrice",))["items.unitPrice"] == 1
+
+
+def test_should_read_projected_document():
+    order = build_order()
+    document = OrdersRepository.to_document(order)
+    for item in document["items"]:
+        del item["productName"]
+
+    projected = OrdersRepository.from_dict(document)
+    summary = OrdersRepository.to_summary(document)
+
+    assert projected.total_amount == order.total_amount
+    assert projected.items[0].product_name == ""
+    assert summary.id == order.id
+    assert summary.status == order.status
+    assert summary.created_at == order.created_at
+
+
+def test_should_trust_stored_total_when_items_are_left_out():
+    order = build_order()
+    document = OrdersRepository.to_document(order)
+    document["items"] = []
+
+    projected = OrdersRepository.from_dict(document)
+
+    assert projected.items == ()
+    assert projected.total_amount == Decimal("31.50")
+
+
+def test_should_filter_transition_on_allowed_source_statuses():
+    order_id = uuid4()
+
+    query = OrdersRepository.transition_status_filter(order_id, OrderStatus.CANCELLED)
+
+    assert query == {
+        "id": {"$in": [Binary.from_uuid(order_id), str(order_id)]},
+        "status": {"$in": ["CREATED", "PROCESSING"]},
+    }
+
+
+def test_should_match_only_binary_ids_once_legacy_ids_are_migrated(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    order_ids = [uuid4(), uuid4()]
+
+    assert OrdersRepository.ids_query(order_ids) == {
+        "id": {
+            "$in": [
+                *(Binary.from_uuid(order_id) for order_id in order_ids),
+                *(str(order_id) for order_id in order_ids),
+            ]
+        }
+    }
+
+    monkeypatch.setattr(bson_values, "LEGACY_UUIDS", False)
+
+    assert OrdersRepository.ids_query(order_ids) == {
+        "id": {"$in": [Binary.from_uuid(order_id) for order_id in order_ids]}
+    }
+    assert OrdersRepository.transition_status_filter(
+        order_ids[0], OrderStatus.CANCELLED
+    )["id"] == Binary.from_uuid(order_ids[0])
+
+
+def test_should_condition_each_batch_update_on_the_status_read():
+    processing = build_order()
+    processing.change_status(OrderStatus.PROCESSING)
+    created = build_order()
+    updated_at = OrdersRepository.batch_updated_at()
+
+    updates = OrdersRepository.transition_status_updates(
+        [processing, created], OrderStatus.CANCELLED, updated_at
+    )
+
+    assert [update._filter for update in updates] == [
+        {
+            "id": {"$in": [Binary.from_uuid(processing.id), str(processing.id)]},
+            "status": "PROCESSING",
+        },
+        {
+            "id": {"$in": [Binary.from_uuid(created.id), str(created.id)]},
+            "status": "CREATED",
+        },
+    ]
+    assert updates[0]._doc == {"$set": {"status": "CANCELLED", "updatedAt": updated_at}}
+    assert updated_at.microsecond % 1000 == 0
+
+
+def test_should_build_export_row_from_native_and_legacy_documents():
+    order = build_order()
+    native = OrdersRepository.to_document(order)
+    legacy = order.to_dict()
+
+    native_row = OrdersRepository.to_export_row(native)
+    legacy_row = OrdersRepository.to_export_row(legacy)
+
+    assert native_row["id"] == legacy_row["id"] == order.id
+    assert native_row["createdAt"] == legacy_row["createdAt"] == order.created_at
+    assert native_row["totalAmount"] == legacy_row["totalAmount"] == Decimal("31.5")
+    assert native_row["items"] == legacy_row["items"]
+    assert native_row["items"][0]["unityPrice"] == Decimal("10.50")
+
+
+def test_should_read_naive_legacy_dates_in_the_legacy_timezone(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    legacy = {"_id": "object-id", **build_order().to_dict()}
+    legacy["createdAt"] = legacy["updatedAt"] = "2024-01-15T09:30:00"
+
+    monkeypatch.setattr(bson_values, "LEGACY_TIMEZONE", ZoneInfo("America/Sao_Paulo"))
+    replacement = OrdersBsonMigration.to_replacement(legacy)
+
+    assert replacement._doc["createdAt"] == datetime(
+        2024, 1, 15, 12, 30, tzinfo=timezone.utc
+    )
+
+    monkeypatch.setattr(bson_values, "LEGACY_TIMEZONE", None)
+    order = OrdersRepository.from_dict(legacy)
+
+    assert order.created_at == datetime(2024, 1, 15, 9, 30).astimezone()
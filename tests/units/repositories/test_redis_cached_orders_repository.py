@@ -0,0 +1,248 @@
+import asyncio
+from time import sleep
+from typing import List, Optional, Sequence
+from uuid import UUID, uuid4
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from fakeredis import FakeServer, FakeRedis, FakeAsyncRedis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from domain.entities import Order, OrderItem
+from domain.enums import OrderStatus
+from infra.repositories import (
+    RedisCachedOrdersRepository,
+    AsyncRedisCachedOrdersRepository,
+)
+from tests.fixtures.adapters.fake_transaction_adapter import FakeTransactionAdapter
+from tests.fixtures.adapters.fake_async_transaction_adapter import (
+    FakeAsyncTransactionAdapter,
+)
+from tests.fixtures.repositories.fake_order_repository import FakeOrderRepository
+from tests.fixtures.repositories.fake_async_order_repository import (
+    FakeAsyncOrderRepository,
+)
+
+
+class SlowOrderRepository(FakeOrderRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def find_by_id(
+        self, order_id: UUID, item_fields: Optional[Sequence[str]] = None
+    ) -> Optional[Order]:
+        self.reads += 1
+        sleep(0.05)
+        return super().find_by_id(order_id, item_fields)
+
+    def find_many(
+        self, order_ids: Sequence[UUID], item_fields: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        self.reads += 1
+        return super().find_many(order_ids, item_fields)
+
+
+def build_order() -> Order:
+    return Order(
+        customer_id=uuid4(),
+        shipping_address="Address",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name="Product",
+                quantity=2,
+                unit_price=Decimal("10.5"),
+            )
+        ],
+    )
+
+
+def test_should_serve_order_from_shared_cache():
+    server = FakeServer()
+    repository = SlowOrderRepository()
+    order = build_order()
+    repository.save(order)
+
+    first_worker = RedisCachedOrdersRepository(repository, FakeRedis(server=server))
+    second_worker = RedisCachedOrdersRepository(repository, FakeRedis(server=server))
+
+    first_worker.find_by_id(order.id)
+    cached_order = second_worker.find_by_id(order.id)
+
+    assert repository.reads == 1
+    assert cached_order is not None
+    assert cached_order.to_dict() == order.to_dict()
+
+
+def test_should_serve_multi_get_from_shared_cache():
+    server = FakeServer()
+    repository = SlowOrderRepository()
+    cached, uncached = build_order(), build_order()
+    repository.save(cached)
+    repository.save(uncached)
+
+    first_worker = RedisCachedOrdersRepository(repository, FakeRedis(server=server))
+    second_worker = RedisCachedOrdersRepository(repository, FakeRedis(server=server))
+
+    first_worker.find_by_id(cached.id)
+    orders = second_worker.find_many([cached.id, uncached.id, uuid4()])
+    again = first_worker.find_many([uncached.id])
+
+    assert repository.reads == 2
+    assert {order.id for order in orders} == {cached.id, uncached.id}
+    assert [order.to_dict() for order in again] == [uncached.to_dict()]
+
+
+def test_should_bump_version_on_update_status():
+    client = FakeRedis()
+    repository = SlowOrderRepository()
+    cached_repository = RedisCachedOrdersRepository(repository, client)
+    order = build_order()
+    cached_repository.save(order)
+    cached_repository.find_by_id(order.id)
+    version = client.get(RedisCachedOrdersRepository.version_key(order.id))
+
+    cached_repository.update_status(order.id, OrderStatus.PROCESSING)
+    cached_order = cached_repository.find_by_id(order.id)
+
+    assert client.get(RedisCachedOrdersRepository.version_key(order.id)) != version
+    assert cached_order is not None
+    assert cached_order.status == OrderStatus.PROCESSING
+    assert repository.reads == 2
+
+
+def test_should_load_order_once_for_concurrent_misses():
+    server = FakeServer()
+    repository = SlowOrderRepository()
+    order = build_order()
+    repository.save(order)
+
+    def find(_: int) -> Optional[Order]:
+        cached_repository = RedisCachedOrdersRepository(
+            repository, FakeRedis(server=server)
+        )
+        return cached_repository.find_by_id(order.id)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(find, range(8)))
+
+    assert repository.reads == 1
+    assert all(result is not None and result.id == order.id for result in results)
+
+
+def test_should_fall_back_to_repository_when_cache_is_unavailable():
+    server = FakeServer()
+    server.connected = False
+    repository = SlowOrderRepository()
+    order = build_order()
+    repository.save(order)
+    cached_repository = RedisCachedOrdersRepository(
+        repository, FakeRedis(server=server)
+    )
+
+    assert cached_repository.find_by_id(order.id) is order
+
+
+def test_should_raise_on_invalidation_when_cache_is_unavailable():
+    server = FakeServer()
+    server.connected = False
+    cached_repository = RedisCachedOrdersRepository(
+        SlowOrderRepository(), FakeRedis(server=server)
+    )
+
+    with pytest.raises(RedisConnectionError):
+        cached_repository.update_status(uuid4(), OrderStatus.PROCESSING)
+
+
+def test_should_cache_and_invalidate_in_async_mode():
+    repository = SlowOrderRepository()
+    cached_repository = AsyncRedisCachedOrdersRepository(
+        FakeAsyncOrderRepository(repository), FakeAsyncRedis()
+    )
+    order = build_order()
+
+    async def scenario() -> Optional[Order]:
+        await cached_repository.save(order)
+        await cached_repository.find_by_id(order.id)
+        await cached_repository.find_by_id(order.id)
+        assert repository.reads == 1
+        await cached_repository.transition_status(order.id, OrderStatus.CANCELLED)
+        return await cached_repository.find_by_id(order.id)
+
+    cached_order = asyncio.run(scenario())
+
+    assert cached_order is not None
+    assert cached_order.status == OrderStatus.CANCELLED
+
+
+def test_should_cache_prices_with_their_decimal_form():
+    repository = SlowOrderRepository()
+    cached_repository = RedisCachedOrdersRepository(repository, FakeRedis())
+    order = Order(
+        customer_id=uuid4(),
+        shipping_address="Address",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name="Product",
+                quantity=2,
+                unit_price=Decimal("10.00"),
+            )
+        ],
+    )
+    repository.save(order)
+
+    cached_repository.find_by_id(order.id)
+    cached_order = cached_repository.find_by_id(order.id)
+
+    assert repository.reads == 1
+    assert cached_order is not None
+    assert str(cached_order.items[0].unit_price) == "10.00"
+    assert str(cached_order.total_amount) == "20.00"
+
+
+def test_should_bump_version_only_after_the_transaction_commits():
+    client = FakeRedis()
+    transaction = FakeTransactionAdapter()
+    cached_repository = RedisCachedOrdersRepository(
+        SlowOrderRepository(), client, transaction=transaction
+    )
+    order = build_order()
+    cached_repository.save(order)
+    version_key = RedisCachedOrdersRepository.version_key(order.id)
+    version = client.get(version_key)
+
+    def update() -> bool:
+        updated = cached_repository.update_status(order.id, OrderStatus.PROCESSING)
+        assert client.get(version_key) == version
+        return updated
+
+    transaction.execute(update)
+
+    assert client.get(version_key) != version
+
+
+def test_should_bump_version_after_commit_in_async_mode():
+    client = FakeAsyncRedis()
+    transaction = FakeAsyncTransactionAdapter()
+    cached_repository = AsyncRedisCachedOrdersRepository(
+        FakeAsyncOrderRepository(SlowOrderRepository()),
+        client,
+        transaction=transaction,
+    )
+    order = build_order()
+    version_key = RedisCachedOrdersRepository.version_key(order.id)
+
+    async def scenario() -> None:
+        await cached_repository.save(order)
+        version = await client.get(version_key)
+
+        async def update() -> None:
+            await cached_repository.transition_status(order.id, OrderStatus.CANCELLED)
+            assert await client.get(version_key) == version
+
+        await transaction.execute(update)
+        assert await client.get(version_key) != version
+
+    asyncio.run(scenario())
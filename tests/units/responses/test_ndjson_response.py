@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterator, List
+from decimal import Decimal
+import pytest
+
+from api.responses import NDJSONResponse
+
+
+def stream(response: NDJSONResponse, fail_after: int = -1) -> List[bytes]:
+    bodies: List[bytes] = []
+
+    async def send(message: Dict[str, Any]):
+        if message["type"] != "http.response.body":
+            return
+        if len(bodies) == fail_after:
+            raise OSError("client disconnected")
+        bodies.append(message["body"])
+
+    asyncio.run(response.stream_response(send))
+    return bodies
+
+
+def test_should_write_one_json_line_per_row_in_chunks():
+    rows = iter([{"id": index, "price": Decimal("1.50")} for index in range(3)])
+
+    bodies = stream(NDJSONResponse(rows, chunk_size=30))
+
+    assert b"".join(bodies) == (
+        b'{"id":0,"price":"1.50"}\n{"id":1,"price":"1.50"}\n{"id":2,"price":"1.50"}\n'
+    )
+    assert bodies[:2] == [
+        b'{"id":0,"price":"1.50"}\n{"id":1,"price":"1.50"}\n',
+        b'{"id":2,"price":"1.50"}\n',
+    ]
+
+
+def test_should_close_sync_rows_when_client_disconnects():
+    closed = []
+
+    def rows() -> Iterator[Dict[str, int]]:
+        try:
+            for index in range(1000):
+                yield {"id": index}
+        finally:
+            closed.append(True)
+
+    with pytest.raises(OSError):
+        stream(NDJSONResponse(rows(), chunk_size=1), fail_after=1)
+
+    assert closed == [True]
+
+
+def test_should_close_async_rows_when_client_disconnects():
+    closed = []
+
+    async def rows() -> AsyncIterator[Dict[str, int]]:
+        try:
+            for index in range(1000):
+                yield {"id": index}
+        finally:
+            closed.append(True)
+
+    with pytest.raises(OSError):
+        stream(NDJSONResponse(rows(), chunk_size=1), fail_after=1)
+
+    assert closed == [True]
@@ -0,0 +1,110 @@
+from uuid import uuid4
+from decimal import Decimal
+from datetime import datetime, timezone
+from json import loads
+from pydantic import TypeAdapter
+import pytest
+
+from api.responses import FastJSONResponse
+from api.schemas import OrderResponse, OrderItemResponse
+from domain.entities import Order, OrderItem
+from domain.enums import OrderStatus
+from infra.serializers import (
+    JsonSerializer,
+    MsgpackSerializer,
+    OrjsonSerializer,
+    create_serializer,
+    serializer_for,
+)
+
+EVENT = {
+    "event_id": uuid4(),
+    "status": OrderStatus.CREATED,
+    "total": Decimal("31.50"),
+}
+
+
+def build_order() -> Order:
+    return Order.create(
+        customer_id=uuid4(),
+        shipping_address="Rua Teste, 123",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name="Produto",
+                quantity=3,
+                unit_price=Decimal("10.50"),
+            )
+        ],
+    )
+
+
+def test_orjson_serializer_should_produce_the_same_event_payload_as_json():
+    order = build_order()
+    order.change_status(OrderStatus.CANCELLED)
+
+    for event in order.pending_events:
+        payload = event.to_dict()
+        assert loads(OrjsonSerializer().dumps(payload)) == loads(
+            JsonSerializer().dumps(payload)
+        )
+
+
+def test_serializers_should_round_trip_payloads():
+    for serializer in (JsonSerializer(), OrjsonSerializer()):
+        payload = serializer.loads(serializer.dumps(EVENT))
+
+        assert payload["total"] == "31.50"
+        assert payload["status"] == OrderStatus.CREATED.value
+        assert serializer.content_type == "application/json"
+
+
+def test_should_create_serializer_by_name():
+    assert isinstance(create_serializer("json"), JsonSerializer)
+    assert isinstance(create_serializer("orjson"), OrjsonSerializer)
+    assert isinstance(create_serializer("msgpack"), MsgpackSerializer)
+
+
+def test_fast_json_response_should_render_like_response_model():
+    response = OrderResponse(
+        id=uuid4(),
+        customerId=uuid4(),
+        shippingAddress="Rua Teste, 123",
+        status=OrderStatus.PROCESSING,
+        createdAt=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        updatedAt=datetime(2024, 1, 2, 3, 4, 5, 1000, tzinfo=timezone.utc),
+        items=[
+            OrderItemResponse(
+                productId=uuid4(),
+                productName="Produto",
+                quantity=2,
+                unityPrice=price,
+            )
+            for price in (Decimal("100.50"), Decimal("7"))
+        ],
+    )
+
+    rendered = FastJSONResponse(response).body
+
+    assert rendered == TypeAdapter(OrderResponse).dump_json(response)
+    assert b'"unityPrice":"100.50"' in rendered
+    assert b'"createdAt":"2024-01-02T03:04:05Z"' in rendered
+
+
+def test_msgpack_serializer_should_decode_to_the_json_event_payload():
+    order = build_order()
+    payload = order.pending_events[0].to_dict()
+    msgpack, json = MsgpackSerializer(), OrjsonSerializer()
+
+    encoded = msgpack.dumps(payload)
+
+    assert msgpack.loads(encoded) == json.loads(json.dumps(payload))
+    assert len(encoded) < len(json.dumps(payload))
+
+
+def test_should_find_serializer_by_content_type():
+    assert isinstance(serializer_for("application/msgpack"), MsgpackSerializer)
+    assert isinstance(serializer_for("application/json"), OrjsonSerializer)
+    assert isinstance(serializer_for(None), OrjsonSerializer)
+    with pytest.raises(ValueError):
+        serializer_for("text/plain")
@@ -0,0 +1,80 @@
+import asyncio
+from uuid import uuid4
+from decimal import Decimal
+from mockito import mock, when, verify
+
+from tests.fixtures.awaitable import awaitable
+from application.use_cases import AsyncCreateOrderUseCase
+from application.repositories import AsyncOrderRepositoryInterface
+from application.adapters import AsyncPublisherAdapterInterface
+from application.dtos import CreateOrderDTO, OrderItemDTO
+from domain.entities import Order
+from domain.enums import OrderStatus
+from domain.events import OrderCreatedEvent
+
+
+def build_dto() -> CreateOrderDTO:
+    return CreateOrderDTO(
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[
+            OrderItemDTO(
+                product_id=uuid4(),
+                product_name="Test Product",
+                quantity=2,
+                unit_price=Decimal("100.50"),
+            )
+        ],
+    )
+
+
+def test_should_create_order_successfully():
+    repository = mock(AsyncOrderRepositoryInterface)
+    publisher = mock(AsyncPublisherAdapterInterface)
+    use_case = AsyncCreateOrderUseCase(repository, publisher)
+    dto = build_dto()
+
+    when(repository).save(...).thenAnswer(awaitable(True))
+    when(publisher).publish_events(...).thenAnswer(awaitable(None))
+
+    result = asyncio.run(use_case.execute(dto))
+
+    assert isinstance(result, Order)
+    assert result.customer_id == dto.customer_id
+    assert result.shipping_address == "Test Address"
+    assert len(result.items) == 1
+    assert result.status == OrderStatus.CREATED
+
+
+def test_should_call_repository_save():
+    repository = mock(AsyncOrderRepositoryInterface)
+    publisher = mock(AsyncPublisherAdapterInterface)
+    use_case = AsyncCreateOrderUseCase(repository, publisher)
+
+    when(repository).save(...).thenAnswer(awaitable(True))
+    when(publisher).publish_events(...).thenAnswer(awaitable(None))
+
+    asyncio.run(use_case.execute(build_dto()))
+
+    verify(repository, times=1).save(...)
+
+
+def test_should_publish_order_created_event():
+    repository = mock(AsyncOrderRepositoryInterface)
+    publisher = mock(AsyncPublisherAdapterInterface)
+    use_case = AsyncCreateOrderUseCase(repository, publisher)
+
+    published_events = None
+
+    async def capture_events(events):
+        nonlocal published_events
+        published_events = events
+
+    when(repository).save(...).thenAnswer(awaitable(True))
+    when(publisher).publish_events(...).thenAnswer(capture_events)
+
+    asyncio.run(use_case.execute(build_dto()))
+
+    assert published_events is not None
+    assert len(published_events) == 1
+    assert isinstance(published_events[0], OrderCreatedEvent)
@@ -0,0 +1,53 @@
+import asyncio
+from uuid import uuid4
+import pytest
+from mockito import mock, when, verify
+
+from tests.fixtures.awaitable import awaitable
+from application.use_cases import AsyncFindOrderByIdUseCase
+from application.repositories import AsyncOrderRepositoryInterface
+from domain.entities import Order
+from domain.exceptions import OrderNotFoundError
+
+
+def test_should_find_order_by_id():
+    repository = mock(AsyncOrderRepositoryInterface)
+    use_case = AsyncFindOrderByIdUseCase(repository)
+
+    order_id = uuid4()
+    expected_order = Order(
+        id=order_id,
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[],
+    )
+
+    when(repository).find_by_id(order_id=order_id).thenAnswer(awaitable(expected_order))
+
+    result = asyncio.run(use_case.execute(order_id))
+
+    assert result == expected_order
+    verify(repository, times=1).find_by_id(order_id=order_id)
+
+
+def test_should_return_none_when_order_not_found():
+    repository = mock(AsyncOrderRepositoryInterface)
+    use_case = AsyncFindOrderByIdUseCase(repository)
+
+    order_id = uuid4()
+    when(repository).find_by_id(order_id=order_id).thenAnswer(awaitable(None))
+
+    assert asyncio.run(use_case.execute(order_id)) is None
+
+
+def test_should_raise_exception_when_order_not_found_and_raise_flag_is_true():
+    repository = mock(AsyncOrderRepositoryInterface)
+    use_case = AsyncFindOrderByIdUseCase(repository)
+
+    order_id = uuid4()
+    when(repository).find_by_id(order_id=order_id).thenAnswer(awaitable(None))
+
+    with pytest.raises(OrderNotFoundError) as exc_info:
+        asyncio.run(use_case.execute(order_id, raise_if_is_none=True))
+
+    assert exc_info.value.order_id == order_id
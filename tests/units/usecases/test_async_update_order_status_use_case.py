@@ -0,0 +1,91 @@
+import asyncio
+from uuid import uuid4
+import pytest
+from mockito import mock, when, verify
+
+from tests.fixtures.awaitable import awaitable
+from application.dtos import OrderSummaryDTO
+from application.use_cases import AsyncUpdateOrderStatusUseCase
+from application.repositories import AsyncOrderRepositoryInterface
+from application.adapters import AsyncPublisherAdapterInterface
+from domain.enums import OrderStatus
+from domain.entities import Order
+from domain.exceptions import OrderNotFoundError, InvalidStatusTransitionError
+
+
+def summary_of(order: Order) -> OrderSummaryDTO:
+    return OrderSummaryDTO(
+        id=order.id,
+        customer_id=order.customer_id,
+        shipping_address=order.shipping_address,
+        status=order.status,
+        created_at=order.created_at,
+        updated_at=order.updated_at,
+    )
+
+
+def test_should_update_order_status_from_created_to_processing():
+    repository = mock(AsyncOrderRepositoryInterface)
+    publisher = mock(AsyncPublisherAdapterInterface)
+    use_case = AsyncUpdateOrderStatusUseCase(repository, publisher)
+
+    order_id = uuid4()
+    order = Order(
+        id=order_id,
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[],
+        status=OrderStatus.CREATED,
+    )
+
+    when(repository).transition_status(
+        order_id=order_id, new_status=OrderStatus.PROCESSING
+    ).thenAnswer(awaitable(order))
+    when(publisher).publish_events(...).thenAnswer(awaitable(None))
+
+    asyncio.run(use_case.execute(order_id, OrderStatus.PROCESSING))
+
+    assert order.status == OrderStatus.PROCESSING
+    verify(repository, times=1).transition_status(
+        order_id=order_id, new_status=OrderStatus.PROCESSING
+    )
+    verify(publisher, times=1).publish_events(...)
+
+
+def test_should_raise_exception_when_order_not_found():
+    repository = mock(AsyncOrderRepositoryInterface)
+    publisher = mock(AsyncPublisherAdapterInterface)
+    use_case = AsyncUpdateOrderStatusUseCase(repository, publisher)
+
+    order_id = uuid4()
+    when(repository).transition_status(...).thenAnswer(awaitable(None))
+    when(repository).find_summary_by_id(order_id=order_id).thenAnswer(awaitable(None))
+
+    with pytest.raises(OrderNotFoundError):
+        asyncio.run(use_case.execute(order_id, OrderStatus.PROCESSING))
+
+    verify(publisher, times=0).publish_events(...)
+
+
+def test_should_fail_invalid_transition_from_created_to_shipped():
+    repository = mock(AsyncOrderRepositoryInterface)
+    publisher = mock(AsyncPublisherAdapterInterface)
+    use_case = AsyncUpdateOrderStatusUseCase(repository, publisher)
+
+    order_id = uuid4()
+    order = Order(
+        id=order_id,
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[],
+        status=OrderStatus.CREATED,
+    )
+    when(repository).transition_status(...).thenAnswer(awaitable(None))
+    when(repository).find_summary_by_id(order_id=order_id).thenAnswer(
+        awaitable(summary_of(order))
+    )
+
+    with pytest.raises(InvalidStatusTransitionError):
+        asyncio.run(use_case.execute(order_id, OrderStatus.SHIPPED))
+
+    verify(publisher, times=0).publish_events(...)
@@ -0,0 +1,116 @@
+from uuid import uuid4
+from decimal import Decimal
+from mockito import mock, when, verify
+
+from application.use_cases import CreateOrdersBatchUseCase
+from application.repositories import OrderRepositoryInterface
+from application.adapters import PublisherAdapterInterface
+from application.dtos import CreateOrderDTO, OrderItemDTO
+from domain.entities import Order
+from domain.events import DomainEvent, OrderCreatedEvent
+
+
+def build_dto(shipping_address: str = "Test Address") -> CreateOrderDTO:
+    return CreateOrderDTO(
+        customer_id=uuid4(),
+        shipping_address=shipping_address,
+        items=[
+            OrderItemDTO(
+                product_id=uuid4(),
+                product_name="Test Product",
+                quantity=1,
+                unit_price=Decimal("50.00"),
+            )
+        ],
+    )
+
+
+def test_should_create_all_orders_of_the_batch():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = CreateOrdersBatchUseCase(repository, publisher)
+
+    when(repository).save_many(...).thenReturn({})
+    when(publisher).publish_events(...).thenReturn(None)
+
+    results = use_case.execute([build_dto("Address 1"), build_dto("Address 2")])
+
+    assert len(results) == 2
+    assert all(result.created for result in results)
+    assert [result.order.shipping_address for result in results] == [
+        "Address 1",
+        "Address 2",
+    ]
+
+
+def test_should_save_all_orders_with_a_single_call():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = CreateOrdersBatchUseCase(repository, publisher)
+
+    saved_orders = None
+
+    def capture_orders(orders: list[Order]):
+        nonlocal saved_orders
+        saved_orders = orders
+        return {}
+
+    when(repository).save_many(...).thenAnswer(capture_orders)
+    when(publisher).publish_events(...).thenReturn(None)
+
+    use_case.execute([build_dto(), build_dto(), build_dto()])
+
+    assert saved_orders is not None
+    assert len(saved_orders) == 3
+    verify(repository, times=1).save_many(...)
+    verify(repository, times=0).save(...)
+
+
+def test_should_publish_events_of_all_orders_with_a_single_call():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = CreateOrdersBatchUseCase(repository, publisher)
+
+    published_events = None
+
+    def capture_events(events: list[DomainEvent]):
+        nonlocal published_events
+        published_events = events
+
+    when(repository).save_many(...).thenReturn({})
+    when(publisher).publish_events(...).thenAnswer(capture_events)
+
+    use_case.execute([build_dto(), build_dto()])
+
+    assert published_events is not None
+    assert len(published_events) == 2
+    assert all(isinstance(event, OrderCreatedEvent) for event in published_events)
+    verify(publisher, times=1).publish_events(...)
+
+
+def test_should_report_failed_orders_without_failing_the_batch():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = CreateOrdersBatchUseCase(repository, publisher)
+
+    published_events = None
+
+    def fail_second_order(orders: list[Order]):
+        return {orders[1].id: "duplicate key"}
+
+    def capture_events(events: list[DomainEvent]):
+        nonlocal published_events
+        published_events = events
+
+    when(repository).save_many(...).thenAnswer(fail_second_order)
+    when(publisher).publish_events(...).thenAnswer(capture_events)
+
+    results = use_case.execute([build_dto(), build_dto(), build_dto()])
+
+    assert [result.created for result in results] == [True, False, True]
+    assert results[1].error == "duplicate key"
+    assert published_events is not None
+    assert {event.order_id for event in published_events} == {
+        results[0].order.id,
+        results[2].order.id,
+    }
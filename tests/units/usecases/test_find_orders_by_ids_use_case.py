@@ -0,0 +1,26 @@
+from uuid import uuid4
+from mockito import mock, when, verify
+
+from application.use_cases import FindOrdersByIdsUseCase
+from application.repositories import OrderRepositoryInterface
+from domain.entities import Order
+
+
+def build_order() -> Order:
+    return Order(customer_id=uuid4(), shipping_address="Test Address", items=[])
+
+
+def test_should_return_orders_in_request_order_with_a_single_read():
+    repository = mock(OrderRepositoryInterface)
+    use_case = FindOrdersByIdsUseCase(repository)
+    first, second = build_order(), build_order()
+    missing_id = uuid4()
+
+    when(repository).find_many(...).thenReturn([first, second])
+
+    lookup = use_case.execute([second.id, missing_id, first.id, second.id])
+
+    assert lookup.items == [second, first]
+    assert lookup.missing_ids == [missing_id]
+    verify(repository, times=1).find_many([second.id, missing_id, first.id])
+    verify(repository, times=0).find_by_id(...)
@@ -0,0 +1,41 @@
+from uuid import uuid4
+from mockito import mock, when, verify
+
+from application.use_cases import ListOrdersUseCase
+from application.repositories import OrderRepositoryInterface
+from application.dtos import ListOrdersFilterDTO, OrdersPageDTO
+from domain.entities import Order
+from domain.enums import OrderStatus
+
+
+def test_should_return_page_from_repository():
+    repository = mock(OrderRepositoryInterface)
+    use_case = ListOrdersUseCase(repository)
+
+    filters = ListOrdersFilterDTO(customer_id=uuid4(), status=OrderStatus.CREATED)
+    order = Order(customer_id=filters.customer_id, shipping_address="Address", items=[])  # type: ignore
+    expected_page = OrdersPageDTO(items=[order], next_cursor="cursor")
+
+    when(repository).find_page(filters=filters, limit=10, cursor=None).thenReturn(
+        expected_page
+    )
+
+    result = use_case.execute(filters=filters, limit=10)
+
+    assert result == expected_page
+    verify(repository, times=1).find_page(filters=filters, limit=10, cursor=None)
+
+
+def test_should_forward_cursor_to_repository():
+    repository = mock(OrderRepositoryInterface)
+    use_case = ListOrdersUseCase(repository)
+
+    filters = ListOrdersFilterDTO()
+    when(repository).find_page(filters=filters, limit=5, cursor="abc").thenReturn(
+        OrdersPageDTO(items=[])
+    )
+
+    result = use_case.execute(filters=filters, limit=5, cursor="abc")
+
+    assert result.items == []
+    assert result.next_cursor is None
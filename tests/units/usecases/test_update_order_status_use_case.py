@@ -1,21 +1,35 @@
 from uuid import uuid4
+from decimal import Decimal
 import pytest
 from mockito import mock, when, verify
 
+from application.dtos import OrderSummaryDTO
 from application.use_cases import UpdateOrderStatusUseCase
 from application.repositories import OrderRepositoryInterface
 from application.adapters import PublisherAdapterInterface
 from domain.enums import OrderStatus
-from domain.entities import Order
+from domain.entities import Order, OrderItem
 from domain.events import DomainEvent
 from domain.exceptions import (
     OrderNotFoundError,
     InvalidStatusTransitionError,
     OrderAlreadyCancelledError,
     OrderAlreadyDeliveredError,
+    OrderStatusConflictError,
 )
 
 
+def summary_of(order: Order) -> OrderSummaryDTO:
+    return OrderSummaryDTO(
+        id=order.id,
+        customer_id=order.customer_id,
+        shipping_address=order.shipping_address,
+        status=order.status,
+        created_at=order.created_at,
+        updated_at=order.updated_at,
+    )
+
+
 def test_should_update_order_status_from_created_to_processing():
     repository = mock(OrderRepositoryInterface)
     publisher = mock(PublisherAdapterInterface)
@@ -30,10 +44,9 @@ def test_should_update_order_status_from_created_to_processing():
         status=OrderStatus.CREATED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.PROCESSING
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.PROCESSING)
@@ -41,7 +54,7 @@ def test_should_update_order_status_from_created_to_processing():
     assert order.status == OrderStatus.PROCESSING
 
 
-def test_should_call_repository_update_status():
+def test_should_call_repository_transition_status():
     repository = mock(OrderRepositoryInterface)
     publisher = mock(PublisherAdapterInterface)
     use_case = UpdateOrderStatusUseCase(repository, publisher)
@@ -55,15 +68,14 @@ def test_should_call_repository_update_status():
         status=OrderStatus.CREATED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.PROCESSING
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.PROCESSING)
 
-    verify(repository, times=1).update_status(
+    verify(repository, times=1).transition_status(
         order_id=order_id, new_status=OrderStatus.PROCESSING
     )
 
@@ -82,10 +94,9 @@ def test_should_call_publisher_publish_events():
         status=OrderStatus.CREATED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.PROCESSING
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.PROCESSING)
@@ -100,7 +111,8 @@ def test_should_raise_exception_when_order_not_found():
 
     order_id = uuid4()
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(None)
+    when(repository).transition_status(...).thenReturn(None)
+    when(repository).find_summary_by_id(order_id=order_id).thenReturn(None)
 
     with pytest.raises(OrderNotFoundError) as exc_info:
         use_case.execute(order_id, OrderStatus.PROCESSING)
@@ -122,10 +134,9 @@ def test_should_update_from_created_to_cancelled():
         status=OrderStatus.CREATED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.CANCELLED
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.CANCELLED)
@@ -147,10 +158,9 @@ def test_should_update_from_processing_to_shipped():
         status=OrderStatus.PROCESSING,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.SHIPPED
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.SHIPPED)
@@ -172,10 +182,9 @@ def test_should_update_from_processing_to_cancelled():
         status=OrderStatus.PROCESSING,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.CANCELLED
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.CANCELLED)
@@ -197,10 +206,9 @@ def test_should_update_from_shipped_to_delivered():
         status=OrderStatus.SHIPPED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.DELIVERED
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.DELIVERED)
@@ -222,7 +230,8 @@ def test_should_fail_invalid_transition_from_created_to_shipped():
         status=OrderStatus.CREATED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
+    when(repository).transition_status(...).thenReturn(None)
+    when(repository).find_summary_by_id(order_id=order_id).thenReturn(summary_of(order))
 
     with pytest.raises(InvalidStatusTransitionError):
         use_case.execute(order_id, OrderStatus.SHIPPED)
@@ -242,7 +251,8 @@ def test_should_fail_invalid_transition_from_created_to_delivered():
         status=OrderStatus.CREATED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
+    when(repository).transition_status(...).thenReturn(None)
+    when(repository).find_summary_by_id(order_id=order_id).thenReturn(summary_of(order))
 
     with pytest.raises(InvalidStatusTransitionError):
         use_case.execute(order_id, OrderStatus.DELIVERED)
@@ -262,7 +272,8 @@ def test_should_fail_to_update_cancelled_order():
         status=OrderStatus.CANCELLED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
+    when(repository).transition_status(...).thenReturn(None)
+    when(repository).find_summary_by_id(order_id=order_id).thenReturn(summary_of(order))
 
     with pytest.raises(OrderAlreadyCancelledError):
         use_case.execute(order_id, OrderStatus.PROCESSING)
@@ -282,7 +293,8 @@ def test_should_fail_to_update_delivered_order():
         status=OrderStatus.DELIVERED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
+    when(repository).transition_status(...).thenReturn(None)
+    when(repository).find_summary_by_id(order_id=order_id).thenReturn(summary_of(order))
 
     with pytest.raises(OrderAlreadyDeliveredError):
         use_case.execute(order_id, OrderStatus.CANCELLED)
@@ -308,10 +320,9 @@ def test_should_publish_status_changed_event():
         nonlocal published_events
         published_events = events
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.PROCESSING
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenAnswer(capture_events)
 
     use_case.execute(order_id, OrderStatus.PROCESSING)
@@ -340,10 +351,9 @@ def test_should_publish_delivered_event_when_status_is_delivered():
         nonlocal published_events
         published_events = events
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.DELIVERED
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenAnswer(capture_events)
 
     use_case.execute(order_id, OrderStatus.DELIVERED)
@@ -372,10 +382,9 @@ def test_should_publish_cancelled_event_when_status_is_cancelled():
         nonlocal published_events
         published_events = events
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.CANCELLED
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenAnswer(capture_events)
 
     use_case.execute(order_id, OrderStatus.CANCELLED)
@@ -384,7 +393,7 @@ def test_should_publish_cancelled_event_when_status_is_cancelled():
     assert len(published_events) == 2
 
 
-def test_should_call_find_by_id_before_update():
+def test_should_not_read_summary_when_transition_succeeds():
     repository = mock(OrderRepositoryInterface)
     publisher = mock(PublisherAdapterInterface)
     use_case = UpdateOrderStatusUseCase(repository, publisher)
@@ -398,28 +407,90 @@ def test_should_call_find_by_id_before_update():
         status=OrderStatus.CREATED,
     )
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(order)
-    when(repository).update_status(
+    when(repository).transition_status(
         order_id=order_id, new_status=OrderStatus.PROCESSING
-    ).thenReturn(True)
+    ).thenReturn(order)
     when(publisher).publish_events(...).thenReturn(None)
 
     use_case.execute(order_id, OrderStatus.PROCESSING)
 
-    verify(repository, times=1).find_by_id(order_id=order_id)
+    verify(repository, times=0).find_summary_by_id(...)
 
 
-def test_should_not_update_when_order_is_none():
+def test_should_not_publish_when_order_is_none():
     repository = mock(OrderRepositoryInterface)
     publisher = mock(PublisherAdapterInterface)
     use_case = UpdateOrderStatusUseCase(repository, publisher)
 
     order_id = uuid4()
 
-    when(repository).find_by_id(order_id=order_id).thenReturn(None)
+    when(repository).transition_status(...).thenReturn(None)
+    when(repository).find_summary_by_id(order_id=order_id).thenReturn(None)
 
     with pytest.raises(OrderNotFoundError):
         use_case.execute(order_id, OrderStatus.PROCESSING)
 
-    verify(repository, times=0).update_status(...)
     verify(publisher, times=0).publish_events(...)
+
+
+def test_should_raise_conflict_when_status_changed_concurrently():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = UpdateOrderStatusUseCase(repository, publisher)
+
+    order_id = uuid4()
+    order = Order(
+        id=order_id,
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[],
+        status=OrderStatus.CREATED,
+    )
+
+    when(repository).transition_status(...).thenReturn(None)
+    when(repository).find_summary_by_id(order_id=order_id).thenReturn(summary_of(order))
+
+    with pytest.raises(OrderStatusConflictError):
+        use_case.execute(order_id, OrderStatus.PROCESSING)
+
+    verify(publisher, times=0).publish_events(...)
+
+
+def test_should_publish_refund_amount_from_previous_order_items():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = UpdateOrderStatusUseCase(repository, publisher)
+
+    order_id = uuid4()
+    previous_order = Order(
+        id=order_id,
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name="Test Product",
+                quantity=2,
+                unit_price=Decimal("10.25"),
+            )
+        ],
+        status=OrderStatus.PROCESSING,
+    )
+
+    published_events = None
+
+    def capture_events(events: DomainEvent):
+        nonlocal published_events
+        published_events = events
+
+    when(repository).transition_status(
+        order_id=order_id, new_status=OrderStatus.CANCELLED
+    ).thenReturn(previous_order)
+    when(publisher).publish_events(...).thenAnswer(capture_events)
+
+    use_case.execute(order_id, OrderStatus.CANCELLED)
+
+    assert published_events is not None
+    status_changed, cancelled = published_events
+    assert status_changed.previous_status == OrderStatus.PROCESSING
+    assert cancelled.refund_amount == Decimal("20.50")
@@ -0,0 +1,99 @@
+from uuid import uuid4
+from decimal import Decimal
+from mockito import mock, when, verify
+
+from application.use_cases import UpdateOrdersStatusBatchUseCase
+from application.repositories import OrderRepositoryInterface
+from application.adapters import PublisherAdapterInterface
+from domain.entities import Order, OrderItem
+from domain.enums import OrderStatus
+from domain.events import DomainEvent, OrderStatusChangedEvent
+
+
+def build_order(status: OrderStatus = OrderStatus.PROCESSING) -> Order:
+    return Order(
+        customer_id=uuid4(),
+        shipping_address="Test Address",
+        items=[
+            OrderItem(
+                product_id=uuid4(),
+                product_name="Test Product",
+                quantity=1,
+                unit_price=Decimal("50.00"),
+            )
+        ],
+        status=status,
+    )
+
+
+def test_should_update_all_orders_with_a_single_write():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = UpdateOrdersStatusBatchUseCase(repository, publisher)
+    orders = [build_order(), build_order()]
+
+    published_events = None
+
+    def capture_events(events: list[DomainEvent]):
+        nonlocal published_events
+        published_events = events
+
+    when(repository).find_for_transition(...).thenReturn(orders)
+    when(repository).transition_status_many(...).thenReturn(
+        {order.id for order in orders}
+    )
+    when(publisher).publish_events(...).thenAnswer(capture_events)
+
+    results = use_case.execute([order.id for order in orders], OrderStatus.SHIPPED)
+
+    assert all(result.updated for result in results)
+    verify(repository, times=1).transition_status_many(orders, OrderStatus.SHIPPED)
+    verify(repository, times=0).transition_status(...)
+    verify(publisher, times=1).publish_events(...)
+    assert published_events is not None
+    assert all(
+        isinstance(event, OrderStatusChangedEvent)
+        and event.previous_status == OrderStatus.PROCESSING
+        for event in published_events
+    )
+
+
+def test_should_report_outcome_of_each_order():
+    repository = mock(OrderRepositoryInterface)
+    publisher = mock(PublisherAdapterInterface)
+    use_case = UpdateOrdersStatusBatchUseCase(repository, publisher)
+    shipped = build_order()
+    conflicted = build_order()
+    delivered = build_order(OrderStatus.DELIVERED)
+    missing_id = uuid4()
+
+    published_events = None
+
+    def capture_events(events: list[DomainEvent]):
+        nonlocal published_events
+        published_events = events
+
+    when(repository).find_for_transition(...).thenReturn(
+        [shipped, conflicted, delivered]
+    )
+    when(repository).transition_status_many(
+        [shipped, conflicted], OrderStatus.SHIPPED
+    ).thenReturn({shipped.id})
+    when(publisher).publish_events(...).thenAnswer(capture_events)
+
+    results = use_case.execute(
+        [missing_id, shipped.id, conflicted.id, delivered.id], OrderStatus.SHIPPED
+    )
+
+    assert [result.order_id for result in results] == [
+        missing_id,
+        shipped.id,
+        conflicted.id,
+        delivered.id,
+    ]
+    assert [result.updated for result in results] == [False, True, False, False]
+    assert results[0].error == f"Order {missing_id} not found"
+    assert results[2].error is not None and "concurrently" in results[2].error
+    assert results[3].error == f"Order {delivered.id} is already delivered"
+    assert published_events is not None
+    assert {event.order_id for event in published_events} == {shipped.id}
@@ -0,0 +1,291 @@
+from uuid import uuid4
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pytest
+from pika import BasicProperties
+
+from domain.events import OrderDeliveredEvent
+from infra.serializers import JsonSerializer, MsgpackSerializer, Serializer
+from infra.workers import (
+    ConsumerMetrics,
+    DeliveryTracker,
+    EventDeduplicator,
+    InMemoryProcessedEventStore,
+    EventConsumer,
+    EventHandlerRegistry,
+    create_order_event_handlers,
+)
+
+
+class FakeMethod:
+    def __init__(self, delivery_tag: int, routing_key: str, redelivered: bool):
+        self.delivery_tag = delivery_tag
+        self.routing_key = routing_key
+        self.redelivered = redelivered
+
+
+class FakeChannel:
+    def __init__(
+        self,
+        deliveries: List[Tuple[str, Dict[str, Any], bool]],
+        serializer: Serializer,
+    ):
+        self.deliveries = deliveries
+        self.serializer = serializer
+        self.bindings: List[str] = []
+        self.prefetch_count = 0
+        self.acks: List[Tuple[int, bool]] = []
+        self.nacks: List[Tuple[int, bool]] = []
+        self.callback: Any = None
+
+    def exchange_declare(self, **kwargs: Any):
+        pass
+
+    def queue_declare(self, **kwargs: Any):
+        pass
+
+    def queue_bind(self, exchange: str, queue: str, routing_key: str):
+        self.bindings.append(routing_key)
+
+    def basic_qos(self, prefetch_count: int):
+        self.prefetch_count = prefetch_count
+
+    def basic_consume(self, queue: str, on_message_callback: Any):
+        self.callback = on_message_callback
+
+    def start_consuming(self):
+        for tag, (routing_key, event, redelivered) in enumerate(self.deliveries, 1):
+            method = FakeMethod(tag, routing_key, redelivered)
+            properties = BasicProperties(content_type=self.serializer.content_type)
+            self.callback(self, method, properties, self.serializer.dumps(event))
+
+    def stop_consuming(self):
+        pass
+
+    def basic_ack(self, delivery_tag: int, multiple: bool = False):
+        self.acks.append((delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag: int, requeue: bool):
+        self.nacks.append((delivery_tag, requeue))
+
+
+class FakeConnection:
+    def __init__(self, channel: FakeChannel):
+        self.fake_channel = channel
+        self.callbacks: List[Callable[[], None]] = []
+        self.is_open = True
+
+    def channel(self):
+        return self.fake_channel
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        return object()
+
+    def remove_timeout(self, timer: object):
+        pass
+
+    def add_callback_threadsafe(self, callback: Callable[[], None]):
+        self.callbacks.append(callback)
+
+    def process_data_events(self, time_limit: float):
+        for callback in self.callbacks:
+            callback()
+        self.callbacks = []
+
+    def close(self):
+        self.is_open = False
+
+
+def run_consumer(
+    registry: EventHandlerRegistry,
+    deliveries: List[Tuple[str, Dict[str, Any], bool]],
+    deduplicator: Optional[EventDeduplicator] = None,
+    serializer: Serializer = JsonSerializer(),
+) -> FakeChannel:
+    channel = FakeChannel(deliveries, serializer)
+    consumer = EventConsumer(
+        registry=registry,
+        prefetch_count=50,
+        workers=4,
+        connection_factory=lambda: FakeConnection(channel),  # type: ignore
+        deduplicator=deduplicator,
+    )
+    consumer.run()
+    return channel
+
+
+def test_should_dispatch_deliveries_to_registered_handlers_and_ack():
+    received: List[str] = []
+    registry = EventHandlerRegistry()
+    registry.register("order.created", lambda event: received.append(event["id"]))
+
+    channel = run_consumer(
+        registry, [("order.created", {"id": str(index)}, False) for index in range(20)]
+    )
+
+    assert sorted(received, key=int) == [str(index) for index in range(20)]
+    assert channel.acks[-1] == (20, True)
+    assert channel.nacks == []
+    assert channel.prefetch_count == 50
+    assert channel.bindings == ["order.created"]
+
+
+def test_should_requeue_first_failure_and_drop_redelivered_failure():
+    registry = EventHandlerRegistry()
+
+    @registry.handles("order.cancelled")
+    def fail(event: Dict[str, Any]) -> None:
+        raise RuntimeError("boom")
+
+    channel = run_consumer(
+        registry,
+        [("order.cancelled", {}, False), ("order.cancelled", {}, True)],
+    )
+
+    assert sorted(channel.nacks) == [(1, True), (2, False)]
+    assert channel.acks == []
+
+
+def test_should_process_micro_batches_and_ack_them_cumulatively():
+    batches: List[int] = []
+    registry = EventHandlerRegistry()
+    registry.register_batch(
+        "order.changedStatus", lambda events: batches.append(len(events)), max_size=3
+    )
+
+    channel = run_consumer(
+        registry, [("order.changedStatus", {}, False) for _ in range(7)]
+    )
+
+    assert sorted(batches) == [1, 3, 3]
+    assert channel.acks[-1] == (7, True)
+    assert len(channel.acks) <= 3
+    assert channel.nacks == []
+
+
+def test_should_nack_every_message_of_a_failed_batch():
+    registry = EventHandlerRegistry()
+
+    @registry.handles_batch("order.created", max_size=2)
+    def fail(events: List[Dict[str, Any]]) -> None:
+        raise RuntimeError("boom")
+
+    channel = run_consumer(
+        registry,
+        [("order.created", {}, False), ("order.created", {}, True)],
+    )
+
+    assert channel.nacks == [(1, True), (2, False)]
+    assert channel.acks == []
+
+
+def test_should_ack_duplicated_events_without_handling_them_again():
+    handled: List[str] = []
+    registry = EventHandlerRegistry()
+    registry.register_batch(
+        "order.created",
+        lambda events: handled.extend(event["event_id"] for event in events),
+        max_size=10,
+    )
+    deduplicator = EventDeduplicator(
+        store=InMemoryProcessedEventStore(max_size=100, ttl_seconds=60),
+        bloom_capacity=100,
+        bloom_error_rate=0.01,
+    )
+    deduplicator.mark_processed(["already-processed"])
+
+    channel = run_consumer(
+        registry,
+        [
+            ("order.created", {"event_id": "already-processed"}, True),
+            ("order.created", {"event_id": "new"}, False),
+            ("order.created", {"event_id": "new"}, False),
+        ],
+        deduplicator=deduplicator,
+    )
+
+    assert handled == ["new"]
+    assert channel.acks[-1] == (3, True)
+    assert deduplicator.find_duplicates([("new", False)]) == {"new"}
+
+
+def test_should_decode_deliveries_by_content_type():
+    received: List[Dict[str, Any]] = []
+    registry = EventHandlerRegistry()
+    registry.register("order.created", received.append)
+    event = {"event_id": uuid4(), "payload": {"total": "31.50"}}
+
+    channel = run_consumer(
+        registry, [("order.created", event, False)], serializer=MsgpackSerializer()
+    )
+
+    assert received == [
+        {"event_id": str(event["event_id"]), "payload": {"total": "31.50"}}
+    ]
+    assert channel.acks[-1] == (1, True)
+
+
+def test_should_only_ack_the_settled_prefix():
+    tracker = DeliveryTracker()
+    for delivery_tag in range(1, 6):
+        tracker.track(delivery_tag)
+
+    tracker.settle([2, 3], succeeded=True)
+    assert tracker.pop_acknowledgeable() is None
+
+    tracker.settle([1], succeeded=True)
+    tracker.settle([4], succeeded=False)
+    assert tracker.pop_acknowledgeable() == 3
+
+    tracker.settle([5], succeeded=True)
+    assert tracker.pop_acknowledgeable() == 5
+    assert len(tracker) == 0
+
+
+def test_should_not_register_two_handlers_for_the_same_routing_key():
+    registry = EventHandlerRegistry()
+    registry.register("order.created", print)
+
+    with pytest.raises(ValueError):
+        registry.register("order.created", print)
+    with pytest.raises(ValueError):
+        registry.register_batch("order.created", print)
+
+
+def test_should_register_handlers_for_every_order_event():
+    registry = create_order_event_handlers()
+
+    assert set(registry.routing_keys) == {
+        "order.created",
+        "order.changedStatus",
+        "order.cancelled",
+        OrderDeliveredEvent.event_name,
+    }
+
+
+def test_should_log_handled_order_events(caplog: pytest.LogCaptureFixture):
+    order_id = str(uuid4())
+    handler = create_order_event_handlers().get("order.created")
+    assert handler is not None
+
+    with caplog.at_level("INFO", logger="infra.workers.order_event_handlers"):
+        handler({"event_name": "order.created", "payload": {"order_id": order_id}})
+
+    assert caplog.messages == [f"order.created: pedido {order_id}"]
+
+
+def test_should_report_throughput_since_last_snapshot():
+    now = [0.0]
+    metrics = ConsumerMetrics(clock=lambda: now[0])
+    for _ in range(30):
+        metrics.record("order.created", succeeded=True)
+    metrics.record("order.created", succeeded=False)
+    now[0] = 2.0
+
+    snapshot = metrics.snapshot()
+    now[0] = 3.0
+
+    assert snapshot["processed"] == 30
+    assert snapshot["failed"] == 1
+    assert snapshot["processed.order.created"] == 30
+    assert snapshot["messages_per_s"] == 15.5
+    assert metrics.snapshot()["messages_per_s"] == 0
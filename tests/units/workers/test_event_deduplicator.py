@@ -0,0 +1,136 @@
+from typing import Any, Dict, List
+from uuid import uuid4
+import pytest
+from mockito import mock
+from pymongo.errors import BulkWriteError
+
+from infra.adapters import NoSqlAdapter
+from infra.workers import (
+    BloomFilter,
+    EventDeduplicator,
+    InMemoryProcessedEventStore,
+    MongoProcessedEventStore,
+)
+
+
+def build_deduplicator(bloom_capacity: int = 1000) -> EventDeduplicator:
+    return EventDeduplicator(
+        store=InMemoryProcessedEventStore(max_size=1000, ttl_seconds=60),
+        bloom_capacity=bloom_capacity,
+        bloom_error_rate=0.01,
+    )
+
+
+def test_bloom_filter_should_never_miss_added_keys():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [str(uuid4()) for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(str(uuid4()) in bloom for _ in range(10000))
+    assert false_positives < 300
+    assert bloom.is_full
+
+
+def test_should_skip_store_lookup_for_unseen_first_deliveries():
+    deduplicator = build_deduplicator()
+
+    duplicates = deduplicator.find_duplicates([(str(uuid4()), False)])
+
+    assert duplicates == set()
+    assert deduplicator.store_lookups == 0
+
+
+def test_should_find_processed_events():
+    deduplicator = build_deduplicator()
+    event_id = str(uuid4())
+    deduplicator.mark_processed([event_id])
+
+    assert deduplicator.find_duplicates([(event_id, False)]) == {event_id}
+    assert deduplicator.store_lookups == 1
+
+
+def test_should_always_check_store_for_redeliveries():
+    deduplicator = build_deduplicator()
+    event_id = str(uuid4())
+    deduplicator.store.mark_processed([event_id])
+
+    assert deduplicator.find_duplicates([(event_id, False)]) == set()
+    assert deduplicator.find_duplicates([(event_id, True)]) == {event_id}
+
+
+def test_should_keep_previous_bloom_generation_after_rotation():
+    deduplicator = build_deduplicator(bloom_capacity=2)
+    event_ids = [str(uuid4()) for _ in range(4)]
+    deduplicator.mark_processed(event_ids)
+
+    assert deduplicator.find_duplicates([(event_ids[2], False)]) == {event_ids[2]}
+
+
+class FakeProcessedEventsCollection:
+    def __init__(self) -> None:
+        self.documents: Dict[str, Dict[str, Any]] = {}
+
+    def insert_many(self, documents: List[Dict[str, Any]], ordered: bool):
+        errors = []
+        for index, document in enumerate(documents):
+            if document["_id"] in self.documents:
+                errors.append({"index": index, "code": 11000})
+                continue
+            self.documents[document["_id"]] = document
+        if errors:
+            raise BulkWriteError({"writeErrors": errors})
+
+    def find(self, query: Dict[str, Any], projection: Dict[str, Any]):
+        return [
+            {"_id": event_id}
+            for event_id in query["_id"]["$in"]
+            if event_id in self.documents
+        ]
+
+
+def build_mongo_store(collection: FakeProcessedEventsCollection):
+    adapter = mock(NoSqlAdapter)
+    adapter.database = {"processed_events": collection}
+    return MongoProcessedEventStore(adapter=adapter, ttl_seconds=60)
+
+
+def test_mongo_store_should_ignore_ids_already_marked():
+    collection = FakeProcessedEventsCollection()
+    store = build_mongo_store(collection)
+    store.mark_processed(["a"])
+
+    store.mark_processed(["a", "b"])
+
+    assert store.find_processed(["a", "b", "c"]) == {"a", "b"}
+
+
+def test_mongo_store_should_raise_other_write_errors():
+    collection = FakeProcessedEventsCollection()
+
+    def fail(documents: List[Dict[str, Any]], ordered: bool):
+        raise BulkWriteError({"writeErrors": [{"index": 0, "code": 121}]})
+
+    collection.insert_many = fail  # type: ignore
+    store = build_mongo_store(collection)
+
+    with pytest.raises(BulkWriteError):
+        store.mark_processed(["a"])
+
+
+def test_should_check_shared_store_for_first_deliveries():
+    collection = FakeProcessedEventsCollection()
+    deduplicator = EventDeduplicator(
+        store=build_mongo_store(collection), bloom_capacity=1000, bloom_error_rate=0.01
+    )
+    other_consumer = build_mongo_store(collection)
+    event_id = str(uuid4())
+    other_consumer.mark_processed([event_id])
+
+    duplicates = deduplicator.find_duplicates(
+        [(event_id, False), (str(uuid4()), False)]
+    )
+
+    assert duplicates == {event_id}
+    assert deduplicator.store_lookups == 1
@@ -0,0 +1,215 @@
+from threading import Event
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from mockito import mock
+
+from infra.adapters import NoSqlAdapter, OutgoingMessage
+from infra.workers import OutboxRelay
+
+
+def matches(entry: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(matches(entry, option) for option in condition):
+                return False
+            continue
+        value = entry.get(field)
+        if isinstance(condition, dict):
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+            if "$lte" in condition and (value is None or value > condition["$lte"]):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+
+    def sort(self, *args: Any):
+        return self
+
+    def limit(self, limit: int):
+        return iter(self.entries[:limit])
+
+    def __iter__(self):
+        return iter(self.entries)
+
+
+class FakeOutboxCollection:
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+
+    def find(self, query: Dict[str, Any], projection: Any = None):
+        return FakeCursor([entry for entry in self.entries if matches(entry, query)])
+
+    def update_many(self, query: Dict[str, Any], update: Dict[str, Any]):
+        for entry in self.entries:
+            if matches(entry, query):
+                entry.update(update["$set"])
+                for field, amount in update.get("$inc", {}).items():
+                    entry[field] = entry.get(field, 0) + amount
+
+
+def build_entry(entry_id: int) -> Dict[str, Any]:
+    return {
+        "_id": entry_id,
+        "eventId": f"event-{entry_id}",
+        "eventName": "order.created",
+        "exchange": "orders",
+        "contentType": "application/json",
+        "body": "{}",
+        "publishedAt": None,
+    }
+
+
+class FakeConfirmPublisher:
+    def __init__(self, rejected: Optional[List[str]] = None):
+        self.rejected = rejected or []
+        self.published: List[OutgoingMessage] = []
+
+    def publish(self, exchange: str, messages: List[OutgoingMessage]) -> List[bool]:
+        self.published.extend(messages)
+        return [message.message_id not in self.rejected for message in messages]
+
+
+def build_relay(
+    collection: FakeOutboxCollection,
+    publisher: FakeConfirmPublisher,
+    batch_size: int = 10,
+):
+    adapter = mock(NoSqlAdapter)
+    adapter.database = {"outbox": collection}
+    return OutboxRelay(
+        adapter=adapter,
+        publisher=publisher,  # type: ignore
+        batch_size=batch_size,
+    )
+
+
+def test_should_publish_pending_entries_and_mark_them_as_published():
+    collection = FakeOutboxCollection([build_entry(1), build_entry(2)])
+    publisher = FakeConfirmPublisher()
+    relay = build_relay(collection, publisher)
+
+    relayed = relay.relay_batch()
+
+    assert relayed == 2
+    assert all(entry["publishedAt"] is not None for entry in collection.entries)
+    assert [message.message_id for message in publisher.published] == [
+        "event-1",
+        "event-2",
+    ]
+
+
+def test_should_respect_batch_size():
+    collection = FakeOutboxCollection([build_entry(1), build_entry(2), build_entry(3)])
+    relay = build_relay(collection, FakeConfirmPublisher(), batch_size=2)
+
+    assert relay.relay_batch() == 2
+    assert collection.entries[2]["publishedAt"] is None
+    assert relay.relay_batch() == 1
+
+
+def test_should_return_zero_when_outbox_is_empty():
+    publisher = FakeConfirmPublisher()
+    relay = build_relay(FakeOutboxCollection([]), publisher)
+
+    assert relay.relay_batch() == 0
+    assert publisher.published == []
+
+
+def test_should_keep_unconfirmed_entries_pending():
+    collection = FakeOutboxCollection([build_entry(1), build_entry(2), build_entry(3)])
+    relay = build_relay(collection, FakeConfirmPublisher(rejected=["event-2"]))
+
+    assert relay.relay_batch() == 2
+    assert [entry["publishedAt"] is None for entry in collection.entries] == [
+        False,
+        True,
+        False,
+    ]
+
+
+class FlakyConfirmPublisher(FakeConfirmPublisher):
+    def __init__(self, failures: int, stop_event: Event):
+        super().__init__()
+        self.failures = failures
+        self.stop_event = stop_event
+
+    def publish(self, exchange: str, messages: List[OutgoingMessage]) -> List[bool]:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("channel closed")
+        confirmed = super().publish(exchange, messages)
+        self.stop_event.set()
+        return confirmed
+
+
+def test_should_keep_running_after_a_failed_batch():
+    stop_event = Event()
+    collection = FakeOutboxCollection([build_entry(1)])
+    publisher = FlakyConfirmPublisher(failures=2, stop_event=stop_event)
+    relay = build_relay(collection, publisher)
+    relay.poll_interval_ms = 1
+    relay.lease_ms = 0
+
+    relay.run(stop_event)
+
+    assert publisher.failures == 0
+    assert collection.entries[0]["publishedAt"] is not None
+
+
+def test_should_double_backoff_up_to_the_limit():
+    relay = build_relay(FakeOutboxCollection([]), FakeConfirmPublisher())
+    relay.poll_interval_ms = 500
+    relay.max_backoff_ms = 3000
+
+    assert [relay.backoff_ms(failures) for failures in range(1, 6)] == [
+        500,
+        1000,
+        2000,
+        3000,
+        3000,
+    ]
+
+
+def test_should_not_publish_entries_leased_by_another_relay():
+    collection = FakeOutboxCollection([build_entry(1), build_entry(2)])
+    collection.entries[0]["leaseUntil"] = datetime.now(timezone.utc) + timedelta(
+        minutes=1
+    )
+    publisher = FakeConfirmPublisher()
+
+    assert build_relay(collection, publisher).relay_batch() == 1
+    assert [message.message_id for message in publisher.published] == ["event-2"]
+
+
+def test_should_retry_unconfirmed_entries_only_after_the_lease_expires():
+    collection = FakeOutboxCollection([build_entry(1), build_entry(2)])
+    publisher = FakeConfirmPublisher(rejected=["event-1"])
+    relay = build_relay(collection, publisher)
+
+    assert relay.relay_batch() == 1
+    assert relay.relay_batch() == 0
+
+    collection.entries[0]["leaseUntil"] = datetime.now(timezone.utc)
+    publisher.rejected = []
+    assert relay.relay_batch() == 1
+    assert collection.entries[0]["attempts"] == 2
+
+
+def test_should_dead_letter_entries_after_max_attempts():
+    collection = FakeOutboxCollection([build_entry(1)])
+    relay = build_relay(collection, FakeConfirmPublisher(rejected=["event-1"]))
+    relay.max_attempts = 2
+    relay.lease_ms = 0
+
+    relay.relay_batch()
+    assert collection.entries[0].get("deadLetteredAt") is None
+    relay.relay_batch()
+
+    assert collection.entries[0]["deadLetteredAt"] is not None
+    assert relay.relay_batch() == 0